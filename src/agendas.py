@@ -0,0 +1,109 @@
+import threading
+from bisect import bisect_left, insort
+from datetime import date
+from typing import Callable
+from src.eventos import CanalEventos, PoliticaDesborde, Suscripcion, TipoEvento
+from src.turno import Turno
+from src.vistas import VistaClinica
+
+TIPOS_AGENDA = (TipoEvento.TURNO_AGENDADO, TipoEvento.TURNO_CANCELADO, TipoEvento.SERIE_AGENDADA)
+
+
+class AgendasDiarias:
+    # Agendas materializadas por (día, médico), ordenadas por hora. Se mantienen consumiendo
+    # los eventos de la clínica; si la suscripción perdió eventos se reconstruyen desde cero.
+    # La suscripción se abre con la primera consulta, así las cargas masivas previas no la llenan.
+    def __init__(self, eventos: CanalEventos, abrir_vista: Callable[[], VistaClinica], capacidad: int = 100_000):
+        self.__eventos = eventos
+        self.__abrir_vista = abrir_vista
+        self.__capacidad = capacidad
+        self.__suscripcion: Suscripcion | None = None
+        self.__por_dia: dict[date, dict[str, list[Turno]]] = {}
+        self.__cerrojo = threading.Lock()
+        self.__descartados = 0
+        self.__reconstruir = True
+
+    def obtener_agenda(self, matricula: str, dia: date) -> list[Turno]:
+        with self.__cerrojo:
+            self.__sincronizar()
+            return list(self.__por_dia.get(dia, {}).get(matricula, ()))
+
+    def obtener_agendas_del_dia(self, dia: date) -> dict[str, list[Turno]]:
+        with self.__cerrojo:
+            self.__sincronizar()
+            return {matricula: list(turnos) for matricula, turnos in sorted(self.__por_dia.get(dia, {}).items())}
+
+    def descartar_anteriores(self, dia: date):
+        with self.__cerrojo:
+            for viejo in [d for d in self.__por_dia if d < dia]:
+                del self.__por_dia[viejo]
+
+    def invalidar(self):
+        with self.__cerrojo:
+            self.__reconstruir = True
+
+    def __getstate__(self):
+        # La suscripción y el cerrojo son locales al proceso: al restaurar se reconstruye.
+        estado = self.__dict__.copy()
+        estado["_AgendasDiarias__suscripcion"] = None
+        estado["_AgendasDiarias__por_dia"] = {}
+        del estado["_AgendasDiarias__cerrojo"]
+        return estado
+
+    def __setstate__(self, estado):
+        self.__dict__.update(estado)
+        self.__cerrojo = threading.Lock()
+
+    def __sincronizar(self):
+        if self.__suscripcion is None:
+            self.__suscripcion = self.__eventos.suscribir(self.__capacidad, PoliticaDesborde.DESCARTAR_NUEVOS,
+                                                          list(TIPOS_AGENDA))
+            self.__descartados = 0
+            self.__reconstruir = True
+        eventos = self.__suscripcion.obtener_pendientes()
+        descartados = self.__suscripcion.obtener_descartados()
+        if descartados != self.__descartados:
+            self.__descartados = descartados
+            self.__reconstruir = True
+        if self.__reconstruir:
+            self.__reconstruir = False
+            self.__por_dia = {}
+            # Los eventos que lleguen durante la reconstrucción se vuelven a aplicar: las
+            # operaciones son idempotentes porque un médico tiene un solo turno por horario.
+            for turno in self.__abrir_vista().obtener_turnos(incluir_archivados=False):
+                self.__agregar(turno)
+            return
+        for evento in eventos:
+            tipo = evento.obtener_tipo()
+            if tipo is TipoEvento.TURNO_AGENDADO:
+                self.__agregar(evento.obtener_entidad())
+            elif tipo is TipoEvento.TURNO_CANCELADO:
+                self.__quitar(evento.obtener_entidad())
+            elif tipo is TipoEvento.SERIE_AGENDADA:
+                for turno in evento.obtener_entidad().ocurrencias():
+                    self.__agregar(turno)
+
+    def __agregar(self, turno: Turno):
+        fecha_hora = turno.obtener_fecha_hora()
+        agenda = self.__por_dia.setdefault(fecha_hora.date(), {}).setdefault(
+            turno.obtener_medico().obtener_matricula(), [])
+        posicion = bisect_left(agenda, fecha_hora, key=Turno.obtener_fecha_hora)
+        if posicion < len(agenda) and agenda[posicion].obtener_fecha_hora() == fecha_hora:
+            agenda[posicion] = turno
+        else:
+            insort(agenda, turno, key=Turno.obtener_fecha_hora)
+
+    def __quitar(self, turno: Turno):
+        fecha_hora = turno.obtener_fecha_hora()
+        dia = fecha_hora.date()
+        matricula = turno.obtener_medico().obtener_matricula()
+        agenda = self.__por_dia.get(dia, {}).get(matricula)
+        if not agenda:
+            return
+        posicion = bisect_left(agenda, fecha_hora, key=Turno.obtener_fecha_hora)
+        if posicion < len(agenda) and agenda[posicion].obtener_fecha_hora() == fecha_hora:
+            del agenda[posicion]
+            if not agenda:
+                del self.__por_dia[dia][matricula]
+                if not self.__por_dia[dia]:
+                    del self.__por_dia[dia]
@@ -0,0 +1,75 @@
+from datetime import date
+from src.turno import Turno
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class AnaliticaTurnos:
+    def __init__(self, turnos: list[Turno]):
+        if np is None:
+            raise ImportError("La analítica de ocupación requiere numpy")
+        codigos_medico: dict[str, int] = {}
+        codigos_especialidad: dict[str, int] = {}
+        fechas = [t.obtener_fecha_hora() for t in turnos]
+        dias = [f.toordinal() for f in fechas]
+        horas = [f.hour for f in fechas]
+        medicos = [codigos_medico.setdefault(t.obtener_medico().obtener_matricula(), len(codigos_medico))
+                   for t in turnos]
+        especialidades = [codigos_especialidad.setdefault(t.obtener_especialidad(), len(codigos_especialidad))
+                          for t in turnos]
+        self.__matriculas = list(codigos_medico)
+        self.__especialidades = list(codigos_especialidad)
+
+        self.__medicos = np.array(medicos, dtype=np.int64)
+        self.__codigos_especialidad = np.array(especialidades, dtype=np.int64)
+        dias = np.array(dias, dtype=np.int64)
+        # El ordinal 1 (01/01/0001) fue lunes, así que el lunes queda como día 0.
+        self.__dia_semana = (dias - 1) % 7
+        self.__hora = np.array(horas, dtype=np.int64)
+        self.__semana = (dias - 1) // 7
+
+    def obtener_matriculas(self) -> list[str]:
+        return list(self.__matriculas)
+
+    def obtener_especialidades(self) -> list[str]:
+        return list(self.__especialidades)
+
+    def total_por_medico(self) -> dict[str, int]:
+        conteo = np.bincount(self.__medicos, minlength=len(self.__matriculas))
+        return dict(zip(self.__matriculas, conteo.tolist()))
+
+    def total_por_especialidad(self) -> dict[str, int]:
+        conteo = np.bincount(self.__codigos_especialidad, minlength=len(self.__especialidades))
+        return dict(zip(self.__especialidades, conteo.tolist()))
+
+    def matriz_medicos(self):
+        return self.__matriz(self.__medicos, len(self.__matriculas))
+
+    def matriz_especialidades(self):
+        return self.__matriz(self.__codigos_especialidad, len(self.__especialidades))
+
+    def mapa_de_calor(self):
+        conteo = np.bincount(self.__dia_semana * 24 + self.__hora, minlength=7 * 24)
+        return conteo.reshape(7, 24)
+
+    def tendencia_semanal(self) -> list[tuple[date, int]]:
+        if self.__semana.size == 0:
+            return []
+        primera = int(self.__semana.min())
+        conteo = np.bincount(self.__semana - primera)
+        return [(date.fromordinal((primera + i) * 7 + 1), total) for i, total in enumerate(conteo.tolist())]
+
+    def utilizacion_medicos(self, turnos_por_hora: int = 1):
+        # Fracción de franjas ocupadas por (médico, día, hora) sobre las semanas observadas.
+        if self.__semana.size == 0:
+            return self.matriz_medicos().astype(float)
+        semanas = int(self.__semana.max() - self.__semana.min()) + 1
+        return self.matriz_medicos() / (semanas * turnos_por_hora)
+
+    def __matriz(self, codigos, cantidad: int):
+        celdas = codigos * (7 * 24) + self.__dia_semana * 24 + self.__hora
+        conteo = np.bincount(celdas, minlength=cantidad * 7 * 24)
+        return conteo.reshape(cantidad, 7, 24)
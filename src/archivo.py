@@ -0,0 +1,204 @@
+import os
+import pickle
+import struct
+import zlib
+from datetime import datetime
+from src.paciente import Paciente
+from src.medico import Medico
+from src.turno import Turno
+from src.receta import Receta
+
+MAGICO = b"ARCH"
+EXTENSION = ".arch"
+CUBETAS = 64
+# Formato 1: recetas (dni, matrícula, medicamentos, fecha, versión). Formato 2 agrega el id.
+FORMATO = 2
+
+
+def _cubeta(dni: str) -> int:
+    return zlib.crc32(dni.encode()) % CUBETAS
+
+
+class SegmentoArchivo:
+    def __init__(self, ruta: str, encabezado: dict, inicio_datos: int):
+        self.ruta = ruta
+        self.version: int = encabezado["version"]
+        self.formato: int = encabezado.get("formato", 1)
+        self.horizonte: datetime = encabezado["horizonte"]
+        self.desde: datetime = encabezado["desde"]
+        self.hasta: datetime = encabezado["hasta"]
+        self.cubetas: dict[int, tuple[int, int]] = encabezado["cubetas"]
+        self.cantidad: int = encabezado["cantidad"]
+        # Rango de ids de las recetas del segmento; (0, 0) si no tiene o son de antes de los ids.
+        self.ids_recetas: tuple[int, int] = encabezado.get("ids_recetas", (0, 0))
+        self.inicio_datos = inicio_datos
+
+    def se_superpone(self, desde: datetime | None, hasta: datetime | None) -> bool:
+        return (desde is None or self.hasta >= desde) and (hasta is None or self.desde < hasta)
+
+
+class ArchivoHistorico:
+    # Turnos y recetas que salieron de la memoria, en segmentos inmutables en disco. Cada
+    # segmento agrupa sus registros por cubeta de DNI y comprime cada cubeta por separado:
+    # cargar la historia de un paciente descomprime sólo su cubeta en cada segmento.
+    def __init__(self, directorio: str, nivel_compresion: int = 6):
+        os.makedirs(directorio, exist_ok=True)
+        self.__directorio = directorio
+        self.__nivel = nivel_compresion
+        self.__segmentos: list[SegmentoArchivo] = [
+            self.__leer_encabezado(os.path.join(directorio, nombre))
+            for nombre in sorted(os.listdir(directorio)) if nombre.endswith(EXTENSION)
+        ]
+        # La versión de un segmento es la de la clínica que lo escribió. Los que ya estaban al
+        # abrir el directorio vienen de otro proceso: son visibles desde la versión 0.
+        for segmento in self.__segmentos:
+            segmento.version = 0
+
+    def archivar(self, version: int, horizonte: datetime, turnos: list[Turno], recetas: list[Receta]) -> int:
+        if not turnos and not recetas:
+            return 0
+        por_cubeta: dict[int, tuple[list, list]] = {}
+        fechas = []
+        for turno in turnos:
+            dni = turno.obtener_paciente().obtener_dni()
+            por_cubeta.setdefault(_cubeta(dni), ([], []))[0].append(
+                (dni, turno.obtener_medico().obtener_matricula(), turno.obtener_especialidad(),
+                 turno.obtener_fecha_hora()))
+            fechas.append(turno.obtener_fecha_hora())
+        for receta in recetas:
+            dni = receta.obtener_paciente().obtener_dni()
+            por_cubeta.setdefault(_cubeta(dni), ([], []))[1].append(
+                (dni, receta.obtener_medico().obtener_matricula(), tuple(receta.obtener_medicamentos()),
+                 receta.obtener_fecha(), receta.obtener_version(), receta.obtener_id()))
+            fechas.append(receta.obtener_fecha())
+
+        bloques = []
+        cubetas = {}
+        desplazamiento = 0
+        for numero, registros in sorted(por_cubeta.items()):
+            bloque = zlib.compress(pickle.dumps(registros, pickle.HIGHEST_PROTOCOL), self.__nivel)
+            cubetas[numero] = (desplazamiento, len(bloque))
+            desplazamiento += len(bloque)
+            bloques.append(bloque)
+        ids = [receta.obtener_id() for receta in recetas if receta.obtener_id() is not None]
+        encabezado = pickle.dumps({
+            "formato": FORMATO, "version": version, "horizonte": horizonte, "desde": min(fechas), "hasta": max(fechas),
+            "cubetas": cubetas, "cantidad": len(turnos) + len(recetas),
+            "ids_recetas": (min(ids), max(ids)) if ids else (0, 0),
+        }, pickle.HIGHEST_PROTOCOL)
+
+        ruta = os.path.join(self.__directorio, f"segmento-{len(self.__segmentos):06d}{EXTENSION}")
+        # Se escribe aparte y se renombra: un segmento a medio escribir nunca queda visible.
+        with open(ruta + ".tmp", "wb") as archivo:
+            archivo.write(MAGICO)
+            archivo.write(struct.pack("<I", len(encabezado)))
+            archivo.write(encabezado)
+            for bloque in bloques:
+                archivo.write(bloque)
+        os.replace(ruta + ".tmp", ruta)
+        self.__segmentos.append(self.__leer_encabezado(ruta))
+        return len(turnos) + len(recetas)
+
+    def obtener_horizonte(self) -> datetime | None:
+        return max((s.horizonte for s in self.__segmentos), default=None)
+
+    def cantidad_segmentos(self) -> int:
+        return len(self.__segmentos)
+
+    def cantidad_archivada(self) -> int:
+        return sum(s.cantidad for s in self.__segmentos)
+
+    def puede_tener_paciente(self, dni: str) -> bool:
+        # Por cubeta: puede dar falsos positivos, nunca falsos negativos.
+        cubeta = _cubeta(dni)
+        return any(cubeta in s.cubetas for s in self.__segmentos)
+
+    def obtener_ultimo_id_receta(self) -> int:
+        # Una clínica nueva sobre este archivo numera sus recetas a partir de acá.
+        return max((s.ids_recetas[1] for s in self.__segmentos), default=0)
+
+    def buscar_receta(self, id_receta: int, pacientes: dict[str, Paciente],
+                      medicos: dict[str, Medico]) -> Receta | None:
+        # Sin índice por id: se leen todas las cubetas de los segmentos cuyo rango lo incluye.
+        for segmento in self.__segmentos:
+            primero, ultimo = segmento.ids_recetas
+            if not primero <= id_receta <= ultimo:
+                continue
+            for cubeta in segmento.cubetas:
+                for registro in self.__leer_cubeta(segmento, cubeta)[1]:
+                    if registro[5] == id_receta and registro[0] in pacientes and registro[1] in medicos:
+                        return self.__receta(pacientes[registro[0]], medicos, registro, segmento.formato)
+        return None
+
+    def cargar_paciente(self, paciente: Paciente, medicos: dict[str, Medico],
+                        version: int = None) -> tuple[list[Turno], list[Receta]]:
+        dni = paciente.obtener_dni()
+        cubeta = _cubeta(dni)
+        turnos, recetas = [], []
+        for segmento in self.__visibles(version):
+            if cubeta not in segmento.cubetas:
+                continue
+            registros_turnos, registros_recetas = self.__leer_cubeta(segmento, cubeta)
+            # Lo de médicos que esta clínica todavía no registró (archivo reabierto) se omite.
+            turnos.extend(Turno(paciente, medicos[m], f, e) for d, m, e, f in registros_turnos
+                          if d == dni and m in medicos)
+            recetas.extend(self.__receta(paciente, medicos, r, segmento.formato)
+                           for r in registros_recetas if r[0] == dni and r[1] in medicos)
+        turnos.sort(key=Turno.obtener_fecha_hora)
+        recetas.sort(key=Receta.obtener_fecha)
+        return turnos, recetas
+
+    def buscar_turnos(self, pacientes: dict[str, Paciente], medicos: dict[str, Medico], dni: str = None,
+                      matricula: str = None, especialidad: str = None, desde: datetime = None,
+                      hasta: datetime = None, version: int = None) -> list[Turno]:
+        turnos = []
+        propia = None if dni is None else _cubeta(dni)
+        for segmento in self.__visibles(version):
+            if not segmento.se_superpone(desde, hasta):
+                continue
+            for cubeta in segmento.cubetas if propia is None else [propia]:
+                if cubeta not in segmento.cubetas:
+                    continue
+                for d, m, e, f in self.__leer_cubeta(segmento, cubeta)[0]:
+                    if ((dni is None or d == dni) and (matricula is None or m == matricula)
+                            and d in pacientes and m in medicos
+                            and (especialidad is None or e == especialidad)
+                            and (desde is None or f >= desde) and (hasta is None or f < hasta)):
+                        turnos.append(Turno(pacientes[d], medicos[m], f, e))
+        turnos.sort(key=Turno.obtener_fecha_hora)
+        return turnos
+
+    def __visibles(self, version: int | None) -> list[SegmentoArchivo]:
+        segmentos = list(self.__segmentos)
+        if version is None:
+            return segmentos
+        return [s for s in segmentos if s.version <= version]
+
+    @staticmethod
+    def __receta(paciente: Paciente, medicos: dict[str, Medico], registro: tuple, formato: int) -> Receta:
+        if formato < 2:
+            # Recetas archivadas antes de los ids: no están en ningún registro.
+            _, matricula, medicamentos, fecha, version = registro
+            id_receta = None
+        else:
+            _, matricula, medicamentos, fecha, version, id_receta = registro
+        receta = Receta(paciente, medicos[matricula], list(medicamentos), fecha)
+        receta.sellar(version)
+        receta.asignar_id(id_receta)
+        return receta
+
+    @staticmethod
+    def __leer_cubeta(segmento: SegmentoArchivo, cubeta: int) -> tuple[list, list]:
+        desplazamiento, largo = segmento.cubetas[cubeta]
+        with open(segmento.ruta, "rb") as archivo:
+            archivo.seek(segmento.inicio_datos + desplazamiento)
+            return pickle.loads(zlib.decompress(archivo.read(largo)))
+
+    @staticmethod
+    def __leer_encabezado(ruta: str) -> SegmentoArchivo:
+        with open(ruta, "rb") as archivo:
+            if archivo.read(4) != MAGICO:
+                raise ValueError(f"{ruta} no es un segmento de archivo")
+            (largo,) = struct.unpack("<I", archivo.read(4))
+            encabezado = pickle.loads(archivo.read(largo))
+        return SegmentoArchivo(ruta, encabezado, 8 + largo)
@@ -0,0 +1,101 @@
+from heapq import heapify, heappop, heappush
+from datetime import date, datetime, timedelta
+from typing import Callable
+from src.busqueda import normalizar
+from src.directorio import DirectorioMedicos
+
+
+class BalanceadorMedicos:
+    # Minutos agendados por médico en cada día y en cada semana. Para cada día y especialidad
+    # se arma (al primer pedido) un montículo con los médicos que la atienden ese día, ordenado
+    # por (minutos del día, minutos de la semana). Cada cambio de carga empuja una entrada
+    # nueva; las viejas se reconocen al sacarlas porque ya no coinciden con la carga actual.
+    def __init__(self, directorio: DirectorioMedicos):
+        self.__directorio = directorio
+        self.__minutos_dia: dict[tuple[str, date], int] = {}
+        self.__minutos_semana: dict[tuple[str, date], int] = {}
+        self.__monticulos: dict[date, dict[str, tuple[list, set[str]]]] = {}
+
+    def sumar(self, matricula: str, fecha_hora: datetime, minutos: int):
+        dia = fecha_hora.date()
+        lunes = dia - timedelta(days=dia.weekday())
+        for carga, clave in ((self.__minutos_dia, (matricula, dia)), (self.__minutos_semana, (matricula, lunes))):
+            total = carga.get(clave, 0) + minutos
+            if total:
+                carga[clave] = total
+            else:
+                carga.pop(clave, None)
+        if not self.__monticulos:
+            return
+        # La semana cambió para todos los días de esa semana en que el médico ya está en un montículo.
+        for desplazamiento in range(7):
+            otro_dia = lunes + timedelta(days=desplazamiento)
+            for monticulo, miembros in self.__monticulos.get(otro_dia, {}).values():
+                if matricula not in miembros:
+                    continue
+                heappush(monticulo, self.__entrada(matricula, otro_dia))
+                if len(monticulo) > 2 * len(miembros) + 16:
+                    # Demasiadas entradas viejas: se rearma con una por médico.
+                    monticulo[:] = [self.__entrada(m, otro_dia) for m in miembros]
+                    heapify(monticulo)
+
+    def sumar_varios(self, minutos_por_dia: dict[tuple[str, date], int]):
+        # Carga masiva ya agregada por (matrícula, día): los montículos se rearman al próximo pedido.
+        for (matricula, dia), minutos in minutos_por_dia.items():
+            lunes = dia - timedelta(days=dia.weekday())
+            for carga, clave in ((self.__minutos_dia, (matricula, dia)), (self.__minutos_semana, (matricula, lunes))):
+                total = carga.get(clave, 0) + minutos
+                if total:
+                    carga[clave] = total
+                else:
+                    carga.pop(clave, None)
+        self.__monticulos.clear()
+
+    def obtener_minutos(self, matricula: str, dia: date) -> int:
+        return self.__minutos_dia.get((matricula, dia), 0)
+
+    def elegir(self, dia: date, dia_semana: str, especialidad: str, acepta: Callable[[str], bool]) -> str | None:
+        # Devuelve el médico menos cargado que 'acepta' (por ejemplo, que tiene libre el horario).
+        monticulo = self.__monticulo(dia, dia_semana, especialidad)
+        apartadas = []
+        vistos = set()
+        elegido = None
+        while monticulo:
+            entrada = heappop(monticulo)
+            matricula = entrada[2]
+            if matricula in vistos or entrada != self.__entrada(matricula, dia):
+                continue
+            vistos.add(matricula)
+            apartadas.append(entrada)
+            if acepta(matricula):
+                elegido = matricula
+                break
+        for entrada in apartadas:
+            heappush(monticulo, entrada)
+        return elegido
+
+    def invalidar(self, medico=None):
+        # Cambió algún médico o sus especialidades: los montículos se rearman al próximo pedido.
+        self.__monticulos.clear()
+
+    def descartar_anteriores(self, dia: date):
+        lunes = dia - timedelta(days=dia.weekday())
+        self.__minutos_dia = {c: m for c, m in self.__minutos_dia.items() if c[1] >= dia}
+        self.__minutos_semana = {c: m for c, m in self.__minutos_semana.items() if c[1] >= lunes}
+        for viejo in [d for d in self.__monticulos if d < dia]:
+            del self.__monticulos[viejo]
+
+    def __monticulo(self, dia: date, dia_semana: str, especialidad: str) -> list:
+        clave = normalizar(especialidad)
+        por_especialidad = self.__monticulos.setdefault(dia, {})
+        if clave not in por_especialidad:
+            miembros = set(self.__directorio.buscar(especialidad=especialidad, dia=dia_semana))
+            monticulo = [self.__entrada(matricula, dia) for matricula in miembros]
+            heapify(monticulo)
+            por_especialidad[clave] = (monticulo, miembros)
+        return por_especialidad[clave][0]
+
+    def __entrada(self, matricula: str, dia: date) -> tuple[int, int, str]:
+        lunes = dia - timedelta(days=dia.weekday())
+        return (self.__minutos_dia.get((matricula, dia), 0), self.__minutos_semana.get((matricula, lunes), 0),
+                matricula)
@@ -0,0 +1,225 @@
+import heapq
+import random
+import time
+import unicodedata
+from collections import deque
+from itertools import islice
+
+
+def normalizar(texto: str) -> str:
+    descompuesto = unicodedata.normalize("NFKD", texto)
+    sin_acentos = "".join(c for c in descompuesto if not unicodedata.combining(c))
+    return " ".join(sin_acentos.lower().split())
+
+
+def trigramas(palabra: str) -> set[str]:
+    # Por palabra: cada una aporta sus propios trigramas de comienzo y de final.
+    relleno = f"  {palabra} "
+    return {relleno[i:i + 3] for i in range(len(relleno) - 2)}
+
+
+def variantes(palabra: str) -> set[str]:
+    # La palabra y cada forma con una letra borrada. Dos palabras que comparten una variante
+    # difieren en una letra agregada, cambiada o en dos vecinas transpuestas ("gacria").
+    return {palabra} | {palabra[:i] + palabra[i + 1:] for i in range(len(palabra))}
+
+
+class IndiceNombres:
+    # Las claves se indexan por palabra en un trie. Para la tolerancia a errores se indexa
+    # el vocabulario (las palabras distintas, muchas menos que los nombres) por trigramas y
+    # por variantes: una consulta con errores primero encuentra palabras parecidas y recién
+    # después los nombres que las contienen, acotados a 'maximo_candidatos'.
+    def __init__(self, maximo_candidatos: int = 1000, similitud_minima: float = 0.5):
+        self.__trie: dict = {}
+        self.__trigramas: dict[str, set[str]] = {}
+        self.__variantes: dict[str, set[str]] = {}
+        self.__nombres: dict[str, str] = {}
+        self.__maximo_candidatos = maximo_candidatos
+        self.__similitud_minima = similitud_minima
+
+    def agregar(self, clave: str, nombre: str):
+        if clave in self.__nombres:
+            self.quitar(clave)
+        normalizado = normalizar(nombre)
+        self.__nombres[clave] = normalizado
+        for token in set(normalizado.split()):
+            nodo = self.__trie
+            for caracter in token:
+                nodo = nodo.setdefault(caracter, {})
+            claves = nodo.setdefault("", set())
+            if not claves:
+                self.__agregar_palabra(token)
+            claves.add(clave)
+
+    def quitar(self, clave: str):
+        normalizado = self.__nombres.pop(clave)
+        for token in set(normalizado.split()):
+            nodo = self.__trie
+            for caracter in token:
+                nodo = nodo[caracter]
+            nodo[""].discard(clave)
+            if not nodo[""]:
+                self.__quitar_palabra(token)
+
+    def cantidad(self) -> int:
+        return len(self.__nombres)
+
+    def buscar(self, texto: str, limite: int = 10) -> list[str]:
+        consulta = normalizar(texto)
+        tokens = consulta.split()
+        if not tokens:
+            return []
+        puntajes = self.__por_prefijo(tokens)
+        if len(puntajes) < limite:
+            for clave, similitud in self.__por_parecidas(tokens).items():
+                if clave not in puntajes:
+                    # Las coincidencias aproximadas siempre quedan detrás de las de prefijo.
+                    puntajes[clave] = similitud - 1
+        mejores = heapq.nsmallest(limite, puntajes.items(), key=lambda e: (-e[1], self.__nombres[e[0]]))
+        return [clave for clave, _ in mejores]
+
+    def __agregar_palabra(self, palabra: str):
+        for trigrama in trigramas(palabra):
+            self.__trigramas.setdefault(trigrama, set()).add(palabra)
+        for variante in variantes(palabra):
+            self.__variantes.setdefault(variante, set()).add(palabra)
+
+    def __quitar_palabra(self, palabra: str):
+        for indice, claves in ((self.__trigramas, trigramas(palabra)), (self.__variantes, variantes(palabra))):
+            for clave in claves:
+                palabras = indice[clave]
+                palabras.discard(palabra)
+                if not palabras:
+                    del indice[clave]
+
+    def __por_prefijo(self, tokens: list[str]) -> dict[str, float]:
+        # Cada palabra de la consulta debe ser prefijo de alguna del nombre. Se recorre el grupo
+        # más chico filtrando por los demás (filter con __contains__ corre en C) y se corta al
+        # juntar 'maximo_candidatos': no hace falta la intersección completa.
+        grupos = sorted((self.__claves_con_prefijo(token) for token in tokens), key=len)
+        candidatos = iter(grupos[0])
+        for grupo in grupos[1:]:
+            candidatos = filter(grupo.__contains__, candidatos)
+        puntajes = {}
+        for clave in islice(candidatos, self.__maximo_candidatos):
+            palabras = self.__nombres[clave].split()
+            total = 0.0
+            for token in tokens:
+                mejor = 0.0
+                for palabra in palabras:
+                    if palabra == token:
+                        mejor = 1.0
+                        break
+                    if palabra.startswith(token):
+                        mejor = max(mejor, 0.5 + 0.5 * len(token) / len(palabra))
+                total += mejor
+            puntajes[clave] = total / len(tokens)
+        return puntajes
+
+    def __claves_con_prefijo(self, prefijo: str) -> set[str]:
+        nodo = self.__trie
+        for caracter in prefijo:
+            nodo = nodo.get(caracter)
+            if nodo is None:
+                return set()
+        exactas = nodo.get("", ())
+        if len(exactas) >= self.__maximo_candidatos:
+            # Sólo se lee: se devuelve sin copiar.
+            return exactas
+        # A lo ancho, así las palabras más cortas (las de mejor puntaje) entran primero.
+        claves = set()
+        pendientes = deque([nodo])
+        while pendientes and len(claves) < self.__maximo_candidatos:
+            actual = pendientes.popleft()
+            for caracter, hijo in actual.items():
+                if caracter == "":
+                    claves.update(islice(hijo, self.__maximo_candidatos - len(claves)))
+                else:
+                    pendientes.append(hijo)
+        return claves
+
+    def __palabras_parecidas(self, token: str) -> dict[str, float]:
+        parecidas = {}
+        for variante in variantes(token):
+            for palabra in self.__variantes.get(variante, ()):
+                parecidas[palabra] = 1.0 if palabra == token else 1 - 1 / max(len(token), len(palabra))
+        # Se cuentan sólo los trigramas poco frecuentes: los muy frecuentes no ayudan a elegir y
+        # cuestan recorrerlos. La similitud exacta se calcula para las palabras que todavía
+        # podrían llegar al mínimo contando como comunes a todos los frecuentes.
+        propios = trigramas(token)
+        comunes: dict[str, int] = {}
+        frecuentes = 0
+        for trigrama in propios:
+            palabras = self.__trigramas.get(trigrama, ())
+            if len(palabras) > self.__maximo_candidatos:
+                frecuentes += 1
+                continue
+            for palabra in palabras:
+                comunes[palabra] = comunes.get(palabra, 0) + 1
+        minimo = self.__similitud_minima * len(propios) - frecuentes
+        for palabra, cantidad in comunes.items():
+            if cantidad < minimo:
+                continue
+            similitud = len(propios & trigramas(palabra)) / len(propios)
+            if similitud >= self.__similitud_minima and similitud > parecidas.get(palabra, 0.0):
+                parecidas[palabra] = similitud
+        return parecidas
+
+    def __por_parecidas(self, tokens: list[str]) -> dict[str, float]:
+        # Para cada palabra de la consulta: (similitud, claves) de las palabras parecidas, de la
+        # más parecida a la menos. Los candidatos salen primero de las consultas más raras.
+        grupos = []
+        for token in tokens:
+            parecidas = self.__palabras_parecidas(token)
+            grupos.append(sorted(((similitud, self.__claves_de(palabra)) for palabra, similitud in parecidas.items()),
+                                 key=lambda grupo: -grupo[0]))
+        candidatos = set()
+        for grupo in sorted(grupos, key=lambda g: sum(len(claves) for _, claves in g)):
+            for _, claves in grupo:
+                candidatos.update(islice(claves, self.__maximo_candidatos - len(candidatos)))
+                if len(candidatos) >= self.__maximo_candidatos:
+                    break
+            if len(candidatos) >= self.__maximo_candidatos:
+                break
+        puntajes = {}
+        for clave in candidatos:
+            total = sum(next((similitud for similitud, claves in grupo if clave in claves), 0.0) for grupo in grupos)
+            if total / len(tokens) >= self.__similitud_minima:
+                puntajes[clave] = total / len(tokens)
+        return puntajes
+
+    def __claves_de(self, palabra: str) -> set[str]:
+        nodo = self.__trie
+        for caracter in palabra:
+            nodo = nodo[caracter]
+        return nodo[""]
+
+
+NOMBRES = ("maria", "jose", "juan", "ana", "luis", "carlos", "laura", "jorge", "lucia", "pedro", "sofia",
+           "miguel", "marta", "diego", "paula", "pablo", "elena", "martin", "julia", "andres")
+APELLIDOS = ("garcia", "martinez", "lopez", "gonzalez", "rodriguez", "fernandez", "perez", "sanchez",
+             "romero", "sosa", "torres", "alvarez", "ruiz", "ramirez", "flores", "benitez", "acosta",
+             "medina", "herrera", "suarez", "aguirre", "gimenez", "gutierrez", "pereyra", "molina")
+
+
+def medir_busqueda(cantidad_nombres: int = 2_000_000, repeticiones: int = 20, semilla: int = 0) -> dict[str, float]:
+    # Milisegundos por consulta (la mediana) sobre nombres sintéticos de dos nombres y dos apellidos.
+    azar = random.Random(semilla)
+    indice = IndiceNombres()
+    for numero in range(cantidad_nombres):
+        indice.agregar(str(numero), " ".join((azar.choice(NOMBRES), azar.choice(NOMBRES),
+                                              azar.choice(APELLIDOS), azar.choice(APELLIDOS))))
+    tiempos = {}
+    for consulta in ("maria garcia", "mar", "Mrtinez", "jose gacria", "lopes sosa"):
+        medidas = []
+        for _ in range(repeticiones):
+            comienzo = time.perf_counter()
+            indice.buscar(consulta)
+            medidas.append(time.perf_counter() - comienzo)
+        tiempos[consulta] = sorted(medidas)[len(medidas) // 2] * 1000
+    return tiempos
+
+
+if __name__ == "__main__":
+    for consulta, milisegundos in medir_busqueda().items():
+        print(f"{consulta!r}: {milisegundos:.2f} ms")
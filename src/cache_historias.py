@@ -0,0 +1,156 @@
+import dbm
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from io import BytesIO
+from typing import Callable, Iterator
+from src.historiaclinica import HistoriaClinica
+
+
+class _Escritor(pickle.Pickler):
+    def __init__(self, archivo, identificar: Callable[[object], tuple | None]):
+        super().__init__(archivo, pickle.HIGHEST_PROTOCOL)
+        self.__identificar = identificar
+
+    def persistent_id(self, objeto):
+        return self.__identificar(objeto)
+
+
+class _Lector(pickle.Unpickler):
+    def __init__(self, archivo, resolver: Callable[[tuple], object]):
+        super().__init__(archivo)
+        self.__resolver = resolver
+
+    def persistent_load(self, clave):
+        return self.__resolver(clave)
+
+
+class CacheHistorias:
+    # Historias clínicas residentes en un LRU acotado; las que salen se escriben en un almacén
+    # dbm y vuelven a memoria cuando se las pide. Las entidades que la historia comparte con la
+    # clínica (pacientes, médicos, turnos vigentes, series) se guardan por clave y al volver se
+    # resuelven contra la clínica, así no se duplican. Sin capacidad no expulsa nada.
+    def __init__(self, identificar: Callable[[object], tuple | None], resolver: Callable[[tuple], object],
+                 capacidad: int = None, directorio: str = None):
+        if capacidad is not None and (capacidad < 1 or directorio is None):
+            raise ValueError("Una capacidad acotada debe ser positiva y necesita un directorio")
+        self.__identificar = identificar
+        self.__resolver = resolver
+        self.__capacidad = capacidad
+        self.__residentes: OrderedDict[str, HistoriaClinica] = OrderedDict()
+        # Residentes que se leyeron de disco y no cambiaron: al expulsarlas no se reescriben.
+        self.__limpias: set[str] = set()
+        self.__ruta = None
+        if capacidad is not None:
+            os.makedirs(directorio, exist_ok=True)
+            self.__ruta = os.path.join(directorio, "historias")
+        self.__almacen = dbm.open(self.__ruta, "c") if self.__ruta else None
+        self.__cerrojo = threading.Lock()
+        self.__aciertos = 0
+        self.__fallos = 0
+        self.__expulsiones = 0
+        self.__escrituras = 0
+
+    def __getitem__(self, dni: str) -> HistoriaClinica:
+        historia = self.get(dni)
+        if historia is None:
+            raise KeyError(dni)
+        return historia
+
+    def __setitem__(self, dni: str, historia: HistoriaClinica):
+        with self.__cerrojo:
+            self.__limpias.discard(dni)
+            self.__alojar(dni, historia)
+
+    def get(self, dni: str, defecto: HistoriaClinica = None) -> HistoriaClinica | None:
+        with self.__cerrojo:
+            historia = self.__residentes.get(dni)
+            if historia is not None:
+                self.__residentes.move_to_end(dni)
+                self.__aciertos += 1
+                return historia
+            clave = dni.encode()
+            if self.__almacen is None or clave not in self.__almacen:
+                return defecto
+            self.__fallos += 1
+            historia = _Lector(BytesIO(self.__almacen[clave]), self.__resolver).load()
+            self.__limpias.add(dni)
+            self.__alojar(dni, historia)
+            return historia
+
+    def claves(self) -> list[str]:
+        with self.__cerrojo:
+            claves = list(self.__residentes)
+            if self.__almacen is not None:
+                claves.extend(c for c in (k.decode() for k in self.__almacen.keys()) if c not in self.__residentes)
+            return claves
+
+    def items(self) -> Iterator[tuple[str, HistoriaClinica]]:
+        # Recorre también las historias en disco, trayéndolas de a una (la memoria sigue acotada).
+        for dni in self.claves():
+            yield dni, self[dni]
+
+    def residentes(self) -> list[HistoriaClinica]:
+        with self.__cerrojo:
+            return list(self.__residentes.values())
+
+    def obtener_estadisticas(self) -> dict[str, float]:
+        with self.__cerrojo:
+            consultas = self.__aciertos + self.__fallos
+            return {
+                "aciertos": self.__aciertos,
+                "fallos": self.__fallos,
+                "tasa_aciertos": self.__aciertos / consultas if consultas else 1.0,
+                "expulsiones": self.__expulsiones,
+                "escrituras": self.__escrituras,
+                "residentes": len(self.__residentes),
+            }
+
+    def cerrar(self):
+        with self.__cerrojo:
+            if self.__almacen is not None:
+                self.__almacen.close()
+                self.__almacen = None
+
+    def __alojar(self, dni: str, historia: HistoriaClinica):
+        self.__residentes[dni] = historia
+        self.__residentes.move_to_end(dni)
+        if self.__capacidad is None:
+            return
+        historia.agregar_observador(self.__marcar_modificada)
+        while len(self.__residentes) > self.__capacidad:
+            expulsado, expulsada = self.__residentes.popitem(last=False)
+            self.__expulsiones += 1
+            if expulsado in self.__limpias:
+                self.__limpias.discard(expulsado)
+                continue
+            contenido = BytesIO()
+            _Escritor(contenido, self.__identificar).dump(expulsada)
+            self.__almacen[expulsado.encode()] = contenido.getvalue()
+            self.__escrituras += 1
+
+    def __marcar_modificada(self, historia: HistoriaClinica):
+        dni = historia.get_paciente().obtener_dni()
+        with self.__cerrojo:
+            self.__limpias.discard(dni)
+            if self.__residentes.get(dni) is not historia:
+                # Se modificó una historia ya expulsada (alguien la tenía en la mano): vuelve a
+                # ser la residente, porque es la que tiene el último cambio.
+                self.__alojar(dni, historia)
+
+    def __getstate__(self):
+        # El almacén y el cerrojo son locales al proceso; al restaurar se reabre el mismo archivo.
+        estado = self.__dict__.copy()
+        del estado["_CacheHistorias__almacen"]
+        del estado["_CacheHistorias__cerrojo"]
+        estado["_CacheHistorias__limpias"] = set()
+        return estado
+
+    def __setstate__(self, estado):
+        self.__dict__.update(estado)
+        self.__almacen = dbm.open(self.__ruta, "c") if self.__ruta else None
+        self.__cerrojo = threading.Lock()
+        if self.__capacidad is not None:
+            for historia in self.__residentes.values():
+                historia.agregar_observador(self.__marcar_modificada)
@@ -0,0 +1,160 @@
+import json
+import random
+import socket
+import sys
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from urllib.parse import urlencode
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.clinica import Clinica, DIAS_SEMANA
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.servidor import ServidorClinica
+
+ESPECIALIDAD = "Clínica médica"
+INICIO = datetime(2025, 1, 6, 8, 0)
+
+
+def preparar_clinica(cantidad_pacientes: int = 1000, cantidad_medicos: int = 50) -> Clinica:
+    clinica = Clinica()
+    for dni in range(cantidad_pacientes):
+        clinica.agregar_paciente(Paciente(str(dni), f"Paciente {dni}", "01/01/1980"))
+    for numero in range(cantidad_medicos):
+        medico = Medico(f"MP-{numero}", f"Médico {numero}")
+        medico.agregar_especialidad(Especialidad(ESPECIALIDAD, list(DIAS_SEMANA)))
+        clinica.agregar_medico(medico)
+    return clinica
+
+
+class _ConexionEncadenada:
+    # Cliente HTTP/1.1 mínimo que envía varias solicitudes seguidas por la misma conexión
+    # (pipelining) y después lee las respuestas en orden.
+    def __init__(self, host: str, puerto: int):
+        self.__host = host
+        self.__socket = socket.create_connection((host, puerto))
+        self.__socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.__lectura = self.__socket.makefile("rb")
+
+    def enviar(self, solicitudes: list[tuple[str, str, dict | None]]) -> list[tuple[int, float]]:
+        datos = bytearray()
+        for metodo, ruta, cuerpo in solicitudes:
+            contenido = json.dumps(cuerpo).encode("utf-8") if cuerpo is not None else b""
+            datos += (f"{metodo} {ruta} HTTP/1.1\r\nHost: {self.__host}\r\n"
+                      f"Content-Type: application/json\r\nContent-Length: {len(contenido)}\r\n\r\n").encode("latin-1")
+            datos += contenido
+        comienzo = time.perf_counter()
+        self.__socket.sendall(datos)
+        return [(self.__leer_respuesta(), time.perf_counter() - comienzo) for _ in solicitudes]
+
+    def __leer_respuesta(self) -> int:
+        linea = self.__lectura.readline()
+        if not linea:
+            raise ConnectionError("El servidor cerró la conexión")
+        codigo = int(linea.split()[1])
+        largo = 0
+        while (linea := self.__lectura.readline()) not in (b"\r\n", b"\n", b""):
+            nombre, _, valor = linea.decode("latin-1").partition(":")
+            if nombre.strip().lower() == "content-length":
+                largo = int(valor)
+        self.__lectura.read(largo)
+        return codigo
+
+    def cerrar(self):
+        self.__lectura.close()
+        self.__socket.close()
+
+
+def _percentil(valores: list[float], porcentaje: float) -> float:
+    if not valores:
+        return 0.0
+    return valores[min(len(valores) - 1, int(len(valores) * porcentaje / 100))]
+
+
+def _solicitud(generador: random.Random, conexion: int, numero: int, conexiones: int,
+               cantidad_pacientes: int, cantidad_medicos: int, proporcion_reservas: float):
+    dni = str(generador.randrange(cantidad_pacientes))
+    matricula = f"MP-{generador.randrange(cantidad_medicos)}"
+    if generador.random() < proporcion_reservas:
+        # Cada conexión reserva franjas propias, así que casi todas las reservas se concretan.
+        franja = INICIO + timedelta(minutes=30 * (conexion + conexiones * numero))
+        return "POST", "/turnos", {"dni": dni, "matricula": matricula, "especialidad": ESPECIALIDAD,
+                                   "fecha_hora": franja.isoformat()}
+    lectura = generador.randrange(4)
+    if lectura == 0:
+        return "GET", f"/turnos?matricula={matricula}", None
+    if lectura == 1:
+        return "GET", f"/historias/{dni}", None
+    if lectura == 2:
+        return "GET", f"/agendas/{INICIO.date().isoformat()}?matricula={matricula}", None
+    franja = INICIO + timedelta(minutes=30 * generador.randrange(1000))
+    consulta = urlencode({"dni": dni, "matricula": matricula, "especialidad": ESPECIALIDAD,
+                          "fecha_hora": franja.isoformat()})
+    return "GET", f"/disponibilidad?{consulta}", None
+
+
+def generar_carga(host: str, puerto: int, conexiones: int = 8, solicitudes_por_conexion: int = 500,
+                  proporcion_reservas: float = 0.2, profundidad: int = 1, cantidad_pacientes: int = 1000,
+                  cantidad_medicos: int = 50, semilla: int = 0) -> dict:
+    latencias: list[list[float]] = [[] for _ in range(conexiones)]
+    codigos: list[dict[int, int]] = [{} for _ in range(conexiones)]
+
+    def cliente(numero_conexion: int):
+        generador = random.Random(semilla + numero_conexion)
+        solicitudes = [_solicitud(generador, numero_conexion, i, conexiones, cantidad_pacientes,
+                                  cantidad_medicos, proporcion_reservas)
+                       for i in range(solicitudes_por_conexion)]
+        conexion = _ConexionEncadenada(host, puerto)
+        try:
+            for desde in range(0, len(solicitudes), profundidad):
+                for codigo, demora in conexion.enviar(solicitudes[desde:desde + profundidad]):
+                    latencias[numero_conexion].append(demora)
+                    codigos[numero_conexion][codigo] = codigos[numero_conexion].get(codigo, 0) + 1
+        finally:
+            conexion.cerrar()
+
+    hilos = [threading.Thread(target=cliente, args=(n,)) for n in range(conexiones)]
+    comienzo = time.perf_counter()
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    duracion = time.perf_counter() - comienzo
+
+    todas = sorted(l for propias in latencias for l in propias)
+    por_codigo: dict[int, int] = {}
+    for propios in codigos:
+        for codigo, cantidad in propios.items():
+            por_codigo[codigo] = por_codigo.get(codigo, 0) + cantidad
+    return {
+        "solicitudes": len(todas),
+        "segundos": duracion,
+        "por_segundo": len(todas) / duracion if duracion else 0.0,
+        "p50_ms": _percentil(todas, 50) * 1000,
+        "p90_ms": _percentil(todas, 90) * 1000,
+        "p99_ms": _percentil(todas, 99) * 1000,
+        "max_ms": (todas[-1] if todas else 0.0) * 1000,
+        "codigos": dict(sorted(por_codigo.items())),
+    }
+
+
+def imprimir_reporte(titulo: str, resultado: dict):
+    print(f"{titulo}: {resultado['solicitudes']} solicitudes en {resultado['segundos']:.2f} s "
+          f"({resultado['por_segundo']:,.0f}/s) | p50 {resultado['p50_ms']:.2f} ms, "
+          f"p90 {resultado['p90_ms']:.2f} ms, p99 {resultado['p99_ms']:.2f} ms, "
+          f"máx {resultado['max_ms']:.2f} ms | códigos {resultado['codigos']}")
+
+
+if __name__ == "__main__":
+    print(f"Núcleos disponibles: {os.cpu_count()}")
+    with ServidorClinica(preparar_clinica(), puerto=0) as servidor:
+        threading.Thread(target=servidor.serve_forever, daemon=True).start()
+        for conexiones, profundidad in ((1, 1), (8, 1), (8, 8), (32, 1)):
+            resultado = generar_carga("127.0.0.1", servidor.obtener_puerto(), conexiones=conexiones,
+                                      profundidad=profundidad, semilla=conexiones * 100 + profundidad)
+            imprimir_reporte(f"{conexiones} conexión(es), profundidad {profundidad}", resultado)
+        servidor.shutdown()
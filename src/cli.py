@@ -2,11 +2,13 @@ import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__),'..')))
 
-from datetime import datetime
+from datetime import date, datetime
 from src.clinica import Clinica
 from src.paciente import Paciente
 from src.medico import Medico
 from src.especialidad import Especialidad
+from src.render import CacheRender
+from src.memoria import formatear_reporte
 from src.exepciones import (
     PacienteNoExisteError,
  MedicoYaExisteError,
@@ -21,6 +23,7 @@ from src.exepciones import (
 class CLI:
     def __init__(self):
         self.clinica = Clinica()
+        self.render = CacheRender()
 
     def mostrar_menu(self):
         print("\n--- Menú Clínica ---")
@@ -33,6 +36,10 @@ class CLI:
         print("7) Ver todos los turnos")
         print("8) Ver todos los pacientes")
         print("9) Ver todos los médicos")
+        print("10) Buscar paciente por nombre")
+        print("11) Buscar médico")
+        print("12) Ver agendas del día")
+        print("13) Reporte de memoria")
         print("0) Salir")
 
     def ejecutar(self):
@@ -51,26 +58,10 @@ class CLI:
                     case "7": self.ver_turnos()
                     case "8": self.ver_pacientes()
                     case "9": self.ver_medicos()
-                    case "0": print("Hasta luego"); break
-                    case _: print("Opción no válida")
-            except Exception as e:
-                print(f"Error inesperado: {e}")
-    def ejecutar(self):
-        while True:
-            self.mostrar_menu()
-            opcion = input("Seleccione una opción: ").strip()
-
-            try:
-                match opcion:
-                    case "1": self.agregar_paciente()
-                    case "2": self.agregar_medico()
-                    case "3": self.agendar_turno()
-                    case "4": self.agregar_especialidad()
-                    case "5": self.emitir_receta()
-                    case "6": self.ver_historia()
-                    case "7": self.ver_turnos()
-                    case "8": self.ver_pacientes()
-                    case "9": self.ver_medicos()
+                    case "10": self.buscar_paciente()
+                    case "11": self.buscar_medico()
+                    case "12": self.ver_agendas_del_dia()
+                    case "13": self.ver_reporte_memoria()
                     case "0": print("Hasta luego"); break
                     case _: print("Opción no válida")
             except Exception as e:
@@ -162,7 +153,7 @@ class CLI:
             medicamentos = [m.strip() for m in meds_str.split(",") if m.strip()]
 
             receta = self.clinica.emitir_receta(dni, matricula, medicamentos)
-            print("Receta emitida")
+            print(f"Receta emitida (id {receta.obtener_id()})")
             print(receta)
         except (PacienteNoExisteError, MedicoNoExisteError, RecetaInvalidaError, ValueError) as e:
             print(f"Error: {e}")
@@ -171,7 +162,7 @@ class CLI:
         try:
             dni = input("DNI del paciente: ").strip()
             historia = self.clinica.obtener_historia_clinica(dni)
-            print(historia)
+            print(self.render.renderizar(historia) if historia is not None else historia)
         except PacienteNoExisteError as e:
             print(f"Error: {e}")
 
@@ -181,11 +172,47 @@ class CLI:
 
     def ver_pacientes(self):
         for p in self.clinica.obtener_pacientes():
-            print(p)
+            print(self.render.renderizar(p))
+
+    def buscar_paciente(self):
+        texto = input("Nombre a buscar: ").strip()
+        pacientes = self.clinica.buscar_pacientes(texto)
+        if not pacientes:
+            print("No se encontraron pacientes.")
+        for p in pacientes:
+            print(self.render.renderizar(p))
+
+    def buscar_medico(self):
+        nombre = input("Nombre (vacío para cualquiera): ").strip() or None
+        especialidad = input("Especialidad (vacío para cualquiera): ").strip() or None
+        dia = input("Día de atención (vacío para cualquiera): ").strip() or None
+        medicos = self.clinica.buscar_medicos(nombre, especialidad, dia)
+        if not medicos:
+            print("No se encontraron médicos.")
+        for m in medicos:
+            print(self.render.renderizar(m))
+
+    def ver_agendas_del_dia(self):
+        try:
+            fecha_str = input("Fecha (DD/MM/AAAA, vacío para hoy): ").strip()
+            dia = datetime.strptime(fecha_str, "%d/%m/%Y").date() if fecha_str else date.today()
+        except ValueError as e:
+            print(f"Error: {e}")
+            return
+        agendas = self.clinica.obtener_agendas_del_dia(dia)
+        if not agendas:
+            print("No hay turnos para ese día.")
+        for matricula, turnos in agendas.items():
+            print(f"Agenda de {matricula}:")
+            for t in turnos:
+                print(f"  {t.obtener_fecha_hora().strftime('%H:%M')} {t.obtener_paciente()} ({t.obtener_especialidad()})")
+
+    def ver_reporte_memoria(self):
+        print(formatear_reporte(self.clinica.reporte_memoria()))
 
     def ver_medicos(self):
         for m in self.clinica.obtener_medicos():
-            print(m)
+            print(self.render.renderizar(m))
 
 
 if __name__ == "__main__":
@@ -1,4 +1,6 @@
-from datetime import datetime
+import weakref
+from datetime import date, datetime, time, timedelta
+from functools import partial
 from src.paciente import Paciente
 from src.exepciones import PacienteNoEncontradoException    
 from src.exepciones import TurnoOcupadoException
@@ -9,22 +11,247 @@ from src.receta import Receta
 from src.exepciones import RecetaInvalidaException
 from src.historiaclinica import HistoriaClinica
 from src.exepciones import PacienteNoExisteError
+from src.consultas import IndiceTurnos
+from src.exepciones import TurnoNoEncontradoException
+from src.exepciones import TurnoSuperpuestoException
+from src.serie import SerieTurnos
+from src.lista_espera import ListaEspera
+from src.motivos import MotivoRechazo
+from src.indice_edades import IndiceEdades
+from src.busqueda import IndiceNombres
+from src.directorio import DirectorioMedicos
+from src.indice_horarios import IndiceHorarios
+from src.balanceo import BalanceadorMedicos
+from src.vistas import VistaClinica
+from src.eventos import CanalEventos, CerrojoEscritura, PoliticaDesborde, Suscripcion, TipoEvento
+from src.agendas import AgendasDiarias
+from src.memoria import reporte_memoria
+from src.idempotencia import CacheIdempotencia
+from src.archivo import ArchivoHistorico
+from src.cache_historias import CacheHistorias
+from src.registro_recetas import RegistroRecetas
+
+DIAS_SEMANA = ("lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo")
+UN_MINUTO = timedelta(minutes=1)
 
 
 class Clinica:
-    def __init__(self):
+    def __init__(self, archivo: ArchivoHistorico = None, capacidad_historias: int = None,
+                 directorio_historias: str = None):
         self.__pacientes: dict[str, Paciente] = {}
         self.__medicos: dict[str, Medico] = {}
         self.__turnos : list[Turno] = []
-        self.__historias_clinicas : dict[str, HistoriaClinica ] = {}
+        self.__historias_clinicas = CacheHistorias(self.identificar_entidad, self.resolver_entidad,
+                                                   capacidad_historias, directorio_historias)
+        self.__indice_turnos = IndiceTurnos()
+        self.__horarios_pacientes = IndiceHorarios()
+        self.__turnos_cancelados = 0
+        self.__series: dict[str, list[SerieTurnos]] = {}
+        self.__lista_espera = ListaEspera()
+        self.__indice_edades = IndiceEdades()
+        self.__indice_nombres = IndiceNombres()
+        self.__directorio = DirectorioMedicos()
+        self.__balanceo = BalanceadorMedicos(self.__directorio)
+        self.__version = 0
+        # Vistas abiertas que comparten los diccionarios actuales: se copian antes de escribirlos.
+        self.__vistas_compartidas = weakref.WeakSet()
+        self.__eventos = CanalEventos(diferir_entrega=True)
+        self.__escritura = CerrojoEscritura(self.__eventos)
+        self.__agendas = AgendasDiarias(self.__eventos, self.abrir_vista)
+        self.__idempotencia = CacheIdempotencia()
+        self.__archivo = archivo
+        self.__recetas = RegistroRecetas(archivo.obtener_ultimo_id_receta() if archivo is not None else 0)
 
     def agregar_paciente(self, paciente: Paciente):
-        dni = paciente.obtener_dni()
-        self.__pacientes[dni] = paciente
-        self.__historias_clinicas[dni] = HistoriaClinica(paciente)
+        with self.__escritura:
+            dni = paciente.obtener_dni()
+            self.__copiar_si_compartido()
+            self.__nueva_version()
+            self.__pacientes[dni] = paciente
+            historia = HistoriaClinica(paciente, recetas_de=self.obtener_receta)
+            if self.__archivo is not None and self.__archivo.puede_tener_paciente(dni):
+                # Archivo reabierto: lo archivado por otro proceso también es parte de la historia.
+                historia.asignar_cargador(partial(self.obtener_archivados, dni))
+            self.__historias_clinicas[dni] = historia
+            self.__indice_edades.agregar(paciente)
+            self.__indice_nombres.agregar(dni, paciente.obtener_nombre())
+            self.__eventos.publicar(TipoEvento.PACIENTE_AGREGADO, paciente)
 
     def agregar_medico(self, medico: Medico):
-        self.__medicos[medico.obtener_matricula()] = medico
+        with self.__escritura:
+            self.__copiar_si_compartido()
+            self.__nueva_version()
+            self.__medicos[medico.obtener_matricula()] = medico
+            self.__directorio.actualizar(medico)
+            medico.agregar_observador(self.__directorio.actualizar)
+            self.__balanceo.invalidar()
+            medico.agregar_observador(self.__balanceo.invalidar)
+            self.__eventos.publicar(TipoEvento.MEDICO_AGREGADO, medico)
+
+    def abrir_vista(self) -> VistaClinica:
+        with self.__escritura:
+            vista = VistaClinica(self.__version, self.__pacientes, self.__medicos, self.__historias_clinicas,
+                                 self.__turnos, len(self.__turnos), self.__series, self.__archivo)
+            self.__vistas_compartidas.add(vista)
+            return vista
+
+    def suscribir_eventos(self, capacidad: int = 1000,
+                          politica: PoliticaDesborde = PoliticaDesborde.DESCARTAR_ANTIGUOS,
+                          tipos: list[TipoEvento] = None, desde: int = None) -> Suscripcion:
+        return self.__eventos.suscribir(capacidad, politica, tipos, desde)
+
+    def obtener_ultima_secuencia_eventos(self) -> int:
+        return self.__eventos.obtener_ultima_secuencia()
+
+    def obtener_agenda(self, matricula: str, dia: date) -> list[Turno]:
+        if self.__dia_archivado(dia):
+            return self.__buscar_en_dia(dia, matricula)
+        return self.__agendas.obtener_agenda(matricula, dia)
+
+    def obtener_agendas_del_dia(self, dia: date) -> dict[str, list[Turno]]:
+        if self.__dia_archivado(dia):
+            agendas: dict[str, list[Turno]] = {}
+            for turno in self.__buscar_en_dia(dia):
+                agendas.setdefault(turno.obtener_medico().obtener_matricula(), []).append(turno)
+            return dict(sorted(agendas.items()))
+        return self.__agendas.obtener_agendas_del_dia(dia)
+
+    def __dia_archivado(self, dia: date) -> bool:
+        # Las agendas materializadas sólo guardan días posteriores al horizonte de archivo.
+        horizonte = self.__archivo.obtener_horizonte() if self.__archivo is not None else None
+        return horizonte is not None and dia <= horizonte.date()
+
+    def __buscar_en_dia(self, dia: date, matricula: str = None) -> list[Turno]:
+        inicio = datetime.combine(dia, time.min)
+        return self.buscar_turnos(matricula=matricula, desde=inicio, hasta=inicio + timedelta(days=1))
+
+    def archivar(self, horizonte: datetime) -> int:
+        # Pasa al archivo en disco los turnos y recetas anteriores al horizonte. Siguen
+        # apareciendo en historias y búsquedas: se leen de disco cuando se los pide.
+        if self.__archivo is None:
+            raise ValueError("La clínica no tiene un archivo histórico configurado")
+        with self.__escritura:
+            version = self.__nueva_version()
+            recetas = []
+            # Primero las historias: las que están en disco se resuelven contra el índice de turnos.
+            for dni, historia in self.__historias_clinicas.items():
+                recetas.extend(historia.archivar_anteriores(horizonte, partial(self.obtener_archivados, dni)))
+            turnos = self.__indice_turnos.quitar_anteriores(horizonte)
+            self.__horarios_pacientes.quitar_anteriores(horizonte)
+            self.__balanceo.descartar_anteriores(horizonte.date())
+            # Lista nueva: las vistas abiertas conservan la anterior.
+            self.__turnos = [t for t in self.__turnos
+                             if not t.esta_cancelado() and t.obtener_fecha_hora() >= horizonte]
+            self.__turnos_cancelados = 0
+            archivados = self.__archivo.archivar(version, horizonte, turnos, recetas)
+        # Fuera del cerrojo: las agendas toman el suyo y después abren vistas (que toman este).
+        # Mientras tanto los días archivados ya no se leen de las agendas.
+        self.__agendas.descartar_anteriores(horizonte.date())
+        return archivados
+
+    def obtener_archivados(self, dni: str) -> tuple[list[Turno], list[Receta]]:
+        if self.__archivo is None or dni not in self.__pacientes:
+            return [], []
+        return self.__archivo.cargar_paciente(self.__pacientes[dni], self.__medicos)
+
+    def __ocupado_en_archivo(self, matricula: str, fecha_hora: datetime) -> bool:
+        horizonte = self.__archivo.obtener_horizonte() if self.__archivo is not None else None
+        if horizonte is None or fecha_hora >= horizonte:
+            return False
+        return bool(self.__archivo.buscar_turnos(self.__pacientes, self.__medicos, matricula=matricula,
+                                                 desde=fecha_hora, hasta=fecha_hora + timedelta(microseconds=1)))
+
+    def reporte_memoria(self, muestra: int = 200, semilla: int = 0) -> dict[str, dict]:
+        # Recorre los índices: bajo el cerrojo, como las búsquedas.
+        with self.__escritura:
+            return self.__medir_memoria(muestra, semilla)
+
+    def __medir_memoria(self, muestra: int, semilla: int) -> dict[str, dict]:
+        historias = self.__historias_clinicas.residentes()
+        series = self.obtener_series()
+        cantidad_turnos = len(self.__turnos) - self.__turnos_cancelados
+        entidades = {
+            "pacientes": (list(self.__pacientes.values()), [self.__pacientes]),
+            "medicos": (list(self.__medicos.values()), [self.__medicos]),
+            "turnos": (self.__turnos, [self.__turnos]),
+            "historias": (historias, []),
+            "series": (series, [self.__series] + list(self.__series.values())),
+        }
+        estructuras = {
+            "indice_turnos": (self.__indice_turnos, cantidad_turnos),
+            "horarios_pacientes": (self.__horarios_pacientes, self.__horarios_pacientes.cantidad()),
+            "indice_edades": (self.__indice_edades, len(self.__pacientes)),
+            "indice_nombres": (self.__indice_nombres, len(self.__pacientes)),
+            "directorio": (self.__directorio, len(self.__medicos)),
+            "balanceo": (self.__balanceo, len(self.__medicos)),
+            "agendas": (self.__agendas, cantidad_turnos),
+            "eventos": (self.__eventos, self.__eventos.cantidad_retenida()),
+            "lista_espera": (self.__lista_espera, self.__lista_espera.cantidad()),
+            "registro_recetas": (self.__recetas, self.__recetas.cantidad()),
+        }
+        return reporte_memoria(entidades, estructuras, muestra, semilla)
+
+    def obtener_version(self) -> int:
+        return self.__version
+
+    def obtener_estadisticas_historias(self) -> dict[str, float]:
+        return self.__historias_clinicas.obtener_estadisticas()
+
+    def cerrar(self):
+        self.__historias_clinicas.cerrar()
+
+    def identificar_entidad(self, objeto) -> tuple | None:
+        # Claves con que el caché de historias guarda en disco lo que comparte con la clínica.
+        if objeto is self:
+            return ("clinica",)
+        if isinstance(objeto, Paciente):
+            return ("paciente", objeto.obtener_dni())
+        if isinstance(objeto, Medico):
+            return ("medico", objeto.obtener_matricula())
+        if isinstance(objeto, Turno):
+            clave = (objeto.obtener_medico().obtener_matricula(), objeto.obtener_fecha_hora())
+            # Un turno cancelado ya no está en el índice: se guarda por valor.
+            return ("turno", *clave) if self.__indice_turnos.obtener_turno(*clave) is objeto else None
+        if isinstance(objeto, SerieTurnos):
+            return ("serie", objeto.obtener_medico().obtener_matricula(), objeto.obtener_inicio())
+        return None
+
+    def resolver_entidad(self, clave: tuple):
+        match clave:
+            case ("clinica",):
+                return self
+            case ("paciente", dni):
+                return self.__pacientes[dni]
+            case ("medico", matricula):
+                return self.__medicos[matricula]
+            case ("turno", matricula, fecha_hora):
+                return self.__indice_turnos.obtener_turno(matricula, fecha_hora)
+            case ("serie", matricula, inicio):
+                return next(s for s in self.__series[matricula] if s.obtener_inicio() == inicio)
+        raise ValueError(f"Clave de entidad desconocida: {clave!r}")
+
+    def __nueva_version(self) -> int:
+        self.__version += 1
+        return self.__version
+
+    def __copiar_si_compartido(self):
+        if self.__vistas_compartidas:
+            self.__pacientes = dict(self.__pacientes)
+            self.__medicos = dict(self.__medicos)
+            self.__series = {matricula: list(series) for matricula, series in self.__series.items()}
+            self.__vistas_compartidas = weakref.WeakSet()
+
+    def __getstate__(self):
+        # El cerrojo y las vistas son locales al proceso y no se serializan.
+        estado = self.__dict__.copy()
+        del estado["_Clinica__escritura"]
+        del estado["_Clinica__vistas_compartidas"]
+        return estado
+
+    def __setstate__(self, estado):
+        self.__dict__.update(estado)
+        self.__escritura = CerrojoEscritura(self.__eventos)
+        self.__vistas_compartidas = weakref.WeakSet()
 
     def obtener_pacientes(self):
         return list(self.__pacientes.values())
@@ -32,6 +259,25 @@ class Clinica:
     def obtener_medicos(self):
         return list(self.__medicos.values())
 
+    # Las búsquedas recorren índices que las escrituras de otros hilos modifican en el lugar:
+    # se hacen bajo el cerrojo. Los reportes largos deberían leer de abrir_vista().
+    def buscar_pacientes(self, texto: str, limite: int = 10) -> list[Paciente]:
+        with self.__escritura:
+            return [self.__pacientes[dni] for dni in self.__indice_nombres.buscar(texto, limite)]
+
+    def buscar_medicos(self, nombre: str = None, especialidad: str = None, dia: str = None) -> list[Medico]:
+        with self.__escritura:
+            return [self.__medicos[m] for m in self.__directorio.buscar(nombre, especialidad, dia)]
+
+    def buscar_pacientes_por_edad(self, edad_minima: int, edad_maxima: int, fecha_referencia: date = None) -> list[Paciente]:
+        with self.__escritura:
+            return self.__indice_edades.por_edad(edad_minima, edad_maxima, fecha_referencia)
+
+    def pacientes_que_cumplen(self, edad: int, anio: int = None, mes: int = None) -> list[Paciente]:
+        hoy = date.today()
+        with self.__escritura:
+            return self.__indice_edades.cumplen_en_mes(edad, anio or hoy.year, mes or hoy.month)
+
     def obtener_medico_por_matricula(self, matricula):
         return self.__medicos.get(matricula)
     def obtener_medico_por_matricula(self, matricula):
@@ -40,28 +286,503 @@ class Clinica:
         return self.__medicos.get(matricula)
 
 
-    def agendar_turno(self, dni: str, matricula: str, especialidad: str, fecha_hora: datetime):
-        self.validar_existencia_paciente(dni)
-        self.validar_existencia_medico(matricula)
-        self.validar_turno_no_duplicado(matricula, fecha_hora)
-        paciente = self.__pacientes[dni]
-        medico = self.__medicos[matricula]
-        dia = self.obtener_dia_semana_en_espanol(fecha_hora)
-        self.validar_especialidad_en_dia(medico, especialidad, dia)
-        turno = Turno(paciente, medico, fecha_hora, especialidad)
+    def agendar_turno(self, dni: str, matricula: str, especialidad: str, fecha_hora: datetime,
+                      clave_idempotencia: str = None) -> Turno:
+        huella = ("agendar_turno", dni, matricula, especialidad, fecha_hora)
+        with self.__escritura:
+            previo = self.__idempotencia.obtener(clave_idempotencia, huella)
+            if previo is not None:
+                return previo
+            motivo = self.__motivo_rechazo(dni, matricula, especialidad, fecha_hora)
+            if motivo:
+                self.__lanzar_rechazo(motivo, dni, matricula)
+            turno = self.__agendar_validado(dni, matricula, especialidad, fecha_hora)
+            self.__idempotencia.guardar(clave_idempotencia, huella, turno)
+            return turno
+
+    def agendar_turno_automatico(self, dni: str, especialidad: str, fecha_hora: datetime,
+                                 clave_idempotencia: str = None) -> Turno:
+        # Asigna el médico de esa especialidad menos cargado ese día que tenga libre el horario.
+        huella = ("agendar_turno_automatico", dni, especialidad, fecha_hora)
+        with self.__escritura:
+            previo = self.__idempotencia.obtener(clave_idempotencia, huella)
+            if previo is not None:
+                return previo
+            self.validar_existencia_paciente(dni)
+            motivos = []
+
+            def acepta(matricula: str) -> bool:
+                motivos.append(self.__motivo_rechazo(dni, matricula, especialidad, fecha_hora))
+                return not motivos[-1]
+
+            dia = self.obtener_dia_semana_en_espanol(fecha_hora)
+            matricula = self.__balanceo.elegir(fecha_hora.date(), dia, especialidad, acepta)
+            if matricula is None:
+                if not motivos:
+                    raise MedicoNoDisponibleException(f"Ningún médico atiende {especialidad} los {dia}.")
+                self.__lanzar_rechazo(max(motivos), dni, None)
+            turno = self.__agendar_validado(dni, matricula, especialidad, fecha_hora)
+            self.__idempotencia.guardar(clave_idempotencia, huella, turno)
+            return turno
+
+    def puede_agendar(self, dni: str, matricula: str, especialidad: str, fecha_hora: datetime) -> MotivoRechazo:
+        with self.__escritura:
+            return self.__motivo_rechazo(dni, matricula, especialidad, fecha_hora)
+
+    def __motivo_rechazo(self, dni: str, matricula: str, especialidad: str, fecha_hora: datetime) -> MotivoRechazo:
+        if dni not in self.__pacientes:
+            return MotivoRechazo.PACIENTE_INEXISTENTE
+        if matricula not in self.__medicos:
+            return MotivoRechazo.MEDICO_INEXISTENTE
+        motivo = self.__motivo_franja(matricula, especialidad, fecha_hora)
+        if not motivo and self.__paciente_ocupado(dni, self.__medicos[matricula], especialidad, fecha_hora):
+            return MotivoRechazo.PACIENTE_OCUPADO
+        return motivo
+
+    def __duracion(self, medico: Medico, especialidad: str) -> timedelta:
+        return timedelta(minutes=medico.obtener_duracion_minutos(especialidad))
+
+    def __paciente_ocupado(self, dni: str, medico: Medico, especialidad: str, fecha_hora: datetime,
+                           ignorar: tuple[str, datetime] = None) -> bool:
+        fin = fecha_hora + self.__duracion(medico, especialidad)
+        return (self.__horarios_pacientes.hay_superposicion(dni, fecha_hora, fin, ignorar)
+                or self.__paciente_ocupado_en_archivo(dni, fecha_hora, fin))
+
+    def __paciente_ocupado_en_archivo(self, dni: str, inicio: datetime, fin: datetime) -> bool:
+        # Archivar saca los horarios del índice de pacientes: los anteriores al horizonte se
+        # buscan en la cubeta del paciente. Ningún turno dura más de un día.
+        horizonte = self.__archivo.obtener_horizonte() if self.__archivo is not None else None
+        desde = inicio - timedelta(days=1)
+        if horizonte is None or desde >= horizonte:
+            return False
+        archivados = self.__archivo.buscar_turnos(self.__pacientes, self.__medicos, dni=dni, desde=desde, hasta=fin)
+        return any(t.obtener_fecha_hora() + self.__duracion(t.obtener_medico(), t.obtener_especialidad()) > inicio
+                   for t in archivados)
+
+    def __motivo_franja(self, matricula: str, especialidad: str, fecha_hora: datetime) -> MotivoRechazo:
+        if (self.__indice_turnos.esta_ocupado(matricula, fecha_hora) or self.__serie_en(matricula, fecha_hora)
+                or self.__ocupado_en_archivo(matricula, fecha_hora)):
+            return MotivoRechazo.TURNO_OCUPADO
+        dia = DIAS_SEMANA[fecha_hora.weekday()]
+        if self.__medicos[matricula].obtener_especialidad_para_dia(dia) != especialidad:
+            return MotivoRechazo.ESPECIALIDAD_NO_DISPONIBLE
+        return MotivoRechazo.DISPONIBLE
+
+    def __lanzar_rechazo(self, motivo: MotivoRechazo, dni: str, matricula: str):
+        if motivo is MotivoRechazo.PACIENTE_INEXISTENTE:
+            raise PacienteNoEncontradoException(f"No se encontró paciente con DNI {dni}")
+        if motivo is MotivoRechazo.MEDICO_INEXISTENTE:
+            raise MedicoNoDisponibleException(f"No se encontró médico con matrícula {matricula}")
+        if motivo is MotivoRechazo.TURNO_OCUPADO:
+            raise TurnoOcupadoException("Turno ya ocupado.")
+        if motivo is MotivoRechazo.PACIENTE_OCUPADO:
+            raise TurnoSuperpuestoException(f"El paciente {dni} ya tiene un turno en ese horario.")
+        raise MedicoNoDisponibleException("El médico no atiende esa especialidad ese día.")
+
+    def __agendar_validado(self, dni: str, matricula: str, especialidad: str, fecha_hora: datetime) -> Turno:
+        turno = Turno(self.__pacientes[dni], self.__medicos[matricula], fecha_hora, especialidad)
+        self.__registrar_turno(turno)
+        return turno
+
+    def agendar_serie(self, dni: str, matricula: str, especialidad: str, inicio: datetime,
+                      cantidad: int, intervalo_semanas: int = 1, clave_idempotencia: str = None) -> SerieTurnos:
+        huella = ("agendar_serie", dni, matricula, especialidad, inicio, cantidad, intervalo_semanas)
+        with self.__escritura:
+            previa = self.__idempotencia.obtener(clave_idempotencia, huella)
+            if previa is not None:
+                return previa
+            self.validar_existencia_paciente(dni)
+            self.validar_existencia_medico(matricula)
+            medico = self.__medicos[matricula]
+            # Todas las ocurrencias caen el mismo día de la semana: basta una validación.
+            dia = self.obtener_dia_semana_en_espanol(inicio)
+            self.validar_especialidad_en_dia(medico, especialidad, dia)
+            serie = SerieTurnos(self.__pacientes[dni], medico, especialidad, inicio, cantidad, intervalo_semanas)
+            self.validar_serie_sin_conflictos(serie)
+            self.incorporar_serie(serie)
+            self.__idempotencia.guardar(clave_idempotencia, huella, serie)
+            return serie
+
+    def validar_serie_sin_conflictos(self, serie: SerieTurnos):
+        matricula = serie.obtener_medico().obtener_matricula()
+        hasta = serie.obtener_fin() + timedelta(minutes=1)
+        for turno in self.__indice_turnos.buscar(matricula=matricula, desde=serie.obtener_inicio(), hasta=hasta):
+            if serie.incluye(turno.obtener_fecha_hora()):
+                raise TurnoOcupadoException(f"Turno ya ocupado el {turno.obtener_fecha_hora()}.")
+        for otra in self.__series.get(matricula, []):
+            for turno in otra.ocurrencias(serie.obtener_inicio(), hasta):
+                if serie.incluye(turno.obtener_fecha_hora()):
+                    raise TurnoOcupadoException(f"Turno ya ocupado el {turno.obtener_fecha_hora()}.")
+        dni = serie.obtener_paciente().obtener_dni()
+        for turno in serie.ocurrencias():
+            if self.__paciente_ocupado(dni, serie.obtener_medico(), serie.obtener_especialidad(),
+                                       turno.obtener_fecha_hora()):
+                raise TurnoSuperpuestoException(
+                    f"El paciente {dni} ya tiene un turno superpuesto el {turno.obtener_fecha_hora()}.")
+
+    def cancelar_turno(self, matricula: str, fecha_hora: datetime, clave_idempotencia: str = None) -> Turno:
+        huella = ("cancelar_turno", matricula, fecha_hora)
+        with self.__escritura:
+            previo = self.__idempotencia.obtener(clave_idempotencia, huella)
+            if previo is not None:
+                return previo
+            turno = self.__indice_turnos.obtener_turno(matricula, fecha_hora)
+            if turno is not None:
+                self.__anular_turno(turno)
+            else:
+                serie = self.__serie_en(matricula, fecha_hora)
+                if serie is None:
+                    raise TurnoNoEncontradoException(f"No hay turno de {matricula} el {fecha_hora}")
+                turno = self.__excluir_de_serie(serie, fecha_hora)
+            self.__ocupar_con_lista_espera(matricula, turno.obtener_especialidad(), fecha_hora)
+            self.__idempotencia.guardar(clave_idempotencia, huella, turno)
+            return turno
+
+    def reprogramar_turno(self, matricula: str, fecha_hora: datetime, nueva_fecha_hora: datetime,
+                          clave_idempotencia: str = None) -> Turno:
+        huella = ("reprogramar_turno", matricula, fecha_hora, nueva_fecha_hora)
+        with self.__escritura:
+            previo = self.__idempotencia.obtener(clave_idempotencia, huella)
+            if previo is not None:
+                return previo
+            turno = self.__indice_turnos.obtener_turno(matricula, fecha_hora)
+            serie = self.__serie_en(matricula, fecha_hora) if turno is None else None
+            if turno is None and serie is None:
+                raise TurnoNoEncontradoException(f"No hay turno de {matricula} el {fecha_hora}")
+            original = turno or serie
+            self.validar_turno_no_duplicado(matricula, nueva_fecha_hora)
+            medico = original.obtener_medico()
+            dia = self.obtener_dia_semana_en_espanol(nueva_fecha_hora)
+            self.validar_especialidad_en_dia(medico, original.obtener_especialidad(), dia)
+            dni = original.obtener_paciente().obtener_dni()
+            if self.__paciente_ocupado(dni, medico, original.obtener_especialidad(), nueva_fecha_hora,
+                                       (matricula, fecha_hora)):
+                raise TurnoSuperpuestoException(f"El paciente {dni} ya tiene un turno en ese horario.")
+            nuevo = Turno(original.obtener_paciente(), medico, nueva_fecha_hora, original.obtener_especialidad())
+            if turno is not None:
+                self.__anular_turno(turno)
+            else:
+                self.__excluir_de_serie(serie, fecha_hora)
+            self.__registrar_turno(nuevo)
+            self.__ocupar_con_lista_espera(matricula, nuevo.obtener_especialidad(), fecha_hora)
+            self.__idempotencia.guardar(clave_idempotencia, huella, nuevo)
+            return nuevo
+
+    def proponer_reasignacion(self, matricula: str, especialidad: str = None, dia: str = None,
+                              desde: datetime = None) -> list[tuple[Turno, str | None]]:
+        # Turnos que perdería el médico si deja esa especialidad/día, con el médico que los tomaría.
+        with self.__escritura:
+            self.validar_existencia_medico(matricula)
+            afectados = self.__turnos_afectados(matricula, especialidad, dia, desde or datetime.now())
+            return [(turno, elegido) for turno, _, elegido in self.__planificar_reasignacion(matricula, afectados)]
+
+    def quitar_dia_medico(self, matricula: str, especialidad: str, dia: str, desde: datetime = None) -> dict:
+        return self.__cambiar_agenda(matricula, especialidad, dia, desde,
+                                     lambda medico: medico.quitar_dia(especialidad, dia))
+
+    def quitar_especialidad_medico(self, matricula: str, especialidad: str, desde: datetime = None) -> dict:
+        return self.__cambiar_agenda(matricula, especialidad, None, desde,
+                                     lambda medico: medico.quitar_especialidad(especialidad))
+
+    def dar_de_baja_medico(self, matricula: str, desde: datetime = None) -> dict:
+        def quitar_todas(medico: Medico):
+            for esp in medico.obtener_especialidades():
+                medico.quitar_especialidad(esp.obtener_especialidad())
+
+        return self.__cambiar_agenda(matricula, None, None, desde, quitar_todas)
+
+    def __cambiar_agenda(self, matricula: str, especialidad: str | None, dia: str | None, desde: datetime | None,
+                         cambio) -> dict:
+        # Cambia la agenda del médico y mueve sus turnos futuros afectados a otros médicos, todo
+        # bajo el mismo cerrojo. Los que no tienen reemplazo se cancelan.
+        with self.__escritura:
+            self.validar_existencia_medico(matricula)
+            afectados = self.__turnos_afectados(matricula, especialidad, dia, desde or datetime.now())
+            plan = self.__planificar_reasignacion(matricula, afectados)
+            cambio(self.__medicos[matricula])
+            reasignados, cancelados = [], []
+            for turno, serie, elegido in plan:
+                fecha_hora = turno.obtener_fecha_hora()
+                if serie is not None:
+                    turno = self.__excluir_de_serie(serie, fecha_hora)
+                else:
+                    self.__anular_turno(turno)
+                if elegido is None:
+                    cancelados.append(turno)
+                    continue
+                nuevo = self.__agendar_validado(turno.obtener_paciente().obtener_dni(), elegido,
+                                                turno.obtener_especialidad(), fecha_hora)
+                reasignados.append((turno, nuevo))
+            return {"reasignados": reasignados, "cancelados": cancelados}
+
+    def __turnos_afectados(self, matricula: str, especialidad: str | None, dia: str | None,
+                           desde: datetime) -> list[tuple[Turno, SerieTurnos | None]]:
+        # Por los índices del médico (y especialidad): no se recorren los turnos de los demás.
+        afectados = [(t, None) for t in self.__indice_turnos.buscar(matricula=matricula, especialidad=especialidad,
+                                                                    desde=desde)]
+        for serie in self.__series.get(matricula, ()):
+            if especialidad is None or serie.obtener_especialidad() == especialidad:
+                afectados.extend((t, serie) for t in serie.ocurrencias(desde))
+        if dia is not None:
+            afectados = [(t, s) for t, s in afectados
+                         if self.obtener_dia_semana_en_espanol(t.obtener_fecha_hora()) == dia.lower()]
+        afectados.sort(key=lambda afectado: afectado[0].obtener_fecha_hora())
+        return afectados
+
+    def __planificar_reasignacion(self, matricula: str, afectados: list[tuple[Turno, SerieTurnos | None]]
+                                  ) -> list[tuple[Turno, SerieTurnos | None, str | None]]:
+        # Cada elección suma su carga en el balanceador, así el lote se reparte; al final se
+        # descuenta porque todavía no se agendó nada.
+        plan = []
+        reservados: set[tuple[str, datetime]] = set()
+        for turno, serie in afectados:
+            fecha_hora = turno.obtener_fecha_hora()
+            dni = turno.obtener_paciente().obtener_dni()
+            especialidad = turno.obtener_especialidad()
+
+            def acepta(otra: str) -> bool:
+                if otra == matricula or (otra, fecha_hora) in reservados:
+                    return False
+                medico = self.__medicos[otra]
+                return (not self.__motivo_franja(otra, especialidad, fecha_hora)
+                        and not self.__paciente_ocupado(dni, medico, especialidad, fecha_hora,
+                                                        (matricula, fecha_hora)))
+
+            elegido = self.__balanceo.elegir(fecha_hora.date(), self.obtener_dia_semana_en_espanol(fecha_hora),
+                                             especialidad, acepta)
+            if elegido is not None:
+                reservados.add((elegido, fecha_hora))
+                self.__balanceo.sumar(elegido, fecha_hora,
+                                      self.__medicos[elegido].obtener_duracion_minutos(especialidad))
+            plan.append((turno, serie, elegido))
+        for turno, _, elegido in plan:
+            if elegido is not None:
+                self.__balanceo.sumar(elegido, turno.obtener_fecha_hora(),
+                                      -self.__medicos[elegido].obtener_duracion_minutos(turno.obtener_especialidad()))
+        return plan
+
+    def agregar_a_lista_espera(self, dni: str, especialidad: str, prioridad: int = 0,
+                               fecha_solicitud: datetime = None):
+        with self.__escritura:
+            self.validar_existencia_paciente(dni)
+            self.__lista_espera.agregar(dni, especialidad, prioridad, fecha_solicitud)
+
+    def quitar_de_lista_espera(self, dni: str, especialidad: str) -> bool:
+        with self.__escritura:
+            return self.__lista_espera.quitar(dni, especialidad)
+
+    def obtener_lista_espera(self, especialidad: str) -> list[str]:
+        return self.__lista_espera.obtener_pendientes(especialidad)
+
+    def ofrecer_turnos(self, matricula: str, fechas_horas: list[datetime]) -> list[Turno]:
+        with self.__escritura:
+            self.validar_existencia_medico(matricula)
+            medico = self.__medicos[matricula]
+            asignados = []
+            for fecha_hora in fechas_horas:
+                especialidad = medico.obtener_especialidad_para_dia(self.obtener_dia_semana_en_espanol(fecha_hora))
+                if especialidad is None:
+                    continue
+                turno = self.__ocupar_con_lista_espera(matricula, especialidad, fecha_hora)
+                if turno is not None:
+                    asignados.append(turno)
+            return asignados
+
+    def __ocupar_con_lista_espera(self, matricula: str, especialidad: str, fecha_hora: datetime) -> Turno | None:
+        # Si la franja no es válida para nadie no se recorre la lista de espera.
+        if self.__motivo_franja(matricula, especialidad, fecha_hora):
+            return None
+        asignado = []
+
+        def intentar_agendar(dni: str) -> bool:
+            if self.__motivo_rechazo(dni, matricula, especialidad, fecha_hora):
+                return False
+            asignado.append(self.__agendar_validado(dni, matricula, especialidad, fecha_hora))
+            return True
+
+        self.__lista_espera.asignar(especialidad, intentar_agendar)
+        return asignado[0] if asignado else None
+
+    def __excluir_de_serie(self, serie: SerieTurnos, fecha_hora: datetime) -> Turno:
+        historia = self.__historias_clinicas[serie.obtener_paciente().obtener_dni()]
+        historia.excluir_de_serie(serie, fecha_hora, self.__nueva_version())
+        turno = Turno(serie.obtener_paciente(), serie.obtener_medico(), fecha_hora, serie.obtener_especialidad())
+        turno.cancelar(self.__version)
+        self.__sumar_carga(turno, -1)
+        self.__eventos.publicar(TipoEvento.TURNO_CANCELADO, turno)
+        return turno
+
+    def __serie_en(self, matricula: str, fecha_hora: datetime) -> SerieTurnos | None:
+        for serie in self.__series.get(matricula, ()):
+            if serie.incluye(fecha_hora):
+                return serie
+        return None
+
+    def incorporar_turno(self, turno: Turno):
+        # Registra un turno ya validado (por ejemplo al restaurar una instantánea).
+        with self.__escritura:
+            self.__registrar_turno(turno)
+
+    def incorporar_turnos(self, turnos: list[Turno]):
+        with self.__escritura:
+            self.__nueva_version()
+            self.__turnos.extend(turnos)
+            self.__indice_turnos.agregar_varios(turnos)
+            # Una sola pasada: la duración se calcula una vez por (médico, especialidad) y la carga
+            # del balanceo se suma por (médico, día) antes de pasársela.
+            duraciones: dict[tuple[str, str], timedelta] = {}
+            horarios = []
+            cargas: dict[tuple[str, date], int] = {}
+            por_paciente: dict[str, list[Turno]] = {}
+            for turno in turnos:
+                medico = turno.obtener_medico()
+                matricula = medico.obtener_matricula()
+                especialidad = turno.obtener_especialidad()
+                duracion = duraciones.get((matricula, especialidad))
+                if duracion is None:
+                    duracion = duraciones[(matricula, especialidad)] = self.__duracion(medico, especialidad)
+                fecha_hora = turno.obtener_fecha_hora()
+                dni = turno.obtener_paciente().obtener_dni()
+                horarios.append((dni, matricula, fecha_hora, duracion))
+                clave = (matricula, fecha_hora.date())
+                cargas[clave] = cargas.get(clave, 0) + duracion // UN_MINUTO
+                por_paciente.setdefault(dni, []).append(turno)
+            self.__horarios_pacientes.agregar_varios(horarios)
+            self.__balanceo.sumar_varios(cargas)
+            for dni, propios in por_paciente.items():
+                self.__historias_clinicas[dni].agregar_turnos(propios)
+            self.__eventos.publicar_varios(TipoEvento.TURNO_AGENDADO, turnos)
+
+    def incorporar_serie(self, serie: SerieTurnos):
+        with self.__escritura:
+            self.__copiar_si_compartido()
+            self.__nueva_version()
+            self.__series.setdefault(serie.obtener_medico().obtener_matricula(), []).append(serie)
+            self.__horarios_pacientes.agregar_serie(
+                serie, self.__duracion(serie.obtener_medico(), serie.obtener_especialidad()))
+            for turno in serie.ocurrencias():
+                self.__sumar_carga(turno, 1)
+            self.__historias_clinicas[serie.obtener_paciente().obtener_dni()].agregar_serie(serie)
+            self.__eventos.publicar(TipoEvento.SERIE_AGENDADA, serie)
+
+    def incorporar_receta(self, receta: Receta):
+        with self.__escritura:
+            receta.sellar(self.__nueva_version())
+            self.__recetas.agregar(receta)
+            self.__historias_clinicas[receta.obtener_paciente().obtener_dni()].agregar_receta(receta)
+            self.__eventos.publicar(TipoEvento.RECETA_EMITIDA, receta)
+
+    def __registrar_turno(self, turno: Turno):
+        self.__nueva_version()
         self.__turnos.append(turno)
-        self.__historias_clinicas[dni].agregar_turno(turno)
+        self.__indice_turnos.agregar(turno)
+        self.__horarios_pacientes.agregar(
+            turno.obtener_paciente().obtener_dni(), turno.obtener_medico().obtener_matricula(),
+            turno.obtener_fecha_hora(), self.__duracion(turno.obtener_medico(), turno.obtener_especialidad()))
+        self.__sumar_carga(turno, 1)
+        self.__historias_clinicas[turno.obtener_paciente().obtener_dni()].agregar_turno(turno)
+        self.__eventos.publicar(TipoEvento.TURNO_AGENDADO, turno)
+
+    def __sumar_carga(self, turno: Turno, signo: int):
+        medico = turno.obtener_medico()
+        minutos = medico.obtener_duracion_minutos(turno.obtener_especialidad())
+        self.__balanceo.sumar(medico.obtener_matricula(), turno.obtener_fecha_hora(), signo * minutos)
+
+    def __anular_turno(self, turno: Turno):
+        # La historia se trae antes de quitar el turno del índice, por si estaba en disco.
+        historia = self.__historias_clinicas[turno.obtener_paciente().obtener_dni()]
+        turno.cancelar(self.__nueva_version())
+        self.__indice_turnos.quitar(turno)
+        self.__horarios_pacientes.quitar(turno.obtener_paciente().obtener_dni(),
+                                         turno.obtener_medico().obtener_matricula(), turno.obtener_fecha_hora())
+        self.__sumar_carga(turno, -1)
+        historia.quitar_turno(turno)
+        self.__eventos.publicar(TipoEvento.TURNO_CANCELADO, turno)
+        self.__turnos_cancelados += 1
+        if self.__turnos_cancelados * 4 > len(self.__turnos):
+            self.__turnos = [t for t in self.__turnos if not t.esta_cancelado()]
+            self.__turnos_cancelados = 0
+
+    def emitir_receta(self, dni, matricula, medicamentos, clave_idempotencia: str = None) -> Receta:
+        huella = ("emitir_receta", dni, matricula, tuple(medicamentos or ()))
+        with self.__escritura:
+            previa = self.__idempotencia.obtener(clave_idempotencia, huella)
+            if previa is not None:
+                return previa
+            self.validar_existencia_paciente(dni)
+            self.validar_existencia_medico(matricula)
+            if not medicamentos:
+                raise RecetaInvalidaException("Lista de medicamentos vacía.")
+            receta = Receta(self.__pacientes[dni], self.__medicos[matricula], medicamentos)
+            self.incorporar_receta(receta)
+            self.__idempotencia.guardar(clave_idempotencia, huella, receta)
+            return receta
+
+    def obtener_receta(self, id_receta: int) -> Receta | None:
+        receta = self.__recetas.obtener(id_receta, self.__pacientes, self.__medicos)
+        if receta is None and self.__archivo is not None:
+            # Recetas archivadas por una clínica anterior sobre el mismo archivo.
+            return self.__archivo.buscar_receta(id_receta, self.__pacientes, self.__medicos)
+        return receta
+
+    def obtener_recetas_por_paciente(self, dni: str) -> list[Receta]:
+        historia = self.__historias_clinicas.get(dni)
+        return historia.obtener_recetas() if historia is not None else []
+
+    def obtener_recetas_por_medico(self, matricula: str, despues_de: int = 0, limite: int = 50) -> list[Receta]:
+        return [self.obtener_receta(i) for i in self.__recetas.ids_por_medico(matricula, despues_de, limite)]
+
+    def obtener_recetas_por_fecha(self, desde: datetime = None, hasta: datetime = None, despues_de: int = 0,
+                                  limite: int = 50) -> list[Receta]:
+        # Puede reordenar el índice por fecha: se hace bajo el cerrojo.
+        with self.__escritura:
+            ids = self.__recetas.ids_por_fecha(desde, hasta, despues_de, limite)
+        return [self.obtener_receta(i) for i in ids]
+
+    def obtener_turnos(self, incluir_series: bool = True, incluir_archivados: bool = True):
+        with self.__escritura:
+            return self.__listar_turnos(incluir_series, incluir_archivados)
+
+    def __listar_turnos(self, incluir_series: bool, incluir_archivados: bool) -> list[Turno]:
+        turnos = []
+        if incluir_archivados and self.__archivo is not None:
+            turnos = self.__archivo.buscar_turnos(self.__pacientes, self.__medicos)
+        turnos.extend(t for t in self.__turnos if not t.esta_cancelado())
+        if not incluir_series:
+            return turnos
+        for series in self.__series.values():
+            for serie in series:
+                turnos.extend(serie.ocurrencias())
+        return turnos
+
+    def obtener_series(self) -> list[SerieTurnos]:
+        with self.__escritura:
+            return [serie for series in self.__series.values() for serie in series]
 
-    def emitir_receta(self, dni, matricula, medicamentos):
-        self.validar_existencia_paciente(dni)
-        self.validar_existencia_medico(matricula)
-        if not medicamentos:
-            raise RecetaInvalidaException("Lista de medicamentos vacía.")
-        receta = Receta(self.__pacientes[dni], self.__medicos[matricula], medicamentos)
-        self.__historias_clinicas[dni].agregar_receta(receta)
+    def buscar_turnos(self, dni: str = None, matricula: str = None, especialidad: str = None,
+                      desde: datetime = None, hasta: datetime = None) -> list[Turno]:
+        with self.__escritura:
+            return self.__buscar_turnos(dni, matricula, especialidad, desde, hasta)
 
-    def obtener_turnos(self):
-        return list(self.__turnos)
+    def __buscar_turnos(self, dni: str | None, matricula: str | None, especialidad: str | None,
+                        desde: datetime | None, hasta: datetime | None) -> list[Turno]:
+        turnos = self.__indice_turnos.buscar(dni, matricula, especialidad, desde, hasta)
+        series = self.__series.get(matricula, []) if matricula is not None else self.obtener_series()
+        expandidos = [
+            turno
+            for serie in series
+            if (dni is None or serie.obtener_paciente().obtener_dni() == dni)
+            and (especialidad is None or serie.obtener_especialidad() == especialidad)
+            for turno in serie.ocurrencias(desde, hasta)
+        ]
+        horizonte = self.__archivo.obtener_horizonte() if self.__archivo is not None else None
+        if horizonte is not None and (desde is None or desde < horizonte):
+            expandidos.extend(self.__archivo.buscar_turnos(self.__pacientes, self.__medicos, dni, matricula,
+                                                           especialidad, desde, hasta))
+        if expandidos:
+            turnos.extend(expandidos)
+            turnos.sort(key=lambda t: t.obtener_fecha_hora())
+        return turnos
 
     def obtener_historia_clinica(self, dni: str):
         return self.__historias_clinicas.get(dni, None)
@@ -75,13 +796,12 @@ class Clinica:
             raise MedicoNoDisponibleException(f"No se encontró médico con matrícula {matricula}")
 
     def validar_turno_no_duplicado(self, matricula: str, fecha_hora: datetime):
-        for turno in self.__turnos:
-            if turno.obtener_medico().obtener_matricula() == matricula and turno.obtener_fecha_hora() == fecha_hora:
-                raise TurnoOcupadoException("Turno ya ocupado.")
+        if (self.__indice_turnos.esta_ocupado(matricula, fecha_hora) or self.__serie_en(matricula, fecha_hora)
+                or self.__ocupado_en_archivo(matricula, fecha_hora)):
+            raise TurnoOcupadoException("Turno ya ocupado.")
 
     def obtener_dia_semana_en_espanol(self, fecha_hora: datetime) -> str:
-        dias = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"]
-        return dias[fecha_hora.weekday()]
+        return DIAS_SEMANA[fecha_hora.weekday()]
 
     def validar_especialidad_en_dia(self, medico: Medico, especialidad_solicitada, dia):
         especialidad_real = medico.obtener_especialidad_para_dia(dia)
@@ -0,0 +1,123 @@
+from bisect import bisect_left, insort
+from datetime import datetime
+from src.turno import Turno
+
+
+class IndiceTurnos:
+    def __init__(self):
+        self.__por_paciente: dict[str, set[Turno]] = {}
+        self.__por_medico: dict[str, set[Turno]] = {}
+        self.__por_especialidad: dict[str, set[Turno]] = {}
+        self.__ocupados: dict[tuple[str, datetime], Turno] = {}
+        self.__por_fecha: list[tuple[datetime, int, Turno]] = []
+        self.__secuencia = 0
+        self.__cancelados = 0
+
+    def agregar(self, turno: Turno):
+        self.__por_paciente.setdefault(turno.obtener_paciente().obtener_dni(), set()).add(turno)
+        matricula = turno.obtener_medico().obtener_matricula()
+        self.__por_medico.setdefault(matricula, set()).add(turno)
+        self.__por_especialidad.setdefault(turno.obtener_especialidad(), set()).add(turno)
+        self.__ocupados[(matricula, turno.obtener_fecha_hora())] = turno
+        self.__secuencia += 1
+        insort(self.__por_fecha, (turno.obtener_fecha_hora(), self.__secuencia, turno))
+
+    def agregar_varios(self, turnos: list[Turno]):
+        # Carga masiva: se agregan todos al final y se ordena una sola vez.
+        por_paciente, por_medico = self.__por_paciente, self.__por_medico
+        por_especialidad, ocupados = self.__por_especialidad, self.__ocupados
+        nuevos = []
+        for turno in turnos:
+            matricula = turno.obtener_medico().obtener_matricula()
+            fecha_hora = turno.obtener_fecha_hora()
+            por_paciente.setdefault(turno.obtener_paciente().obtener_dni(), set()).add(turno)
+            por_medico.setdefault(matricula, set()).add(turno)
+            por_especialidad.setdefault(turno.obtener_especialidad(), set()).add(turno)
+            ocupados[(matricula, fecha_hora)] = turno
+            self.__secuencia += 1
+            nuevos.append((fecha_hora, self.__secuencia, turno))
+        self.__por_fecha.extend(nuevos)
+        # La secuencia es única, así que la comparación nunca llega al turno.
+        self.__por_fecha.sort()
+
+    def quitar(self, turno: Turno):
+        # Los conjuntos se actualizan en O(1); en la lista por fecha el turno
+        # cancelado queda como lápida hasta la próxima compactación.
+        matricula = turno.obtener_medico().obtener_matricula()
+        self.__por_paciente[turno.obtener_paciente().obtener_dni()].discard(turno)
+        self.__por_medico[matricula].discard(turno)
+        self.__por_especialidad[turno.obtener_especialidad()].discard(turno)
+        del self.__ocupados[(matricula, turno.obtener_fecha_hora())]
+        self.__cancelados += 1
+        if self.__cancelados * 4 > len(self.__por_fecha):
+            self.__por_fecha = [e for e in self.__por_fecha if not e[2].esta_cancelado()]
+            self.__cancelados = 0
+
+    def quitar_anteriores(self, horizonte: datetime) -> list[Turno]:
+        # Saca de una vez todos los turnos anteriores al horizonte (por ejemplo al archivarlos).
+        fin = bisect_left(self.__por_fecha, (horizonte,))
+        quitados = []
+        for _, _, turno in self.__por_fecha[:fin]:
+            if turno.esta_cancelado():
+                self.__cancelados -= 1
+                continue
+            matricula = turno.obtener_medico().obtener_matricula()
+            for indice, clave in ((self.__por_paciente, turno.obtener_paciente().obtener_dni()),
+                                  (self.__por_medico, matricula),
+                                  (self.__por_especialidad, turno.obtener_especialidad())):
+                indice[clave].discard(turno)
+                if not indice[clave]:
+                    del indice[clave]
+            del self.__ocupados[(matricula, turno.obtener_fecha_hora())]
+            quitados.append(turno)
+        del self.__por_fecha[:fin]
+        return quitados
+
+    def esta_ocupado(self, matricula: str, fecha_hora: datetime) -> bool:
+        return (matricula, fecha_hora) in self.__ocupados
+
+    def obtener_turno(self, matricula: str, fecha_hora: datetime) -> Turno | None:
+        return self.__ocupados.get((matricula, fecha_hora))
+
+    def buscar(self, dni: str = None, matricula: str = None, especialidad: str = None,
+               desde: datetime = None, hasta: datetime = None) -> list[Turno]:
+        conjuntos = []
+        for indice, clave in ((self.__por_paciente, dni),
+                              (self.__por_medico, matricula),
+                              (self.__por_especialidad, especialidad)):
+            if clave is not None:
+                conjunto = indice.get(clave)
+                if not conjunto:
+                    return []
+                conjuntos.append(conjunto)
+
+        # El rango de fechas es semiabierto: [desde, hasta).
+        inicio, fin = self.__rango(desde, hasta)
+        conjuntos.sort(key=len)
+
+        if not conjuntos or fin - inicio <= len(conjuntos[0]):
+            candidatos = (t for _, _, t in self.__por_fecha[inicio:fin])
+            return [t for t in candidatos
+                    if not t.esta_cancelado() and all(t in c for c in conjuntos)]
+
+        mas_selectivo, resto = conjuntos[0], conjuntos[1:]
+        resultado = [
+            t for t in mas_selectivo
+            if all(t in c for c in resto) and self.__en_rango(t, desde, hasta)
+        ]
+        resultado.sort(key=lambda t: t.obtener_fecha_hora())
+        return resultado
+
+    def __rango(self, desde: datetime, hasta: datetime) -> tuple[int, int]:
+        inicio = 0 if desde is None else bisect_left(self.__por_fecha, (desde,))
+        fin = len(self.__por_fecha) if hasta is None else bisect_left(self.__por_fecha, (hasta,))
+        return inicio, max(inicio, fin)
+
+    @staticmethod
+    def __en_rango(turno: Turno, desde: datetime, hasta: datetime) -> bool:
+        fecha_hora = turno.obtener_fecha_hora()
+        if desde is not None and fecha_hora < desde:
+            return False
+        if hasta is not None and fecha_hora >= hasta:
+            return False
+        return True
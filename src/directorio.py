@@ -0,0 +1,49 @@
+from src.medico import Medico
+from src.busqueda import normalizar
+
+
+class DirectorioMedicos:
+    def __init__(self):
+        self.__por_nombre: dict[str, set[str]] = {}
+        self.__por_especialidad: dict[str, set[str]] = {}
+        self.__por_dia: dict[str, set[str]] = {}
+        self.__por_especialidad_dia: dict[tuple[str, str], set[str]] = {}
+        self.__claves: dict[str, list[tuple[dict, object]]] = {}
+
+    def actualizar(self, medico: Medico):
+        matricula = medico.obtener_matricula()
+        self.quitar(matricula)
+        claves = [(self.__por_nombre, token) for token in set(normalizar(medico.obtener_nombre()).split())]
+        for especialidad in medico.obtener_especialidades():
+            tipo = normalizar(especialidad.obtener_especialidad())
+            claves.append((self.__por_especialidad, tipo))
+            for dia in especialidad.obtener_dias():
+                dia = normalizar(dia)
+                claves.append((self.__por_dia, dia))
+                claves.append((self.__por_especialidad_dia, (tipo, dia)))
+        for indice, clave in claves:
+            indice.setdefault(clave, set()).add(matricula)
+        self.__claves[matricula] = claves
+
+    def quitar(self, matricula: str):
+        for indice, clave in self.__claves.pop(matricula, ()):
+            conjunto = indice.get(clave)
+            if conjunto is not None:
+                conjunto.discard(matricula)
+                if not conjunto:
+                    del indice[clave]
+
+    def buscar(self, nombre: str = None, especialidad: str = None, dia: str = None) -> list[str]:
+        conjuntos = []
+        if nombre is not None:
+            conjuntos.extend(self.__por_nombre.get(token, set()) for token in normalizar(nombre).split())
+        if especialidad is not None and dia is not None:
+            conjuntos.append(self.__por_especialidad_dia.get((normalizar(especialidad), normalizar(dia)), set()))
+        elif especialidad is not None:
+            conjuntos.append(self.__por_especialidad.get(normalizar(especialidad), set()))
+        elif dia is not None:
+            conjuntos.append(self.__por_dia.get(normalizar(dia), set()))
+        if not conjuntos:
+            return sorted(self.__claves)
+        conjuntos.sort(key=len)
+        return sorted(m for m in conjuntos[0] if all(m in c for c in conjuntos[1:]))
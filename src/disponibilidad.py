@@ -0,0 +1,120 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from src.clinica import Clinica, DIAS_SEMANA
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+
+
+def _franjas_libres(tarea: tuple) -> tuple[str, bytes]:
+    matricula, dias_habiles, ocupados, primer_dia_semana, cantidad_dias, minuto_inicio, minuto_fin, duracion = tarea
+    # 'ocupados' trae pares (inicio, fin) en minutos. Se funden en intervalos disjuntos y
+    # ordenados: así alcanza un puntero que avanza junto con las franjas.
+    extremos = array("q", ocupados)
+    intervalos: list[list[int]] = []
+    for inicio, fin in sorted(zip(extremos[::2], extremos[1::2])):
+        if intervalos and inicio <= intervalos[-1][1]:
+            intervalos[-1][1] = max(intervalos[-1][1], fin)
+        else:
+            intervalos.append([inicio, fin])
+    libres = array("q")
+    actual = 0
+    for dia in range(cantidad_dias):
+        if not dias_habiles >> ((primer_dia_semana + dia) % 7) & 1:
+            continue
+        base = dia * 1440
+        for minuto in range(base + minuto_inicio, base + minuto_fin - duracion + 1, duracion):
+            while actual < len(intervalos) and intervalos[actual][1] <= minuto:
+                actual += 1
+            if actual == len(intervalos) or intervalos[actual][0] >= minuto + duracion:
+                libres.append(minuto)
+    return matricula, libres.tobytes()
+
+
+class Disponibilidad:
+    def __init__(self, desde: date, libres: dict[str, array]):
+        self.__origen = datetime(desde.year, desde.month, desde.day)
+        self.__libres = libres
+
+    def obtener_matriculas(self) -> list[str]:
+        return list(self.__libres)
+
+    def cantidad_libres(self, matricula: str) -> int:
+        return len(self.__libres.get(matricula, ()))
+
+    def franjas(self, matricula: str) -> list[datetime]:
+        return [self.__origen + timedelta(minutes=m) for m in self.__libres.get(matricula, ())]
+
+
+def preparar_tareas(clinica: Clinica, desde: date, hasta: date, hora_inicio: int = 8, hora_fin: int = 18,
+                    duracion_minutos: int = 30) -> list[tuple]:
+    # Cada médico se reduce a una máscara de días y los intervalos [inicio, fin) en minutos
+    # de sus turnos, con la duración de cada especialidad: no se serializan objetos Medico
+    # ni Turno hacia los procesos.
+    origen = datetime(desde.year, desde.month, desde.day)
+    fin = datetime(hasta.year, hasta.month, hasta.day)
+    cantidad_dias = (hasta - desde).days
+    un_minuto = timedelta(minutes=1)
+    tareas = []
+    for medico in clinica.obtener_medicos():
+        dias_habiles = 0
+        duracion_maxima = 0
+        for numero, dia in enumerate(DIAS_SEMANA):
+            if medico.obtener_especialidad_para_dia(dia) is not None:
+                dias_habiles |= 1 << numero
+        for especialidad in medico.obtener_especialidades():
+            duracion_maxima = max(duracion_maxima, especialidad.obtener_duracion_minutos())
+        matricula = medico.obtener_matricula()
+        ocupados = array("q")
+        # Un turno que empezó antes de 'desde' todavía puede ocupar sus primeros minutos.
+        for turno in clinica.buscar_turnos(matricula=matricula, desde=origen - duracion_maxima * un_minuto,
+                                           hasta=fin):
+            comienzo = turno.obtener_fecha_hora() - origen
+            final = comienzo + medico.obtener_duracion_minutos(turno.obtener_especialidad()) * un_minuto
+            ocupados.extend((comienzo // un_minuto, -(-final // un_minuto)))
+        tareas.append((matricula, dias_habiles, ocupados.tobytes(), desde.weekday(), cantidad_dias,
+                       hora_inicio * 60, hora_fin * 60, duracion_minutos))
+    return tareas
+
+
+def calcular_disponibilidad(clinica: Clinica, desde: date, hasta: date, hora_inicio: int = 8, hora_fin: int = 18,
+                            duracion_minutos: int = 30, procesos: int = None) -> Disponibilidad:
+    tareas = preparar_tareas(clinica, desde, hasta, hora_inicio, hora_fin, duracion_minutos)
+    procesos = procesos or os.cpu_count() or 1
+    if procesos == 1 or len(tareas) < 2:
+        resultados = map(_franjas_libres, tareas)
+        return Disponibilidad(desde, {m: array("q", libres) for m, libres in resultados})
+    bloque = max(1, len(tareas) // (procesos * 4))
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        resultados = ejecutor.map(_franjas_libres, tareas, chunksize=bloque)
+        return Disponibilidad(desde, {m: array("q", libres) for m, libres in resultados})
+
+
+def medir_aceleracion(cantidad_medicos: int = 2_000, dias: int = 120) -> dict[int, float]:
+    clinica = Clinica()
+    clinica.agregar_paciente(Paciente("1", "Paciente de prueba", "01/01/1980"))
+    for numero in range(cantidad_medicos):
+        medico = Medico(f"MP-{numero}", f"Médico {numero}", "Clínica médica")
+        medico.agregar_especialidad(Especialidad("Clínica médica", DIAS_SEMANA[numero % 3:numero % 3 + 4]))
+        clinica.agregar_medico(medico)
+    desde = date(2025, 1, 1)
+    hasta = desde + timedelta(days=dias)
+    tiempos = {}
+    for procesos in sorted({1, 2, os.cpu_count() or 1}):
+        comienzo = time.perf_counter()
+        calcular_disponibilidad(clinica, desde, hasta, procesos=procesos)
+        tiempos[procesos] = time.perf_counter() - comienzo
+    return tiempos
+
+
+if __name__ == "__main__":
+    tiempos = medir_aceleracion()
+    print(f"Núcleos disponibles: {os.cpu_count()}")
+    for procesos, segundos in tiempos.items():
+        print(f"{procesos} proceso(s): {segundos:.2f} s (aceleración x{tiempos[1] / segundos:.2f})")
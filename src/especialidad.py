@@ -1,12 +1,25 @@
 import unittest
+
+DURACION_PREDETERMINADA = 30
+
+
 class Especialidad:
-    def __init__(self, tipo: str, dias: list[str]):
+    def __init__(self, tipo: str, dias: list[str], duracion_minutos: int = DURACION_PREDETERMINADA):
+        if duracion_minutos < 1:
+            raise ValueError("La duración del turno debe ser positiva")
         self.__tipo = tipo
         self.__dias = [dia.lower() for dia in dias]
+        self.__duracion_minutos = duracion_minutos
 
     def obtener_especialidad(self) -> str:
         return self.__tipo
 
+    def obtener_dias(self) -> list[str]:
+        return list(self.__dias)
+
+    def obtener_duracion_minutos(self) -> int:
+        return self.__duracion_minutos
+
     def verificar_dia(self, dia: str) -> bool:
         return dia.lower() in self.__dias
 
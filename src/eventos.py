@@ -0,0 +1,257 @@
+import threading
+from collections import deque
+from datetime import datetime
+from enum import Enum
+from src.exepciones import SecuenciaNoDisponibleError
+
+
+class TipoEvento(Enum):
+    PACIENTE_AGREGADO = "paciente_agregado"
+    MEDICO_AGREGADO = "medico_agregado"
+    TURNO_AGENDADO = "turno_agendado"
+    TURNO_CANCELADO = "turno_cancelado"
+    SERIE_AGENDADA = "serie_agendada"
+    RECETA_EMITIDA = "receta_emitida"
+
+
+class PoliticaDesborde(Enum):
+    BLOQUEAR = "bloquear"
+    DESCARTAR_NUEVOS = "descartar_nuevos"
+    DESCARTAR_ANTIGUOS = "descartar_antiguos"
+
+
+class Evento:
+    def __init__(self, secuencia: int, tipo: TipoEvento, entidad, fecha: datetime = None):
+        self.__secuencia = secuencia
+        self.__tipo = tipo
+        self.__entidad = entidad
+        self.__fecha = fecha or datetime.now()
+
+    def obtener_secuencia(self) -> int:
+        return self.__secuencia
+
+    def obtener_tipo(self) -> TipoEvento:
+        return self.__tipo
+
+    def obtener_entidad(self):
+        return self.__entidad
+
+    def obtener_fecha(self) -> datetime:
+        return self.__fecha
+
+    def __str__(self):
+        return f"#{self.__secuencia} {self.__tipo.value}: {self.__entidad}"
+
+
+class Suscripcion:
+    def __init__(self, canal: "CanalEventos", capacidad: int, politica: PoliticaDesborde,
+                 tipos: set[TipoEvento] | None):
+        if capacidad < 1:
+            raise ValueError("La capacidad de la suscripción debe ser positiva")
+        self.__canal = canal
+        self.__capacidad = capacidad
+        self.__politica = politica
+        self.__tipos = tipos
+        self.__pendientes: deque[Evento] = deque()
+        self.__condicion = threading.Condition()
+        # Eventos publicados que todavía no pasaron por 'entregar' (que con BLOQUEAR espera).
+        # Los vacía un solo hilo a la vez, así llegan en orden.
+        self.__buzon: deque[Evento] = deque()
+        self.__vaciando = threading.Lock()
+        self.__descartados = 0
+        self.__ultima_secuencia = 0
+        self.__cerrada = False
+
+    def acepta(self, evento: Evento) -> bool:
+        return self.__tipos is None or evento.obtener_tipo() in self.__tipos
+
+    def entregar(self, evento: Evento):
+        with self.__condicion:
+            if self.__politica is PoliticaDesborde.BLOQUEAR:
+                # Contrapresión: quien publica espera a que el suscriptor consuma.
+                while len(self.__pendientes) >= self.__capacidad and not self.__cerrada:
+                    self.__condicion.wait()
+            elif len(self.__pendientes) >= self.__capacidad:
+                self.__descartados += 1
+                if self.__politica is PoliticaDesborde.DESCARTAR_NUEVOS:
+                    return
+                self.__pendientes.popleft()
+            if self.__cerrada:
+                return
+            self.__pendientes.append(evento)
+            self.__condicion.notify_all()
+
+    def encolar(self, eventos: list[Evento]):
+        # No espera: lo llama el canal bajo su cerrojo.
+        self.__buzon.extend(e for e in eventos if self.acepta(e))
+
+    def vaciar_buzon(self):
+        # Si otro hilo lo está vaciando, ese entrega también lo recién encolado: se vuelve a
+        # mirar el buzón después de soltar el cerrojo para no dejar nada atrás.
+        while self.__buzon and self.__vaciando.acquire(blocking=False):
+            try:
+                while self.__buzon:
+                    self.entregar(self.__buzon.popleft())
+            finally:
+                self.__vaciando.release()
+
+    def precargar(self, eventos: list[Evento]):
+        # La reanudación entrega el historial pendiente completo, aunque supere la capacidad.
+        with self.__condicion:
+            self.__pendientes.extend(e for e in eventos if self.acepta(e))
+
+    def obtener(self, espera: float | None = 0) -> Evento | None:
+        with self.__condicion:
+            if not self.__pendientes and espera != 0 and not self.__cerrada:
+                self.__condicion.wait_for(lambda: self.__pendientes or self.__cerrada, espera)
+            if not self.__pendientes:
+                return None
+            evento = self.__pendientes.popleft()
+            self.__ultima_secuencia = evento.obtener_secuencia()
+            self.__condicion.notify_all()
+            return evento
+
+    def obtener_pendientes(self) -> list[Evento]:
+        with self.__condicion:
+            eventos = list(self.__pendientes)
+            self.__pendientes.clear()
+            if eventos:
+                self.__ultima_secuencia = eventos[-1].obtener_secuencia()
+            self.__condicion.notify_all()
+            return eventos
+
+    def cantidad_pendientes(self) -> int:
+        return len(self.__pendientes)
+
+    def obtener_descartados(self) -> int:
+        return self.__descartados
+
+    def obtener_ultima_secuencia(self) -> int:
+        return self.__ultima_secuencia
+
+    def esta_cerrada(self) -> bool:
+        return self.__cerrada
+
+    def cerrar(self):
+        with self.__condicion:
+            self.__cerrada = True
+            self.__condicion.notify_all()
+        self.__canal.desuscribir(self)
+
+
+class CanalEventos:
+    # Publicar deja el evento en el buzón de cada suscriptor de ese momento; la entrega (que con
+    # BLOQUEAR puede esperar al suscriptor) se hace aparte y por suscriptor: uno lento sólo
+    # frena al hilo que le está entregando. Con 'diferir_entrega' la hace quien creó el canal
+    # llamando a entregar_pendientes(), por ejemplo después de soltar sus cerrojos.
+    def __init__(self, retencion: int = 10000, diferir_entrega: bool = False):
+        self.__secuencia = 0
+        self.__historial: deque[Evento] = deque(maxlen=retencion)
+        self.__suscripciones: list[Suscripcion] = []
+        self.__cerrojo = threading.Lock()
+        self.__diferir_entrega = diferir_entrega
+        # Suscripciones con eventos en el buzón (un dict como conjunto ordenado).
+        self.__por_entregar: dict[Suscripcion, None] = {}
+
+    def publicar(self, tipo: TipoEvento, entidad) -> Evento:
+        with self.__cerrojo:
+            self.__secuencia += 1
+            evento = Evento(self.__secuencia, tipo, entidad)
+            self.__historial.append(evento)
+            self.__encolar([evento], self.__suscripciones)
+        if not self.__diferir_entrega:
+            self.entregar_pendientes()
+        return evento
+
+    def publicar_varios(self, tipo: TipoEvento, entidades: list):
+        with self.__cerrojo:
+            suscripciones = list(self.__suscripciones)
+            primera = self.__secuencia + 1
+            self.__secuencia += len(entidades)
+            # Sin suscriptores sólo se materializan los eventos que entran en el historial.
+            desde = 0 if suscripciones else max(0, len(entidades) - (self.__historial.maxlen or 0))
+            fecha = datetime.now()
+            eventos = [Evento(primera + i, tipo, entidades[i], fecha) for i in range(desde, len(entidades))]
+            self.__historial.extend(eventos)
+            self.__encolar(eventos, suscripciones)
+        if not self.__diferir_entrega:
+            self.entregar_pendientes()
+
+    def entregar_pendientes(self):
+        with self.__cerrojo:
+            suscripciones = list(self.__por_entregar)
+            self.__por_entregar.clear()
+        for suscripcion in suscripciones:
+            suscripcion.vaciar_buzon()
+
+    def __encolar(self, eventos: list[Evento], suscripciones: list[Suscripcion]):
+        for suscripcion in suscripciones:
+            suscripcion.encolar(eventos)
+            self.__por_entregar[suscripcion] = None
+
+    def suscribir(self, capacidad: int = 1000, politica: PoliticaDesborde = PoliticaDesborde.DESCARTAR_ANTIGUOS,
+                  tipos: list[TipoEvento] = None, desde: int = None) -> Suscripcion:
+        suscripcion = Suscripcion(self, capacidad, politica, set(tipos) if tipos else None)
+        with self.__cerrojo:
+            if desde is not None:
+                # Reanudación: se reenvían los eventos posteriores a 'desde' que sigan en el historial.
+                if desde > self.__secuencia or (desde < self.__secuencia and (
+                        not self.__historial or self.__historial[0].obtener_secuencia() > desde + 1)):
+                    raise SecuenciaNoDisponibleError(f"Los eventos posteriores a {desde} ya no están disponibles")
+                suscripcion.precargar([e for e in self.__historial if e.obtener_secuencia() > desde])
+            self.__suscripciones.append(suscripcion)
+        return suscripcion
+
+    def desuscribir(self, suscripcion: Suscripcion):
+        with self.__cerrojo:
+            if suscripcion in self.__suscripciones:
+                self.__suscripciones.remove(suscripcion)
+
+    def obtener_ultima_secuencia(self) -> int:
+        return self.__secuencia
+
+    def cantidad_retenida(self) -> int:
+        return len(self.__historial)
+
+    def obtener_eventos(self, desde: int = 0) -> list[Evento]:
+        with self.__cerrojo:
+            return [e for e in self.__historial if e.obtener_secuencia() > desde]
+
+    def __getstate__(self):
+        # Las suscripciones y el cerrojo son locales al proceso y no se serializan.
+        estado = self.__dict__.copy()
+        estado["_CanalEventos__suscripciones"] = []
+        estado["_CanalEventos__por_entregar"] = {}
+        del estado["_CanalEventos__cerrojo"]
+        return estado
+
+    def __setstate__(self, estado):
+        self.__dict__.update(estado)
+        self.__cerrojo = threading.Lock()
+
+
+class CerrojoEscritura:
+    # Cerrojo reentrante de quien escribe y publica en un canal con entrega diferida. Al
+    # soltarlo del todo, si se publicó algo mientras estaba tomado, se entregan los eventos ya
+    # sin el cerrojo: un suscriptor lento (BLOQUEAR) frena sólo al hilo que le está entregando,
+    # no a las demás escrituras ni a las lecturas, y un suscriptor que vuelve a llamar a la
+    # clínica no se traba.
+    def __init__(self, canal: CanalEventos):
+        self.__canal = canal
+        self.__cerrojo = threading.RLock()
+        self.__profundidad = 0
+        self.__secuencia = 0
+
+    def __enter__(self):
+        self.__cerrojo.acquire()
+        self.__profundidad += 1
+        if self.__profundidad == 1:
+            self.__secuencia = self.__canal.obtener_ultima_secuencia()
+        return self
+
+    def __exit__(self, *excepcion):
+        self.__profundidad -= 1
+        publico = self.__profundidad == 0 and self.__canal.obtener_ultima_secuencia() != self.__secuencia
+        self.__cerrojo.release()
+        if publico:
+            self.__canal.entregar_pendientes()
@@ -61,3 +61,9 @@ class RecetaInvalidaError(Exception):
     pass
 class FechaIncorrectaError(Exception):
     pass   
+class SecuenciaNoDisponibleError(Exception):
+    pass
+class ClaveIdempotenciaReutilizadaError(ValueError):
+    pass
+class TurnoSuperpuestoException(TurnoOcupadoException):
+    pass
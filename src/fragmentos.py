@@ -0,0 +1,254 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import time
+import zlib
+from datetime import datetime, timedelta
+from multiprocessing import Pipe, Process
+from src.clinica import Clinica
+from src.historiaclinica import HistoriaClinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.turno import Turno
+from src.indice_horarios import IndiceHorarios
+from src.exepciones import TurnoSuperpuestoException
+
+
+def _atender_fragmento(conexion):
+    clinica = Clinica()
+    while True:
+        mensaje = conexion.recv()
+        if mensaje is None:
+            break
+        metodo, argumentos, es_lote = mensaje
+        funcion = getattr(clinica, metodo)
+        if es_lote:
+            # En lote solo se devuelven los errores para no serializar cada resultado.
+            errores = []
+            for args in argumentos:
+                try:
+                    funcion(*args)
+                    errores.append(None)
+                except Exception as e:
+                    errores.append(e)
+            conexion.send((True, errores))
+            continue
+        try:
+            conexion.send((True, funcion(*argumentos)))
+        except Exception as e:
+            conexion.send((False, e))
+    conexion.close()
+
+
+class ClinicaFragmentada:
+    def __init__(self, cantidad_fragmentos: int):
+        if cantidad_fragmentos < 1:
+            raise ValueError("Se necesita al menos un fragmento")
+        self.__conexiones = []
+        self.__procesos = []
+        # Cada fragmento sólo ve los turnos de sus médicos: la superposición de un paciente
+        # entre fragmentos se controla acá, con los horarios de todos sus turnos.
+        self.__pacientes: dict[str, Paciente] = {}
+        self.__medicos: dict[str, Medico] = {}
+        self.__horarios_pacientes = IndiceHorarios()
+        for _ in range(cantidad_fragmentos):
+            local, remota = Pipe()
+            proceso = Process(target=_atender_fragmento, args=(remota,), daemon=True)
+            proceso.start()
+            remota.close()
+            self.__conexiones.append(local)
+            self.__procesos.append(proceso)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+    def cerrar(self):
+        for conexion in self.__conexiones:
+            conexion.send(None)
+            conexion.close()
+        for proceso in self.__procesos:
+            proceso.join()
+        self.__conexiones = []
+        self.__procesos = []
+
+    def cantidad_fragmentos(self) -> int:
+        return len(self.__conexiones)
+
+    def fragmento_de(self, matricula: str) -> int:
+        return zlib.crc32(matricula.encode()) % len(self.__conexiones)
+
+    def agregar_paciente(self, paciente: Paciente):
+        # Los pacientes se replican: cualquier médico puede atender a cualquier paciente.
+        self.__difundir("agregar_paciente", (paciente,))
+        self.__pacientes[paciente.obtener_dni()] = paciente
+
+    def agregar_medico(self, medico: Medico):
+        self.__llamar(self.fragmento_de(medico.obtener_matricula()), "agregar_medico", (medico,))
+        self.__medicos[medico.obtener_matricula()] = medico
+
+    def agendar_turno(self, dni: str, matricula: str, especialidad: str, fecha_hora: datetime,
+                      clave_idempotencia: str = None) -> Turno:
+        duracion = self.__duracion(matricula, especialidad)
+        self.__validar_paciente_libre(dni, matricula, fecha_hora, duracion)
+        # La clave viaja al fragmento del médico: los reintentos siempre caen en el mismo.
+        turno = self.__llamar(self.fragmento_de(matricula), "agendar_turno",
+                              (dni, matricula, especialidad, fecha_hora, clave_idempotencia))
+        self.__ocupar(dni, matricula, fecha_hora, duracion)
+        return turno
+
+    def agendar_turnos(self, solicitudes: list[tuple[str, str, str, datetime]]) -> list[Exception | None]:
+        resultados: list[Exception | None] = [None] * len(solicitudes)
+        duraciones: dict[tuple[str, str], timedelta] = {}
+        inicio = 0
+        while inicio < len(solicitudes):
+            # Los fragmentos trabajan en paralelo sobre un tramo del lote. El tramo se corta antes
+            # de la primera solicitud que se superpone con otra del mismo paciente ya incluida:
+            # esa se decide recién con el resultado de la anterior.
+            grupos: dict[int, list[int]] = {}
+            en_tramo = IndiceHorarios()
+            fin = inicio
+            while fin < len(solicitudes):
+                dni, matricula, especialidad, fecha_hora = solicitudes[fin][:4]
+                duracion = duraciones.get((matricula, especialidad))
+                if duracion is None:
+                    duracion = duraciones[matricula, especialidad] = self.__duracion(matricula, especialidad)
+                final = fecha_hora + duracion
+                if en_tramo.hay_superposicion(dni, fecha_hora, final, (matricula, fecha_hora)):
+                    break
+                try:
+                    self.__validar_paciente_libre(dni, matricula, fecha_hora, duracion)
+                except TurnoSuperpuestoException as e:
+                    resultados[fin] = e
+                else:
+                    grupos.setdefault(self.fragmento_de(matricula), []).append(fin)
+                    en_tramo.agregar(dni, matricula, fecha_hora, duracion)
+                fin += 1
+            for fragmento, posiciones in grupos.items():
+                lote = [solicitudes[p] for p in posiciones]
+                self.__conexiones[fragmento].send(("agendar_turno", lote, True))
+            for fragmento, posiciones in grupos.items():
+                _, errores = self.__conexiones[fragmento].recv()
+                for posicion, error in zip(posiciones, errores):
+                    resultados[posicion] = error
+                    if error is None:
+                        dni, matricula, especialidad, fecha_hora = solicitudes[posicion][:4]
+                        self.__ocupar(dni, matricula, fecha_hora, duraciones[matricula, especialidad])
+            inicio = fin
+        return resultados
+
+    def cancelar_turno(self, matricula: str, fecha_hora: datetime, clave_idempotencia: str = None) -> Turno:
+        turno = self.__llamar(self.fragmento_de(matricula), "cancelar_turno",
+                              (matricula, fecha_hora, clave_idempotencia))
+        self.__horarios_pacientes.quitar(turno.obtener_paciente().obtener_dni(), matricula, fecha_hora)
+        return turno
+
+    def emitir_receta(self, dni: str, matricula: str, medicamentos: list[str], clave_idempotencia: str = None):
+        return self.__llamar(self.fragmento_de(matricula), "emitir_receta",
+                             (dni, matricula, medicamentos, clave_idempotencia))
+
+    def obtener_pacientes(self) -> list[Paciente]:
+        return self.__llamar(0, "obtener_pacientes", ())
+
+    def obtener_medicos(self) -> list[Medico]:
+        return [m for medicos in self.__difundir("obtener_medicos", ()) for m in medicos]
+
+    def obtener_turnos(self) -> list[Turno]:
+        turnos = [t for parte in self.__difundir("obtener_turnos", ()) for t in parte]
+        turnos.sort(key=lambda t: t.obtener_fecha_hora())
+        return turnos
+
+    def buscar_turnos(self, dni: str = None, matricula: str = None, especialidad: str = None,
+                      desde: datetime = None, hasta: datetime = None) -> list[Turno]:
+        argumentos = (dni, matricula, especialidad, desde, hasta)
+        if matricula is not None:
+            return self.__llamar(self.fragmento_de(matricula), "buscar_turnos", argumentos)
+        turnos = [t for parte in self.__difundir("buscar_turnos", argumentos) for t in parte]
+        turnos.sort(key=lambda t: t.obtener_fecha_hora())
+        return turnos
+
+    def obtener_historia_clinica(self, dni: str) -> HistoriaClinica | None:
+        # Se arma con turnos y recetas: una historia de un fragmento refiere a su registro de
+        # recetas y serializarla arrastraría la clínica entera.
+        paciente = self.__pacientes.get(dni)
+        if paciente is None:
+            return None
+        historia = HistoriaClinica(paciente)
+        historia.agregar_turnos(self.buscar_turnos(dni=dni))
+        for recetas in self.__difundir("obtener_recetas_por_paciente", (dni,)):
+            for receta in recetas:
+                historia.agregar_receta(receta)
+        return historia
+
+    def __duracion(self, matricula: str, especialidad: str) -> timedelta:
+        medico = self.__medicos.get(matricula)
+        return timedelta(minutes=medico.obtener_duracion_minutos(especialidad)) if medico else timedelta(0)
+
+    def __validar_paciente_libre(self, dni: str, matricula: str, fecha_hora: datetime, duracion: timedelta):
+        # Se ignora el mismo médico y horario: ese choque (o un reintento) lo resuelve su fragmento.
+        fin = fecha_hora + duracion
+        if self.__horarios_pacientes.hay_superposicion(dni, fecha_hora, fin, (matricula, fecha_hora)):
+            raise TurnoSuperpuestoException(f"El paciente {dni} ya tiene un turno en ese horario.")
+
+    def __ocupar(self, dni: str, matricula: str, fecha_hora: datetime, duracion: timedelta):
+        # Se quita antes por si es un reintento idempotente del mismo turno.
+        self.__horarios_pacientes.quitar(dni, matricula, fecha_hora)
+        self.__horarios_pacientes.agregar(dni, matricula, fecha_hora, duracion)
+
+    def __llamar(self, fragmento: int, metodo: str, argumentos: tuple):
+        conexion = self.__conexiones[fragmento]
+        conexion.send((metodo, argumentos, False))
+        return self.__respuesta(conexion)
+
+    def __difundir(self, metodo: str, argumentos: tuple) -> list:
+        for conexion in self.__conexiones:
+            conexion.send((metodo, argumentos, False))
+        return [self.__respuesta(conexion) for conexion in self.__conexiones]
+
+    @staticmethod
+    def __respuesta(conexion):
+        exito, valor = conexion.recv()
+        if not exito:
+            raise valor
+        return valor
+
+
+def medir_rendimiento(cantidad_fragmentos: int, cantidad_turnos: int = 200_000, cantidad_medicos: int = 64,
+                      tamano_lote: int = 5_000) -> float:
+    dias = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"]
+    with ClinicaFragmentada(cantidad_fragmentos) as clinica:
+        for dni in range(100):
+            clinica.agregar_paciente(Paciente(str(dni), f"Paciente {dni}", "01/01/1980"))
+        for numero in range(cantidad_medicos):
+            medico = Medico(f"MP-{numero}", f"Médico {numero}", "Clínica médica")
+            medico.agregar_especialidad(Especialidad("Clínica médica", dias))
+            clinica.agregar_medico(medico)
+
+        # Una franja por turno y cada paciente a lo sumo una vez por franja: ningún pedido se
+        # rechaza por superposición y se mide sólo el agendamiento.
+        duracion = timedelta(minutes=medico.obtener_duracion_minutos("Clínica médica"))
+        inicio = datetime(2025, 1, 1, 8, 0)
+        solicitudes = [
+            (str(i % 100), f"MP-{i % cantidad_medicos}", "Clínica médica",
+             inicio + duracion * (i // cantidad_medicos))
+            for i in range(cantidad_turnos)
+        ]
+        comienzo = time.perf_counter()
+        for desde in range(0, cantidad_turnos, tamano_lote):
+            errores = clinica.agendar_turnos(solicitudes[desde:desde + tamano_lote])
+            if any(errores):
+                raise RuntimeError(f"Pedidos rechazados en la medición: {next(e for e in errores if e)!r}")
+        return cantidad_turnos / (time.perf_counter() - comienzo)
+
+
+if __name__ == "__main__":
+    print(f"Núcleos disponibles: {os.cpu_count()}")
+    base = None
+    for fragmentos in (1, 2, 4, 8):
+        por_segundo = medir_rendimiento(fragmentos)
+        base = base or por_segundo
+        print(f"{fragmentos} fragmento(s): {por_segundo:,.0f} turnos/s (x{por_segundo / base:.2f})")
@@ -1,14 +1,25 @@
 
+from array import array
 from src.paciente import Paciente
 from src.turno import Turno
 from src.receta import Receta
 class HistoriaClinica:
-    def __init__(self, paciente: Paciente, turno: Turno = None, receta: Receta = None):
+    def __init__(self, paciente: Paciente, turno: Turno = None, receta: Receta = None, recetas_de=None):
         self.__paciente = paciente
         self.__turno = turno
         self.__receta = receta
         self.__turnos = []   
         self.__recetas = []  
+        # Con 'recetas_de' (id -> Receta) las recetas con id viven en ese registro y la historia
+        # guarda sólo sus ids; las que no tienen id se guardan enteras en 'recetas'.
+        self.__recetas_de = recetas_de
+        self.__ids_recetas = array("I")
+        self.__turnos_cancelados = 0
+        self.__series = []
+        self.__observadores = []
+        # Lo anterior al horizonte de archivo se lee de disco la primera vez que se pide.
+        self.__cargador = None
+        self.__archivados = None
 
     def get_paciente(self):
         return self.__paciente
@@ -20,10 +31,97 @@ class HistoriaClinica:
         return self.__receta
 
     def agregar_receta(self, receta):
-        self.__recetas.append(receta)
+        if self.__recetas_de is not None and receta.obtener_id() is not None:
+            self.__ids_recetas.append(receta.obtener_id())
+        else:
+            self.__recetas.append(receta)
+        self.__notificar()
 
     def agregar_turno(self, turno):
         self.__turnos.append(turno)
+        self.__notificar()
+
+    def agregar_turnos(self, turnos):
+        self.__turnos.extend(turnos)
+        self.__notificar()
+
+    def quitar_turno(self, turno):
+        self.__turnos_cancelados += 1
+        if self.__turnos_cancelados * 4 > len(self.__turnos):
+            self.__turnos = [t for t in self.__turnos if not t.esta_cancelado()]
+            self.__turnos_cancelados = 0
+        self.__notificar()
+
+    def archivar_anteriores(self, horizonte, cargador) -> list:
+        vigentes = [t for t in self.__turnos if not t.esta_cancelado()]
+        self.__turnos = [t for t in vigentes if t.obtener_fecha_hora() >= horizonte]
+        self.__turnos_cancelados = 0
+        recetas = self.__leer_recetas()
+        antiguas = [r for r in recetas if r.obtener_fecha() < horizonte]
+        if antiguas or len(self.__turnos) < len(vigentes):
+            self.__recetas = []
+            self.__ids_recetas = array("I")
+            for receta in recetas:
+                if receta.obtener_fecha() >= horizonte:
+                    self.agregar_receta(receta)
+            self.__cargador = cargador
+        self.__archivados = None
+        return antiguas
+
+    def asignar_cargador(self, cargador):
+        self.__cargador = cargador
+        self.__archivados = None
+
+    def __leer_recetas(self) -> list:
+        if not self.__ids_recetas:
+            return list(self.__recetas)
+        return [self.__recetas_de(id_receta) for id_receta in self.__ids_recetas] + self.__recetas
+
+    def __obtener_archivados(self):
+        if self.__cargador is None:
+            return [], []
+        if self.__archivados is None:
+            self.__archivados = self.__cargador()
+        return self.__archivados
+
+    def agregar_serie(self, serie):
+        self.__series.append(serie)
+        self.__notificar()
+
+    def excluir_de_serie(self, serie, fecha_hora, version=0):
+        serie.excluir(fecha_hora, version)
+        self.__notificar()
+
+    def agregar_observador(self, observador):
+        if observador not in self.__observadores:
+            self.__observadores.append(observador)
+
+    def __notificar(self):
+        for observador in self.__observadores:
+            observador(self)
+
+    def __getstate__(self):
+        # Los observadores son locales al proceso y no se serializan.
+        estado = self.__dict__.copy()
+        estado["_HistoriaClinica__observadores"] = []
+        estado["_HistoriaClinica__archivados"] = None
+        return estado
+
+    def obtener_series(self):
+        return list(self.__series)
+
+    def obtener_turnos(self):
+        turnos = self.__obtener_archivados()[0] + [t for t in self.__turnos if not t.esta_cancelado()]
+        for serie in self.__series:
+            turnos.extend(serie.ocurrencias())
+        return turnos
+
+    def obtener_recetas(self, incluir_archivadas: bool = True):
+        if not incluir_archivadas:
+            return self.__leer_recetas()
+        return self.__obtener_archivados()[1] + self.__leer_recetas()
 
     def __str__(self):
-        return f"HistoriaClinica(paciente={self.__paciente}, turno={self.__turno}, receta={self.__receta})"
+        turnos = "\n  ".join(str(t) for t in self.obtener_turnos()) or "(sin turnos)"
+        recetas = "\n  ".join(str(r) for r in self.obtener_recetas()) or "(sin recetas)"
+        return f"Historia clínica de {self.__paciente}\nTurnos:\n  {turnos}\nRecetas:\n  {recetas}"
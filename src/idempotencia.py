@@ -0,0 +1,56 @@
+import time
+from collections import OrderedDict
+from typing import Callable
+from src.exepciones import ClaveIdempotenciaReutilizadaError
+
+
+class CacheIdempotencia:
+    # Resultados de operaciones ya realizadas, por clave de idempotencia. Como el TTL es
+    # el mismo para todas, el orden de inserción es también el orden de vencimiento.
+    def __init__(self, capacidad: int = 10_000, ttl_segundos: float = 600.0,
+                 reloj: Callable[[], float] = time.monotonic):
+        if capacidad < 1 or ttl_segundos <= 0:
+            raise ValueError("La capacidad y el TTL deben ser positivos")
+        self.__capacidad = capacidad
+        self.__ttl = ttl_segundos
+        self.__reloj = reloj
+        self.__entradas: OrderedDict[str, tuple[float, tuple, object]] = OrderedDict()
+
+    def obtener(self, clave: str | None, huella: tuple):
+        if clave is None:
+            return None
+        self.__purgar()
+        entrada = self.__entradas.get(clave)
+        if entrada is None:
+            return None
+        _, huella_original, resultado = entrada
+        if huella_original != huella:
+            raise ClaveIdempotenciaReutilizadaError(
+                f"La clave {clave!r} ya se usó para otra operación: {huella_original[0]}")
+        return resultado
+
+    def guardar(self, clave: str | None, huella: tuple, resultado):
+        if clave is None:
+            return
+        self.__entradas[clave] = (self.__reloj() + self.__ttl, huella, resultado)
+        self.__entradas.move_to_end(clave)
+        while len(self.__entradas) > self.__capacidad:
+            self.__entradas.popitem(last=False)
+
+    def cantidad(self) -> int:
+        self.__purgar()
+        return len(self.__entradas)
+
+    def __purgar(self):
+        ahora = self.__reloj()
+        while self.__entradas:
+            vence = next(iter(self.__entradas.values()))[0]
+            if vence > ahora:
+                break
+            self.__entradas.popitem(last=False)
+
+    def __getstate__(self):
+        # Los vencimientos dependen del reloj del proceso: no se trasladan a otro.
+        estado = self.__dict__.copy()
+        estado["_CacheIdempotencia__entradas"] = OrderedDict()
+        return estado
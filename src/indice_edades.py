@@ -0,0 +1,46 @@
+from bisect import bisect_left, insort
+from datetime import date
+from src.paciente import Paciente
+
+
+def restar_anios(fecha: date, anios: int) -> date:
+    try:
+        return fecha.replace(year=fecha.year - anios)
+    except ValueError:
+        # 29 de febrero en un año no bisiesto.
+        return fecha.replace(year=fecha.year - anios, day=28)
+
+
+class IndiceEdades:
+    def __init__(self):
+        self.__nacimientos: list[tuple[int, str]] = []
+        self.__pacientes: dict[str, Paciente] = {}
+
+    def agregar(self, paciente: Paciente):
+        dni = paciente.obtener_dni()
+        if dni in self.__pacientes:
+            self.quitar(dni)
+        self.__pacientes[dni] = paciente
+        insort(self.__nacimientos, (paciente.obtener_nacimiento_ordinal(), dni))
+
+    def quitar(self, dni: str):
+        paciente = self.__pacientes.pop(dni)
+        clave = (paciente.obtener_nacimiento_ordinal(), dni)
+        del self.__nacimientos[bisect_left(self.__nacimientos, clave)]
+
+    def nacidos_entre(self, desde: date, hasta: date) -> list[Paciente]:
+        # Rango semiabierto de fechas de nacimiento: [desde, hasta).
+        inicio = bisect_left(self.__nacimientos, (desde.toordinal(),))
+        fin = bisect_left(self.__nacimientos, (hasta.toordinal(),))
+        return [self.__pacientes[dni] for _, dni in self.__nacimientos[inicio:fin]]
+
+    def por_edad(self, edad_minima: int, edad_maxima: int, fecha_referencia: date = None) -> list[Paciente]:
+        referencia = fecha_referencia or date.today()
+        desde = restar_anios(referencia, edad_maxima + 1)
+        hasta = restar_anios(referencia, edad_minima)
+        return self.nacidos_entre(date.fromordinal(desde.toordinal() + 1), date.fromordinal(hasta.toordinal() + 1))
+
+    def cumplen_en_mes(self, edad: int, anio: int, mes: int) -> list[Paciente]:
+        desde = date(anio - edad, mes, 1)
+        hasta = date(anio - edad + 1, 1, 1) if mes == 12 else date(anio - edad, mes + 1, 1)
+        return self.nacidos_entre(desde, hasta)
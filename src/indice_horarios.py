@@ -0,0 +1,73 @@
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta
+from src.serie import SerieTurnos
+
+UN_MICROSEGUNDO = timedelta(microseconds=1)
+
+
+class IndiceHorarios:
+    # Horarios ocupados por cada paciente: (inicio, fin, matrícula) ordenados por inicio.
+    # Un turno que se superpone con [inicio, fin) empieza antes de 'fin' y después de
+    # 'inicio - duración máxima', así que basta mirar ese tramo de la lista.
+    def __init__(self):
+        self.__por_paciente: dict[str, list[tuple[datetime, datetime, str]]] = {}
+        self.__series: dict[str, list[tuple[SerieTurnos, timedelta]]] = {}
+        self.__duracion_maxima = timedelta(0)
+
+    def agregar(self, dni: str, matricula: str, inicio: datetime, duracion: timedelta):
+        self.__duracion_maxima = max(self.__duracion_maxima, duracion)
+        insort(self.__por_paciente.setdefault(dni, []), (inicio, inicio + duracion, matricula))
+
+    def agregar_varios(self, horarios: list[tuple[str, str, datetime, timedelta]]):
+        if not horarios:
+            return
+        por_paciente = self.__por_paciente
+        tocados = set()
+        for dni, matricula, inicio, duracion in horarios:
+            por_paciente.setdefault(dni, []).append((inicio, inicio + duracion, matricula))
+            tocados.add(dni)
+        self.__duracion_maxima = max(self.__duracion_maxima, max(h[3] for h in horarios))
+        for dni in tocados:
+            por_paciente[dni].sort()
+
+    def agregar_serie(self, serie: SerieTurnos, duracion: timedelta):
+        self.__series.setdefault(serie.obtener_paciente().obtener_dni(), []).append((serie, duracion))
+
+    def quitar(self, dni: str, matricula: str, inicio: datetime):
+        horarios = self.__por_paciente.get(dni, [])
+        posicion = bisect_left(horarios, (inicio,))
+        while posicion < len(horarios) and horarios[posicion][0] == inicio:
+            if horarios[posicion][2] == matricula:
+                del horarios[posicion]
+                if not horarios:
+                    del self.__por_paciente[dni]
+                return
+            posicion += 1
+
+    def quitar_anteriores(self, horizonte: datetime):
+        for dni in list(self.__por_paciente):
+            horarios = self.__por_paciente[dni]
+            del horarios[:bisect_left(horarios, (horizonte,))]
+            if not horarios:
+                del self.__por_paciente[dni]
+
+    def hay_superposicion(self, dni: str, inicio: datetime, fin: datetime,
+                          ignorar: tuple[str, datetime] = None) -> bool:
+        # 'ignorar' es el (matrícula, inicio) de un turno que se está moviendo.
+        horarios = self.__por_paciente.get(dni)
+        if horarios:
+            desde = bisect_left(horarios, (inicio - self.__duracion_maxima,))
+            hasta = bisect_left(horarios, (fin,))
+            for posicion in range(desde, hasta):
+                comienzo, final, matricula = horarios[posicion]
+                if final > inicio and (matricula, comienzo) != ignorar:
+                    return True
+        for serie, duracion in self.__series.get(dni, ()):
+            matricula = serie.obtener_medico().obtener_matricula()
+            for turno in serie.ocurrencias(inicio - duracion + UN_MICROSEGUNDO, fin):
+                if (matricula, turno.obtener_fecha_hora()) != ignorar:
+                    return True
+        return False
+
+    def cantidad(self) -> int:
+        return sum(len(horarios) for horarios in self.__por_paciente.values())
@@ -0,0 +1,298 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import gc
+import mmap
+import pickle
+import struct
+import time
+from array import array
+from datetime import datetime, timedelta
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.turno import Turno
+from src.receta import Receta
+from src.serie import SerieTurnos
+
+MAGICO = b"CLIN"
+VERSION = 2
+ORIGEN = datetime(1, 1, 1)
+UN_MICROSEGUNDO = timedelta(microseconds=1)
+
+
+class InstantaneaInvalidaError(Exception):
+    pass
+
+
+def _microsegundos(fecha: datetime) -> int:
+    return (fecha - ORIGEN) // UN_MICROSEGUNDO
+
+
+class _Escritor:
+    def __init__(self, archivo):
+        self.__archivo = archivo
+        self.__textos: dict[str, int] = {}
+
+    def texto(self, valor: str) -> int:
+        indice = self.__textos.get(valor)
+        if indice is None:
+            indice = self.__textos[valor] = len(self.__textos)
+        return indice
+
+    def seccion(self, datos: bytes):
+        # Cada sección va precedida de su largo y alineada a 8 bytes para poder mapearla sin copiar.
+        relleno = -len(datos) % 8
+        self.__archivo.write(struct.pack("<Q", len(datos)))
+        self.__archivo.write(datos)
+        self.__archivo.write(b"\0" * relleno)
+
+    def arreglo(self, valores: array):
+        self.seccion(valores.tobytes())
+
+    def tabla_de_textos(self):
+        codificados = [t.encode() for t in self.__textos]
+        self.arreglo(array("I", map(len, codificados)))
+        self.seccion(b"".join(codificados))
+
+
+class _Lector:
+    def __init__(self, datos: memoryview):
+        self.__datos = datos
+        self.__posicion = 0
+
+    def seccion(self) -> memoryview:
+        if self.__posicion + 8 > len(self.__datos):
+            raise InstantaneaInvalidaError("La instantánea está truncada")
+        (largo,) = struct.unpack_from("<Q", self.__datos, self.__posicion)
+        inicio = self.__posicion + 8
+        if inicio + largo > len(self.__datos):
+            raise InstantaneaInvalidaError("La instantánea está truncada")
+        self.__posicion = inicio + largo + (-largo % 8)
+        return self.__datos[inicio:inicio + largo]
+
+    def arreglo(self, tipo: str) -> memoryview:
+        return self.seccion().cast(tipo)
+
+    def tabla_de_textos(self) -> list[str]:
+        largos = self.arreglo("I")
+        contenido = bytes(self.seccion())
+        textos = []
+        inicio = 0
+        for largo in largos:
+            textos.append(contenido[inicio:inicio + largo].decode())
+            inicio += largo
+        return textos
+
+
+def _listas(desplazamientos, valores) -> list:
+    return [valores[desplazamientos[i]:desplazamientos[i + 1]] for i in range(len(desplazamientos) - 1)]
+
+
+def guardar_instantanea(clinica: Clinica, ruta: str):
+    pacientes = clinica.obtener_pacientes()
+    medicos = clinica.obtener_medicos()
+    numero_paciente = {p.obtener_dni(): i for i, p in enumerate(pacientes)}
+    numero_medico = {m.obtener_matricula(): i for i, m in enumerate(medicos)}
+    turnos = clinica.obtener_turnos(incluir_series=False)
+    series = clinica.obtener_series()
+    recetas = [r for p in pacientes for r in clinica.obtener_historia_clinica(p.obtener_dni()).obtener_recetas()]
+    # En el orden de emisión: al restaurarlas el registro les vuelve a dar los mismos ids.
+    recetas.sort(key=lambda r: r.obtener_id() or 0)
+
+    with open(ruta + ".tmp", "wb") as archivo:
+        escritor = _Escritor(archivo)
+        texto = escritor.texto
+
+        tabla_pacientes = array("I")
+        for paciente in pacientes:
+            tabla_pacientes.extend((texto(paciente.obtener_dni()), texto(paciente.obtener_nombre()),
+                                    paciente.obtener_nacimiento_ordinal()))
+
+        tabla_medicos = array("I")
+        especialidades = array("I")
+        duraciones = array("I")
+        desplazamientos_especialidades = array("I", [0])
+        dias = array("I")
+        desplazamientos_dias = array("I", [0])
+        for medico in medicos:
+            tabla_medicos.extend((texto(medico.obtener_matricula()), texto(medico.obtener_nombre())))
+            for especialidad in medico.obtener_especialidades():
+                especialidades.append(texto(especialidad.obtener_especialidad()))
+                duraciones.append(especialidad.obtener_duracion_minutos())
+                dias.extend(texto(d) for d in especialidad.obtener_dias())
+                desplazamientos_dias.append(len(dias))
+            desplazamientos_especialidades.append(len(especialidades))
+
+        turnos_refs = array("I")
+        turnos_fechas = array("q")
+        for turno in turnos:
+            turnos_refs.extend((numero_paciente[turno.obtener_paciente().obtener_dni()],
+                                numero_medico[turno.obtener_medico().obtener_matricula()],
+                                texto(turno.obtener_especialidad())))
+            turnos_fechas.append(_microsegundos(turno.obtener_fecha_hora()))
+
+        recetas_refs = array("I")
+        recetas_fechas = array("q")
+        medicamentos = array("I")
+        desplazamientos_medicamentos = array("I", [0])
+        for receta in recetas:
+            recetas_refs.extend((numero_paciente[receta.obtener_paciente().obtener_dni()],
+                                 numero_medico[receta.obtener_medico().obtener_matricula()]))
+            recetas_fechas.append(_microsegundos(receta.obtener_fecha()))
+            medicamentos.extend(texto(m) for m in receta.obtener_medicamentos())
+            desplazamientos_medicamentos.append(len(medicamentos))
+
+        series_refs = array("I")
+        series_inicios = array("q")
+        excepciones = array("q")
+        desplazamientos_excepciones = array("I", [0])
+        for serie in series:
+            series_refs.extend((numero_paciente[serie.obtener_paciente().obtener_dni()],
+                                numero_medico[serie.obtener_medico().obtener_matricula()],
+                                texto(serie.obtener_especialidad()), serie.obtener_cantidad(),
+                                serie.obtener_intervalo_semanas()))
+            series_inicios.append(_microsegundos(serie.obtener_inicio()))
+            excepciones.extend(_microsegundos(f) for f in serie.obtener_excepciones())
+            desplazamientos_excepciones.append(len(excepciones))
+
+        archivo.write(MAGICO + struct.pack("<HHI", VERSION, 0, 0))
+        escritor.tabla_de_textos()
+        for seccion in (tabla_pacientes, tabla_medicos, especialidades, desplazamientos_especialidades, dias,
+                        desplazamientos_dias, turnos_refs, turnos_fechas, recetas_refs, recetas_fechas,
+                        medicamentos, desplazamientos_medicamentos, series_refs, series_inicios, excepciones,
+                        desplazamientos_excepciones, duraciones):
+            escritor.arreglo(seccion)
+    os.replace(ruta + ".tmp", ruta)
+
+
+def cargar_instantanea(ruta: str) -> Clinica:
+    if os.path.getsize(ruta) < len(MAGICO) + 8:
+        raise InstantaneaInvalidaError("El archivo no es una instantánea de clínica")
+    error = None
+    with open(ruta, "rb") as archivo, mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+        datos = memoryview(mapa)
+        # Se crean millones de objetos sin ciclos: el recolector solo agregaría pasadas inútiles.
+        recolector_activo = gc.isenabled()
+        gc.disable()
+        try:
+            return _restaurar(datos)
+        except InstantaneaInvalidaError as e:
+            # El traceback retiene vistas del mapa; se descarta para poder cerrarlo.
+            error = str(e)
+        finally:
+            datos.release()
+            if recolector_activo:
+                gc.enable()
+    raise InstantaneaInvalidaError(error)
+
+
+def _restaurar(datos: memoryview) -> Clinica:
+    if bytes(datos[:4]) != MAGICO:
+        raise InstantaneaInvalidaError("El archivo no es una instantánea de clínica")
+    version, _, _ = struct.unpack_from("<HHI", datos, 4)
+    if version != VERSION:
+        raise InstantaneaInvalidaError(f"Versión de instantánea no soportada: {version}")
+    lector = _Lector(datos[12:])
+    textos = lector.tabla_de_textos()
+    tabla_pacientes = lector.arreglo("I")
+    tabla_medicos = lector.arreglo("I")
+    especialidades = lector.arreglo("I")
+    desplazamientos_especialidades = lector.arreglo("I")
+    dias = lector.arreglo("I")
+    desplazamientos_dias = lector.arreglo("I")
+    turnos_refs = lector.arreglo("I")
+    turnos_fechas = lector.arreglo("q")
+    recetas_refs = lector.arreglo("I")
+    recetas_fechas = lector.arreglo("q")
+    medicamentos = lector.arreglo("I")
+    desplazamientos_medicamentos = lector.arreglo("I")
+    series_refs = lector.arreglo("I")
+    series_inicios = lector.arreglo("q")
+    excepciones = lector.arreglo("q")
+    desplazamientos_excepciones = lector.arreglo("I")
+    duraciones = lector.arreglo("I")
+
+    clinica = Clinica()
+    pacientes = []
+    for i in range(0, len(tabla_pacientes), 3):
+        nacimiento = datetime.fromordinal(tabla_pacientes[i + 2]).strftime("%d/%m/%Y")
+        paciente = Paciente(textos[tabla_pacientes[i]], textos[tabla_pacientes[i + 1]], nacimiento)
+        clinica.agregar_paciente(paciente)
+        pacientes.append(paciente)
+
+    dias_por_especialidad = _listas(desplazamientos_dias, dias)
+    medicos = []
+    for numero, i in enumerate(range(0, len(tabla_medicos), 2)):
+        medico = Medico(textos[tabla_medicos[i]], textos[tabla_medicos[i + 1]])
+        for e in range(desplazamientos_especialidades[numero], desplazamientos_especialidades[numero + 1]):
+            medico.agregar_especialidad(Especialidad(textos[especialidades[e]],
+                                                     [textos[d] for d in dias_por_especialidad[e]], duraciones[e]))
+        clinica.agregar_medico(medico)
+        medicos.append(medico)
+
+    clinica.incorporar_turnos([
+        Turno(pacientes[turnos_refs[3 * n]], medicos[turnos_refs[3 * n + 1]],
+              ORIGEN + UN_MICROSEGUNDO * turnos_fechas[n], textos[turnos_refs[3 * n + 2]])
+        for n in range(len(turnos_fechas))
+    ])
+
+    for numero, lista in enumerate(_listas(desplazamientos_medicamentos, medicamentos)):
+        fecha = ORIGEN + UN_MICROSEGUNDO * recetas_fechas[numero]
+        clinica.incorporar_receta(Receta(pacientes[recetas_refs[2 * numero]], medicos[recetas_refs[2 * numero + 1]],
+                                         [textos[m] for m in lista], fecha))
+
+    for numero, lista in enumerate(_listas(desplazamientos_excepciones, excepciones)):
+        paciente, medico, especialidad, cantidad, intervalo = series_refs[5 * numero:5 * numero + 5]
+        serie = SerieTurnos(pacientes[paciente], medicos[medico], textos[especialidad],
+                            ORIGEN + UN_MICROSEGUNDO * series_inicios[numero], cantidad, intervalo)
+        for excepcion in lista:
+            serie.excluir(ORIGEN + UN_MICROSEGUNDO * excepcion)
+        clinica.incorporar_serie(serie)
+    return clinica
+
+
+def medir_contra_pickle(cantidad_turnos: int = 1_000_000, ruta: str = "instantanea_prueba.clin") -> dict:
+    dias = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"]
+    clinica = Clinica()
+    pacientes = [Paciente(str(dni), f"Paciente {dni}", "01/01/1980") for dni in range(10_000)]
+    medicos = [Medico(f"MP-{n}", f"Médico {n}", Especialidad("Clínica médica", dias)) for n in range(200)]
+    for paciente in pacientes:
+        clinica.agregar_paciente(paciente)
+    for medico in medicos:
+        clinica.agregar_medico(medico)
+    inicio = datetime(2024, 1, 1, 8, 0)
+    clinica.incorporar_turnos([
+        Turno(pacientes[i % len(pacientes)], medicos[i % len(medicos)],
+              inicio + timedelta(minutes=15 * (i // len(medicos))), "Clínica médica")
+        for i in range(cantidad_turnos)
+    ])
+
+    resultados = {}
+    comienzo = time.perf_counter()
+    guardar_instantanea(clinica, ruta)
+    resultados["instantanea_guardar"] = time.perf_counter() - comienzo
+    resultados["instantanea_bytes"] = os.path.getsize(ruta)
+    comienzo = time.perf_counter()
+    cargar_instantanea(ruta)
+    resultados["instantanea_cargar"] = time.perf_counter() - comienzo
+    os.remove(ruta)
+
+    comienzo = time.perf_counter()
+    volcado = pickle.dumps(clinica, protocol=pickle.HIGHEST_PROTOCOL)
+    resultados["pickle_guardar"] = time.perf_counter() - comienzo
+    resultados["pickle_bytes"] = len(volcado)
+    comienzo = time.perf_counter()
+    pickle.loads(volcado)
+    resultados["pickle_cargar"] = time.perf_counter() - comienzo
+    return resultados
+
+
+if __name__ == "__main__":
+    resultados = medir_contra_pickle()
+    print(f"Instantánea: guardar {resultados['instantanea_guardar']:.2f} s, cargar "
+          f"{resultados['instantanea_cargar']:.2f} s, {resultados['instantanea_bytes'] / 1e6:.1f} MB")
+    print(f"Pickle:      guardar {resultados['pickle_guardar']:.2f} s, cargar "
+          f"{resultados['pickle_cargar']:.2f} s, {resultados['pickle_bytes'] / 1e6:.1f} MB")
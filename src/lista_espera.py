@@ -0,0 +1,61 @@
+import heapq
+from datetime import datetime
+from itertools import count
+
+
+class ListaEspera:
+    def __init__(self):
+        self.__colas: dict[str, list[list]] = {}
+        self.__activas: dict[tuple[str, str], list] = {}
+        self.__cantidades: dict[str, int] = {}
+        self.__secuencia = count()
+
+    def agregar(self, dni: str, especialidad: str, prioridad: int = 0, fecha_solicitud: datetime = None):
+        self.quitar(dni, especialidad)
+        entrada = [prioridad, fecha_solicitud or datetime.now(), next(self.__secuencia), dni, True]
+        self.__activas[(especialidad, dni)] = entrada
+        self.__cantidades[especialidad] = self.__cantidades.get(especialidad, 0) + 1
+        heapq.heappush(self.__colas.setdefault(especialidad, []), entrada)
+
+    def quitar(self, dni: str, especialidad: str) -> bool:
+        # Borrado perezoso: la entrada queda en el heap marcada como inactiva.
+        entrada = self.__activas.pop((especialidad, dni), None)
+        if entrada is None:
+            return False
+        entrada[4] = False
+        self.__cantidades[especialidad] -= 1
+        cola = self.__colas[especialidad]
+        if len(cola) > 2 * self.__cantidades[especialidad] + 16:
+            cola[:] = [e for e in cola if e[4]]
+            heapq.heapify(cola)
+        return True
+
+    def esta_esperando(self, dni: str, especialidad: str) -> bool:
+        return (especialidad, dni) in self.__activas
+
+    def cantidad(self, especialidad: str = None) -> int:
+        if especialidad is None:
+            return len(self.__activas)
+        return self.__cantidades.get(especialidad, 0)
+
+    def obtener_pendientes(self, especialidad: str) -> list[str]:
+        activas = [e for e in self.__colas.get(especialidad, []) if e[4]]
+        return [e[3] for e in sorted(activas)]
+
+    def asignar(self, especialidad: str, intentar_agendar) -> str | None:
+        cola = self.__colas.get(especialidad)
+        rechazadas = []
+        asignado = None
+        while cola:
+            entrada = heapq.heappop(cola)
+            if not entrada[4]:
+                continue
+            if intentar_agendar(entrada[3]):
+                del self.__activas[(especialidad, entrada[3])]
+                self.__cantidades[especialidad] -= 1
+                asignado = entrada[3]
+                break
+            rechazadas.append(entrada)
+        for entrada in rechazadas:
+            heapq.heappush(cola, entrada)
+        return asignado
@@ -1,9 +1,15 @@
-from src.especialidad import Especialidad
+from src.especialidad import Especialidad, DURACION_PREDETERMINADA
 class Medico:
-    def __init__(self, matricula: str, nombre: str, especialidad: str):
+    def __init__(self, matricula: str, nombre: str, especialidad: str | Especialidad = None):
         self.__matricula = matricula
         self.__nombre = nombre
         self.__especialidades : list[Especialidad] = [] 
+        self.__observadores = []
+        if isinstance(especialidad, str) and especialidad.strip():
+            # Especialidad declarada sin días: se completa al agregarla con sus días.
+            especialidad = Especialidad(especialidad.strip(), [])
+        if isinstance(especialidad, Especialidad):
+            self.__especialidades.append(especialidad)
 
     def agregar_especialidad(self, especialidad: Especialidad):
         if not isinstance(especialidad, Especialidad):
@@ -11,17 +17,66 @@ class Medico:
 
         if especialidad in self.__especialidades:
             return  
-        self.__especialidades.append(especialidad)
+        for i, existente in enumerate(self.__especialidades):
+            if existente.obtener_especialidad() == especialidad.obtener_especialidad() and not existente.obtener_dias():
+                self.__especialidades[i] = especialidad
+                break
+        else:
+            self.__especialidades.append(especialidad)
+        self.__notificar()
+
+    def quitar_especialidad(self, especialidad: str) -> bool:
+        restantes = [e for e in self.__especialidades if e.obtener_especialidad() != especialidad]
+        if len(restantes) == len(self.__especialidades):
+            return False
+        self.__especialidades = restantes
+        self.__notificar()
+        return True
+
+    def quitar_dia(self, especialidad: str, dia: str) -> bool:
+        for i, esp in enumerate(self.__especialidades):
+            if esp.obtener_especialidad() == especialidad and esp.verificar_dia(dia):
+                dias = [d for d in esp.obtener_dias() if d != dia.lower()]
+                self.__especialidades[i] = Especialidad(especialidad, dias, esp.obtener_duracion_minutos())
+                self.__notificar()
+                return True
+        return False
+
+    def agregar_observador(self, observador):
+        if observador not in self.__observadores:
+            self.__observadores.append(observador)
+
+    def __notificar(self):
+        for observador in self.__observadores:
+            observador(self)
+
+    def __getstate__(self):
+        # Los observadores son locales al proceso y no se serializan.
+        estado = self.__dict__.copy()
+        estado["_Medico__observadores"] = []
+        return estado
 
     def obtener_matricula(self) -> str:
         return self.__matricula
 
+    def obtener_nombre(self) -> str:
+        return self.__nombre
+
+    def obtener_especialidades(self) -> list[Especialidad]:
+        return list(self.__especialidades)
+
     def obtener_especialidad_para_dia(self, dia: str):
         for esp in self.__especialidades:
             if esp.verificar_dia(dia):
                 return esp.obtener_especialidad()
         return None
 
+    def obtener_duracion_minutos(self, especialidad: str) -> int:
+        for esp in self.__especialidades:
+            if esp.obtener_especialidad() == especialidad:
+                return esp.obtener_duracion_minutos()
+        return DURACION_PREDETERMINADA
+
     def __str__(self) -> str:
         especialidades_str = "\n  ".join(str(esp) for esp in self.__especialidades)
         return f"{self.__nombre} - Matrícula: {self.__matricula}\n  {especialidades_str}"
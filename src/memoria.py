@@ -0,0 +1,115 @@
+import gc
+import random
+import sys
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from src.paciente import Paciente
+from src.medico import Medico
+from src.turno import Turno
+from src.receta import Receta
+from src.serie import SerieTurnos
+from src.historiaclinica import HistoriaClinica
+
+# Entidades del dominio: al recorrer un subsistema no se entra en las de otro, así cada
+# objeto compartido (un Paciente referido por sus turnos, por ejemplo) se cuenta una sola vez.
+ENTIDADES = (Paciente, Medico, Turno, Receta, SerieTurnos, HistoriaClinica)
+NO_MEDIBLES = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+TAMANO_PUNTERO = 8
+# Un objeto con más referencias que esto (un nombre de especialidad usado por todos los
+# turnos, por ejemplo) se cuenta una sola vez en lugar de extrapolarse con la muestra.
+UMBRAL_COMPARTIDO = 8
+
+
+class MedidorMemoria:
+    # Tamaño profundo estimado por muestreo: en cada contenedor con más de 'muestra' hijos
+    # se recorren sólo 'muestra' al azar y se extrapola. No usa gc.get_objects().
+    def __init__(self, muestra: int = 200, semilla: int = 0, fronteras: list = ()):
+        if muestra < 1:
+            raise ValueError("La muestra debe ser positiva")
+        self.__muestra = muestra
+        self.__azar = random.Random(semilla)
+        self.__vistos: set[int] = {id(f) for f in fronteras}
+
+    def medir(self, raiz, estructura: bool = False) -> tuple[float, float]:
+        # Devuelve (bytes propios ya extrapolados, bytes de objetos muy compartidos contados una vez).
+        propios = compartidos = 0.0
+        pendientes = [(raiz, 1.0)]
+        while pendientes:
+            objeto, peso = pendientes.pop()
+            if id(objeto) in self.__vistos or isinstance(objeto, NO_MEDIBLES):
+                continue
+            if isinstance(objeto, ENTIDADES) and objeto is not raiz:
+                continue
+            # Referencias aparte de 'objeto' y del argumento de getrefcount.
+            referencias = sys.getrefcount(objeto) - 2
+            if estructura and referencias > 1 and not gc.is_tracked(objeto):
+                # Valor atómico compartido (la fecha de un turno dentro de un índice): ya lo cuenta su dueño.
+                continue
+            self.__vistos.add(id(objeto))
+            hijos = gc.get_referents(objeto)
+            if referencias > UMBRAL_COMPARTIDO and objeto is not raiz:
+                compartidos += self.__tamano_propio(objeto, hijos)
+            else:
+                propios += peso * self.__tamano_propio(objeto, hijos)
+            if len(hijos) > self.__muestra:
+                peso *= len(hijos) / self.__muestra
+                hijos = self.__azar.sample(hijos, self.__muestra)
+            pendientes.extend((hijo, peso) for hijo in hijos)
+            del hijos
+        return propios, compartidos
+
+    def olvidar(self, objeto):
+        self.__vistos.discard(id(objeto))
+
+    def medir_entidades(self, entidades: list, contenedores: list = ()) -> float:
+        total = float(sum(sys.getsizeof(c) for c in contenedores))
+        for contenedor in contenedores:
+            self.__vistos.add(id(contenedor))
+        if not entidades:
+            return total
+        elegidas = entidades if len(entidades) <= self.__muestra else self.__azar.sample(entidades, self.__muestra)
+        factor = len(entidades) / len(elegidas)
+        for entidad in elegidas:
+            propios, compartidos = self.medir(entidad)
+            total += propios * factor + compartidos
+        return total
+
+    @staticmethod
+    def __tamano_propio(objeto, hijos: list) -> int:
+        tamano = sys.getsizeof(objeto)
+        if hasattr(objeto, "__dict__") and not isinstance(objeto, (dict, type)) and not any(
+                isinstance(h, dict) for h in hijos):
+            # Atributos guardados en línea (sin __dict__ materializado): un puntero por valor.
+            tamano += TAMANO_PUNTERO * len(hijos)
+        return tamano
+
+
+def _fila(cantidad: int, bytes_estimados: float) -> dict:
+    return {
+        "cantidad": cantidad,
+        "bytes": int(bytes_estimados),
+        "bytes_por_entidad": bytes_estimados / cantidad if cantidad else 0.0,
+    }
+
+
+def reporte_memoria(entidades: dict[str, tuple[list, list]], estructuras: dict[str, tuple[object, int]],
+                    muestra: int = 200, semilla: int = 0) -> dict[str, dict]:
+    # entidades: nombre -> (entidades, contenedores propios); estructuras: nombre -> (objeto, cantidad).
+    fronteras = [objeto for objeto, _ in estructuras.values()]
+    medidor = MedidorMemoria(muestra, semilla, fronteras)
+    reporte = {}
+    for nombre, (lista, contenedores) in entidades.items():
+        reporte[nombre] = _fila(len(lista), medidor.medir_entidades(lista, contenedores))
+    cantidad_entidades = sum(fila["cantidad"] for fila in reporte.values())
+    for nombre, (objeto, cantidad) in estructuras.items():
+        medidor.olvidar(objeto)
+        reporte[nombre] = _fila(cantidad, sum(medidor.medir(objeto, estructura=True)))
+    # El total reparte todos los bytes (entidades e índices) entre las entidades del dominio.
+    reporte["total"] = _fila(cantidad_entidades, sum(fila["bytes"] for fila in reporte.values()))
+    return reporte
+
+
+def formatear_reporte(reporte: dict[str, dict]) -> str:
+    lineas = [f"{'Subsistema':<18}{'Cantidad':>12}{'Bytes':>16}{'Bytes/entidad':>16}"]
+    for nombre, fila in reporte.items():
+        lineas.append(f"{nombre:<18}{fila['cantidad']:>12,}{fila['bytes']:>16,}{fila['bytes_por_entidad']:>16,.1f}")
+    return "\n".join(lineas)
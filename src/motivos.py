@@ -0,0 +1,10 @@
+from enum import IntEnum
+
+
+class MotivoRechazo(IntEnum):
+    DISPONIBLE = 0
+    PACIENTE_INEXISTENTE = 1
+    MEDICO_INEXISTENTE = 2
+    TURNO_OCUPADO = 3
+    ESPECIALIDAD_NO_DISPONIBLE = 4
+    PACIENTE_OCUPADO = 5
@@ -1,14 +1,36 @@
 import unittest
+from datetime import date, datetime
+from src.exepciones import FechaIncorrectaError
 class Paciente:
     def __init__(self, dni: str, nombre: str, fecha_nacimiento: str):
         self.__dni = dni
         self.__nombre = nombre
         self.__fecha_nacimiento = fecha_nacimiento
+        self.__nacimiento = self.__convertir_fecha(fecha_nacimiento)
+
+    @staticmethod
+    def __convertir_fecha(fecha_nacimiento: str) -> int:
+        try:
+            nacimiento = datetime.strptime(fecha_nacimiento.strip(), "%d/%m/%Y").date()
+        except (ValueError, AttributeError):
+            raise FechaIncorrectaError(f"Fecha de nacimiento inválida: {fecha_nacimiento!r} (formato DD/MM/AAAA)")
+        if nacimiento > date.today():
+            raise FechaIncorrectaError(f"La fecha de nacimiento {fecha_nacimiento} está en el futuro")
+        return nacimiento.toordinal()
 
     def obtener_dni(self) -> str:
         return self.__dni
 
+    def obtener_nombre(self) -> str:
+        return self.__nombre
+
+    def obtener_fecha_nacimiento(self) -> date:
+        return date.fromordinal(self.__nacimiento)
+
+    def obtener_nacimiento_ordinal(self) -> int:
+        return self.__nacimiento
+
     def __str__(self) -> str:
         return f"{self.__nombre} - DNI: {self.__dni} - Nacimiento: {self.__fecha_nacimiento}"
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    unittest.main()
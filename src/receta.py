@@ -7,7 +7,33 @@ class Receta:
         self.__paciente = paciente
         self.__medico = medico
         self.__medicamentos = medicamentos
-        self.__fecha = datetime.now()
+        self.__fecha = fecha or datetime.now()
+        self.__version = 0
+        self.__id = None
+
+    def obtener_paciente(self) -> Paciente:
+        return self.__paciente
+
+    def obtener_medico(self) -> Medico:
+        return self.__medico
+
+    def obtener_medicamentos(self) -> list[str]:
+        return list(self.__medicamentos)
+
+    def obtener_fecha(self) -> datetime:
+        return self.__fecha
+
+    def sellar(self, version: int):
+        self.__version = version
+
+    def obtener_version(self) -> int:
+        return self.__version
+
+    def asignar_id(self, id_receta: int):
+        self.__id = id_receta
+
+    def obtener_id(self) -> int | None:
+        return self.__id
 
     def __str__(self):  
         meds = ", ".join(self.__medicamentos)
@@ -0,0 +1,108 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from src.paciente import Paciente
+from src.medico import Medico
+from src.receta import Receta
+
+ORIGEN = datetime(1, 1, 1)
+UN_MICROSEGUNDO = timedelta(microseconds=1)
+
+
+def _microsegundos(fecha: datetime) -> int:
+    return (fecha - ORIGEN) // UN_MICROSEGUNDO
+
+
+class RegistroRecetas:
+    # Todas las recetas emitidas, en columnas (array) en lugar de objetos: el id de una
+    # receta es su posición + 1, así que buscarla es indexar. DNI, matrículas y medicamentos
+    # se guardan una sola vez en 'textos' y cada receta los refiere por número. Por receta
+    # quedan ~32 bytes más 4 por medicamento. Es el único lugar donde viven las recetas de la
+    # clínica: las historias guardan sólo los ids. Con 'ultimo_id' (el mayor id ya usado, por
+    # ejemplo en un archivo histórico) los ids siguen desde ahí: id = ultimo_id + posición + 1.
+    def __init__(self, ultimo_id: int = 0):
+        self.__base = ultimo_id
+        self.__textos: list[str] = []
+        self.__numero_texto: dict[str, int] = {}
+        self.__pacientes = array("I")
+        self.__medicos = array("I")
+        self.__fechas = array("q")
+        self.__versiones = array("I")
+        # Los medicamentos de la receta i son medicamentos[inicios[i]:inicios[i + 1]].
+        self.__inicios = array("I", [0])
+        self.__medicamentos = array("I")
+        self.__por_medico: dict[int, array] = {}
+        # Ids ordenados por (fecha, id). Las recetas se emiten casi siempre en orden; si llega
+        # una anterior a la última se reordena en la próxima consulta por fecha.
+        self.__por_fecha = array("I")
+        self.__desordenado = False
+
+    def agregar(self, receta: Receta) -> int:
+        numero_medico = self.__numero(receta.obtener_medico().obtener_matricula())
+        fecha = _microsegundos(receta.obtener_fecha())
+        self.__pacientes.append(self.__numero(receta.obtener_paciente().obtener_dni()))
+        self.__medicos.append(numero_medico)
+        self.__medicamentos.extend(self.__numero(m) for m in receta.obtener_medicamentos())
+        self.__inicios.append(len(self.__medicamentos))
+        self.__versiones.append(receta.obtener_version())
+        # La fecha va última: una lectura concurrente que ve el id ya ve todas sus columnas.
+        self.__fechas.append(fecha)
+        id_receta = self.__base + len(self.__fechas)
+        self.__por_medico.setdefault(numero_medico, array("I")).append(id_receta)
+        if self.__por_fecha and fecha < self.__clave_fecha(self.__por_fecha[-1])[0]:
+            self.__desordenado = True
+        self.__por_fecha.append(id_receta)
+        receta.asignar_id(id_receta)
+        return id_receta
+
+    def obtener(self, id_receta: int, pacientes: dict[str, Paciente], medicos: dict[str, Medico]) -> Receta | None:
+        posicion = id_receta - self.__base - 1
+        if not 0 <= posicion < len(self.__fechas):
+            return None
+        medicamentos = [self.__textos[n] for n in
+                        self.__medicamentos[self.__inicios[posicion]:self.__inicios[posicion + 1]]]
+        receta = Receta(pacientes[self.__textos[self.__pacientes[posicion]]],
+                        medicos[self.__textos[self.__medicos[posicion]]], medicamentos,
+                        ORIGEN + UN_MICROSEGUNDO * self.__fechas[posicion])
+        receta.sellar(self.__versiones[posicion])
+        receta.asignar_id(id_receta)
+        return receta
+
+    def ids_por_medico(self, matricula: str, despues_de: int = 0, limite: int = 50) -> list[int]:
+        # Paginado por cursor: 'despues_de' es el último id de la página anterior.
+        numero = self.__numero_texto.get(matricula)
+        ids = self.__por_medico.get(numero) if numero is not None else None
+        if not ids:
+            return []
+        inicio = bisect_right(ids, despues_de)
+        return ids[inicio:inicio + limite].tolist()
+
+    def ids_por_fecha(self, desde: datetime = None, hasta: datetime = None, despues_de: int = 0,
+                      limite: int = 50) -> list[int]:
+        # Recetas con fecha en [desde, hasta), por fecha; 'despues_de' es el último id devuelto.
+        if self.__desordenado:
+            self.__por_fecha = array("I", sorted(self.__por_fecha, key=self.__clave_fecha))
+            self.__desordenado = False
+        if despues_de:
+            inicio = bisect_right(self.__por_fecha, self.__clave_fecha(despues_de), key=self.__clave_fecha)
+        elif desde is not None:
+            inicio = bisect_left(self.__por_fecha, (_microsegundos(desde),), key=self.__clave_fecha)
+        else:
+            inicio = 0
+        fin = len(self.__por_fecha)
+        if hasta is not None:
+            fin = bisect_left(self.__por_fecha, (_microsegundos(hasta),), key=self.__clave_fecha)
+        return self.__por_fecha[inicio:min(fin, inicio + limite)].tolist()
+
+    def cantidad(self) -> int:
+        return len(self.__fechas)
+
+    def __clave_fecha(self, id_receta: int) -> tuple[int, int]:
+        return self.__fechas[id_receta - self.__base - 1], id_receta
+
+    def __numero(self, texto: str) -> int:
+        numero = self.__numero_texto.get(texto)
+        if numero is None:
+            numero = self.__numero_texto[texto] = len(self.__textos)
+            self.__textos.append(texto)
+        return numero
@@ -0,0 +1,49 @@
+import weakref
+from collections import OrderedDict
+from functools import partial
+
+
+class CacheRender:
+    def __init__(self, capacidad: int = 4096):
+        if capacidad < 1:
+            raise ValueError("La capacidad debe ser positiva")
+        self.__capacidad = capacidad
+        self.__textos: OrderedDict[int, tuple[weakref.ref, str]] = OrderedDict()
+        self.__aciertos = 0
+        self.__fallos = 0
+
+    def renderizar(self, entidad) -> str:
+        clave = id(entidad)
+        entrada = self.__textos.get(clave)
+        if entrada is not None and entrada[0]() is entidad:
+            self.__textos.move_to_end(clave)
+            self.__aciertos += 1
+            return entrada[1]
+        self.__fallos += 1
+        texto = str(entidad)
+        # Referencia débil: la caché no mantiene vivas historias ya expulsadas ni entidades
+        # reemplazadas. Cuando la entidad muere su entrada se borra, antes de que su id se reutilice.
+        self.__textos[clave] = (weakref.ref(entidad, partial(self.__descartar, clave)), texto)
+        self.__textos.move_to_end(clave)
+        if hasattr(entidad, "agregar_observador"):
+            entidad.agregar_observador(self.invalidar)
+        if len(self.__textos) > self.__capacidad:
+            self.__textos.popitem(last=False)
+        return texto
+
+    def invalidar(self, entidad):
+        self.__textos.pop(id(entidad), None)
+
+    def __descartar(self, clave: int, referencia: weakref.ref):
+        entrada = self.__textos.get(clave)
+        if entrada is not None and entrada[0] is referencia:
+            del self.__textos[clave]
+
+    def limpiar(self):
+        self.__textos.clear()
+
+    def cantidad(self) -> int:
+        return len(self.__textos)
+
+    def obtener_estadisticas(self) -> dict[str, int]:
+        return {"aciertos": self.__aciertos, "fallos": self.__fallos, "entradas": len(self.__textos)}
@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta
+from src.paciente import Paciente
+from src.medico import Medico
+from src.turno import Turno
+
+
+class SerieTurnos:
+    def __init__(self, paciente: Paciente, medico: Medico, especialidad: str,
+                 inicio: datetime, cantidad: int, intervalo_semanas: int = 1):
+        if cantidad < 1 or intervalo_semanas < 1:
+            raise ValueError("La serie debe tener al menos una ocurrencia y un intervalo positivo")
+        self.__paciente = paciente
+        self.__medico = medico
+        self.__especialidad = especialidad
+        self.__inicio = inicio
+        self.__cantidad = cantidad
+        self.__paso = timedelta(weeks=intervalo_semanas)
+        # Índice de ocurrencia -> versión de la clínica en que se excluyó.
+        self.__excepciones: dict[int, int] = {}
+
+    def obtener_paciente(self):
+        return self.__paciente
+
+    def obtener_medico(self):
+        return self.__medico
+
+    def obtener_especialidad(self):
+        return self.__especialidad
+
+    def obtener_inicio(self) -> datetime:
+        return self.__inicio
+
+    def obtener_cantidad(self) -> int:
+        return self.__cantidad
+
+    def obtener_intervalo_semanas(self) -> int:
+        return self.__paso.days // 7
+
+    def obtener_fin(self) -> datetime:
+        return self.__inicio + self.__paso * (self.__cantidad - 1)
+
+    def obtener_excepciones(self) -> list[datetime]:
+        return sorted(self.__inicio + self.__paso * i for i in self.__excepciones)
+
+    def indice_de(self, fecha_hora: datetime) -> int | None:
+        indice, resto = divmod(fecha_hora - self.__inicio, self.__paso)
+        if resto or not 0 <= indice < self.__cantidad or indice in self.__excepciones:
+            return None
+        return indice
+
+    def incluye(self, fecha_hora: datetime) -> bool:
+        return self.indice_de(fecha_hora) is not None
+
+    def excluir(self, fecha_hora: datetime, version: int = 0):
+        indice = self.indice_de(fecha_hora)
+        if indice is None:
+            raise ValueError(f"La serie no tiene una ocurrencia el {fecha_hora}")
+        self.__excepciones[indice] = version
+
+    def ocurrencias(self, desde: datetime = None, hasta: datetime = None, version: int = None):
+        primero = 0
+        if desde is not None and desde > self.__inicio:
+            primero = -((self.__inicio - desde) // self.__paso)
+        for indice in range(primero, self.__cantidad):
+            fecha_hora = self.__inicio + self.__paso * indice
+            if hasta is not None and fecha_hora >= hasta:
+                return
+            excluida = self.__excepciones.get(indice)
+            if excluida is None or (version is not None and excluida > version):
+                yield Turno(self.__paciente, self.__medico, fecha_hora, self.__especialidad)
+
+    def __str__(self):
+        semanas = self.__paso.days // 7
+        return (f"Serie: {self.__paciente} con {self.__medico.obtener_matricula()} en {self.__especialidad} "
+                f"cada {semanas} semana(s) desde {self.__inicio} ({self.__cantidad} turnos, "
+                f"{len(self.__excepciones)} excepciones)")
@@ -0,0 +1,284 @@
+import json
+import sys
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.turno import Turno
+from src.receta import Receta
+from src.exepciones import (
+    PacienteNoEncontradoException,
+    MedicoNoDisponibleException,
+    TurnoOcupadoException,
+    TurnoNoEncontradoException,
+    RecetaInvalidaException,
+    RecetaNoEncontradaException,
+    FechaIncorrectaError,
+)
+
+# Excepción del dominio -> código HTTP. Lo que no figura aquí es un error interno (500).
+CODIGOS_ERROR = (
+    (PacienteNoEncontradoException, 404),
+    (TurnoNoEncontradoException, 404),
+    (RecetaNoEncontradaException, 404),
+    (MedicoNoDisponibleException, 409),
+    (TurnoOcupadoException, 409),
+    (RecetaInvalidaException, 400),
+    (FechaIncorrectaError, 400),
+    (ValueError, 400),
+    (KeyError, 400),
+    (TypeError, 400),
+)
+
+
+class SolicitudInvalidaError(ValueError):
+    pass
+
+
+def turno_a_json(turno: Turno) -> dict:
+    return {
+        "dni": turno.obtener_paciente().obtener_dni(),
+        "matricula": turno.obtener_medico().obtener_matricula(),
+        "especialidad": turno.obtener_especialidad(),
+        "fecha_hora": turno.obtener_fecha_hora().isoformat(),
+    }
+
+
+def paciente_a_json(paciente: Paciente) -> dict:
+    return {
+        "dni": paciente.obtener_dni(),
+        "nombre": paciente.obtener_nombre(),
+        "fecha_nacimiento": paciente.obtener_fecha_nacimiento().strftime("%d/%m/%Y"),
+    }
+
+
+def medico_a_json(medico: Medico) -> dict:
+    return {
+        "matricula": medico.obtener_matricula(),
+        "nombre": medico.obtener_nombre(),
+        "especialidades": [
+            {"tipo": e.obtener_especialidad(), "dias": e.obtener_dias()} for e in medico.obtener_especialidades()
+        ],
+    }
+
+
+def receta_a_json(receta: Receta) -> dict:
+    return {
+        "id": receta.obtener_id(),
+        "dni": receta.obtener_paciente().obtener_dni(),
+        "matricula": receta.obtener_medico().obtener_matricula(),
+        "medicamentos": receta.obtener_medicamentos(),
+        "fecha": receta.obtener_fecha().isoformat(),
+    }
+
+
+class ManejadorClinica(BaseHTTPRequestHandler):
+    # HTTP/1.1: las conexiones se mantienen abiertas y las solicitudes encadenadas
+    # (pipelining) se atienden en orden leyendo del mismo flujo.
+    protocol_version = "HTTP/1.1"
+    # Cabeceras y cuerpo salen en escrituras separadas: con Nagle activo la segunda espera
+    # el ACK retardado del cliente (~40 ms por respuesta).
+    disable_nagle_algorithm = True
+    clinica: Clinica = None
+
+    def do_GET(self):
+        self.__atender("GET")
+
+    def do_POST(self):
+        self.__atender("POST")
+
+    def do_DELETE(self):
+        self.__atender("DELETE")
+
+    def log_message(self, formato, *args):
+        pass
+
+    def __atender(self, metodo: str):
+        partes = urlsplit(self.path)
+        ruta = [p for p in partes.path.split("/") if p]
+        consulta = {clave: valores[-1] for clave, valores in parse_qs(partes.query).items()}
+        try:
+            cuerpo = self.__leer_cuerpo()
+            codigo, respuesta = self.__despachar(metodo, ruta, consulta, cuerpo)
+        except Exception as e:
+            codigo = next((c for tipo, c in CODIGOS_ERROR if isinstance(e, tipo)), 500)
+            respuesta = {"error": str(e) or type(e).__name__}
+        datos = json.dumps(respuesta, ensure_ascii=False).encode("utf-8")
+        self.send_response(codigo)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(datos)))
+        self.end_headers()
+        self.wfile.write(datos)
+
+    def __leer_cuerpo(self) -> dict:
+        largo = int(self.headers.get("Content-Length") or 0)
+        if not largo:
+            return {}
+        try:
+            cuerpo = json.loads(self.rfile.read(largo))
+        except json.JSONDecodeError as e:
+            raise SolicitudInvalidaError(f"JSON inválido: {e}")
+        if not isinstance(cuerpo, dict):
+            raise SolicitudInvalidaError("El cuerpo debe ser un objeto JSON")
+        return cuerpo
+
+    def __clave_idempotencia(self) -> str | None:
+        return self.headers.get("Idempotency-Key")
+
+    def __despachar(self, metodo: str, ruta: list[str], consulta: dict, cuerpo: dict) -> tuple[int, object]:
+        clinica = self.clinica
+        recurso = ruta[0] if ruta else ""
+        match (metodo, recurso, len(ruta)):
+            case ("GET", "pacientes", 1):
+                if "nombre" in consulta:
+                    pacientes = clinica.buscar_pacientes(consulta["nombre"], int(consulta.get("limite", 10)))
+                else:
+                    pacientes = clinica.obtener_pacientes()
+                return 200, [paciente_a_json(p) for p in pacientes]
+            case ("POST", "pacientes", 1):
+                paciente = Paciente(cuerpo["dni"], cuerpo["nombre"], cuerpo["fecha_nacimiento"])
+                clinica.agregar_paciente(paciente)
+                return 201, paciente_a_json(paciente)
+            case ("GET", "medicos", 1):
+                medicos = clinica.buscar_medicos(consulta.get("nombre"), consulta.get("especialidad"),
+                                                 consulta.get("dia"))
+                return 200, [medico_a_json(m) for m in medicos]
+            case ("POST", "medicos", 1):
+                medico = Medico(cuerpo["matricula"], cuerpo["nombre"])
+                for especialidad in cuerpo.get("especialidades", []):
+                    medico.agregar_especialidad(Especialidad(especialidad["tipo"], especialidad["dias"]))
+                clinica.agregar_medico(medico)
+                return 201, medico_a_json(medico)
+            case ("GET", "turnos", 1):
+                turnos = clinica.buscar_turnos(consulta.get("dni"), consulta.get("matricula"),
+                                               consulta.get("especialidad"), _fecha_hora(consulta.get("desde")),
+                                               _fecha_hora(consulta.get("hasta")))
+                return 200, [turno_a_json(t) for t in turnos]
+            case ("POST", "turnos", 1) if "matricula" not in cuerpo:
+                # Sin matrícula se asigna el médico menos cargado de la especialidad.
+                turno = clinica.agendar_turno_automatico(cuerpo["dni"], cuerpo["especialidad"],
+                                                         _fecha_hora(cuerpo["fecha_hora"]),
+                                                         self.__clave_idempotencia())
+                return 201, turno_a_json(turno)
+            case ("POST", "turnos", 1):
+                turno = clinica.agendar_turno(cuerpo["dni"], cuerpo["matricula"], cuerpo["especialidad"],
+                                              _fecha_hora(cuerpo["fecha_hora"]), self.__clave_idempotencia())
+                return 201, turno_a_json(turno)
+            case ("DELETE", "turnos", 1):
+                turno = clinica.cancelar_turno(consulta["matricula"], _fecha_hora(consulta["fecha_hora"]),
+                                               self.__clave_idempotencia())
+                return 200, turno_a_json(turno)
+            case ("POST", "recetas", 1):
+                receta = clinica.emitir_receta(cuerpo["dni"], cuerpo["matricula"], cuerpo["medicamentos"],
+                                               self.__clave_idempotencia())
+                return 201, receta_a_json(receta)
+            case ("GET", "recetas", 2):
+                receta = clinica.obtener_receta(int(ruta[1]))
+                if receta is None:
+                    raise RecetaNoEncontradaException(f"No existe la receta {ruta[1]}")
+                return 200, receta_a_json(receta)
+            case ("GET", "recetas", 1):
+                despues_de = int(consulta.get("despues_de", 0))
+                limite = int(consulta.get("limite", 50))
+                if "matricula" in consulta:
+                    recetas = clinica.obtener_recetas_por_medico(consulta["matricula"], despues_de, limite)
+                else:
+                    recetas = clinica.obtener_recetas_por_fecha(_fecha_hora(consulta.get("desde")),
+                                                                _fecha_hora(consulta.get("hasta")), despues_de, limite)
+                return 200, [receta_a_json(r) for r in recetas]
+            case ("GET", "historias", 2):
+                historia = clinica.obtener_historia_clinica(ruta[1])
+                if historia is None:
+                    raise PacienteNoEncontradoException(f"No se encontró paciente con DNI {ruta[1]}")
+                return 200, {
+                    "paciente": paciente_a_json(historia.get_paciente()),
+                    "turnos": [turno_a_json(t) for t in historia.obtener_turnos()],
+                    "recetas": [receta_a_json(r) for r in historia.obtener_recetas()],
+                }
+            case ("GET", "agendas", 2):
+                dia = date.fromisoformat(ruta[1])
+                if "matricula" in consulta:
+                    return 200, [turno_a_json(t) for t in clinica.obtener_agenda(consulta["matricula"], dia)]
+                return 200, {m: [turno_a_json(t) for t in turnos]
+                             for m, turnos in clinica.obtener_agendas_del_dia(dia).items()}
+            case ("GET", "memoria", 1):
+                return 200, clinica.reporte_memoria(int(consulta.get("muestra", 200)))
+            case ("GET", "disponibilidad", 1):
+                motivo = clinica.puede_agendar(consulta["dni"], consulta["matricula"], consulta["especialidad"],
+                                               _fecha_hora(consulta["fecha_hora"]))
+                return 200, {"disponible": not motivo, "motivo": motivo.name}
+        return 404, {"error": f"No existe {metodo} {self.path}"}
+
+
+def _fecha_hora(texto: str | None) -> datetime | None:
+    return datetime.fromisoformat(texto) if texto else None
+
+
+RESPUESTA_OCUPADO = json.dumps({"error": "Servidor ocupado, reintente más tarde"}).encode("utf-8")
+
+
+class ServidorClinica(HTTPServer):
+    # Las conexiones se atienden en un pool de hilos acotado. Con keep-alive cada conexión
+    # ocupa un hilo mientras esté abierta, así que 'hilos' limita las conexiones simultáneas:
+    # con todos ocupados la conexión nueva recibe un 503 y se cierra, en lugar de quedar en
+    # cola. Una conexión sin solicitudes durante 'espera_inactiva' segundos se cierra.
+    daemon_threads = True
+
+    def __init__(self, clinica: Clinica, host: str = "127.0.0.1", puerto: int = 8080, hilos: int = 32,
+                 espera_inactiva: float = 15.0):
+        manejador = type("Manejador", (ManejadorClinica,), {"clinica": clinica, "timeout": espera_inactiva})
+        super().__init__((host, puerto), manejador)
+        self.__pool = ThreadPoolExecutor(max_workers=hilos, thread_name_prefix="clinica-http")
+        self.__libres = threading.BoundedSemaphore(hilos)
+
+    def process_request(self, request, client_address):
+        if not self.__libres.acquire(blocking=False):
+            self.__rechazar(request)
+            return
+        self.__pool.submit(self.__atender_conexion, request, client_address)
+
+    def __rechazar(self, request):
+        try:
+            request.sendall(b"HTTP/1.1 503 Service Unavailable\r\n"
+                            b"Content-Type: application/json; charset=utf-8\r\n"
+                            b"Content-Length: " + str(len(RESPUESTA_OCUPADO)).encode() + b"\r\n"
+                            b"Retry-After: 1\r\nConnection: close\r\n\r\n" + RESPUESTA_OCUPADO)
+        except OSError:
+            pass
+        finally:
+            self.shutdown_request(request)
+
+    def __atender_conexion(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self.__libres.release()
+
+    def obtener_puerto(self) -> int:
+        return self.server_address[1]
+
+    def server_close(self):
+        super().server_close()
+        self.__pool.shutdown(wait=False, cancel_futures=True)
+
+
+if __name__ == "__main__":
+    puerto = int(sys.argv[1]) if len(sys.argv) > 1 else 8080
+    with ServidorClinica(Clinica(), puerto=puerto) as servidor:
+        print(f"Clínica escuchando en http://127.0.0.1:{servidor.obtener_puerto()}")
+        try:
+            servidor.serve_forever()
+        except KeyboardInterrupt:
+            pass
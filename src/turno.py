@@ -9,6 +9,8 @@ class Turno:
         self.__medico = medico
         self.__fecha_hora = fecha_hora
         self.__especialidad = especialidad
+        self.__cancelado = False
+        self.__version_baja = None
 
     def obtener_medico(self):
         return self.__medico
@@ -16,6 +18,23 @@ class Turno:
     def obtener_fecha_hora(self):
         return self.__fecha_hora
 
+    def obtener_paciente(self):
+        return self.__paciente
+
+    def obtener_especialidad(self):
+        return self.__especialidad
+
+    def cancelar(self, version: int = 0):
+        self.__cancelado = True
+        self.__version_baja = version
+
+    def esta_cancelado(self) -> bool:
+        return self.__cancelado
+
+    def vigente_en(self, version: int) -> bool:
+        # Un turno cancelado sigue vigente para las vistas abiertas antes de la cancelación.
+        return not self.__cancelado or self.__version_baja > version
+
     def __str__(self):
         return f"Turno: {self.__paciente} con {self.__medico.obtener_matricula()} en {self.__especialidad} el {self.__fecha_hora}"
 if __name__ == "__main__":
@@ -0,0 +1,72 @@
+from itertools import islice
+from src.paciente import Paciente
+from src.medico import Medico
+from src.turno import Turno
+from src.serie import SerieTurnos
+from src.historiaclinica import HistoriaClinica
+from src.archivo import ArchivoHistorico
+from src.cache_historias import CacheHistorias
+
+
+class VistaClinica:
+    # Lectura consistente de la clínica en una versión dada. Las estructuras capturadas
+    # no se modifican después de abrir la vista: la clínica las copia antes de escribir
+    # (diccionarios) o sólo les agrega elementos al final (lista de turnos). De las historias
+    # sólo se leen el paciente y las recetas, filtradas por versión.
+    def __init__(self, version: int, pacientes: dict[str, Paciente], medicos: dict[str, Medico],
+                 historias: CacheHistorias, turnos: list[Turno], cantidad_turnos: int,
+                 series: dict[str, list[SerieTurnos]], archivo: ArchivoHistorico = None):
+        self.__version = version
+        self.__pacientes = pacientes
+        self.__medicos = medicos
+        self.__historias = historias
+        self.__turnos = turnos
+        self.__cantidad_turnos = cantidad_turnos
+        self.__series = series
+        # Los segmentos de archivo son inmutables: la vista ve los escritos hasta su versión.
+        self.__archivo = archivo
+        self.__turnos_por_paciente: dict[str, list[Turno]] | None = None
+
+    def obtener_version(self) -> int:
+        return self.__version
+
+    def obtener_pacientes(self) -> list[Paciente]:
+        return list(self.__pacientes.values())
+
+    def obtener_medicos(self) -> list[Medico]:
+        return list(self.__medicos.values())
+
+    def obtener_series(self) -> list[SerieTurnos]:
+        return [serie for series in self.__series.values() for serie in series]
+
+    def obtener_turnos(self, incluir_series: bool = True, incluir_archivados: bool = True) -> list[Turno]:
+        version = self.__version
+        turnos = []
+        if incluir_archivados and self.__archivo is not None:
+            turnos = self.__archivo.buscar_turnos(self.__pacientes, self.__medicos, version=version)
+        turnos.extend(t for t in islice(self.__turnos, self.__cantidad_turnos) if t.vigente_en(version))
+        if incluir_series:
+            for serie in self.obtener_series():
+                turnos.extend(serie.ocurrencias(version=version))
+        return turnos
+
+    def obtener_historia_clinica(self, dni: str) -> HistoriaClinica | None:
+        # Las historias no se copian al escribir: un paciente posterior a la vista no existe en ella.
+        original = self.__historias.get(dni) if dni in self.__pacientes else None
+        if original is None:
+            return None
+        if self.__turnos_por_paciente is None:
+            # Se agrupa una sola vez por vista: los reportes suelen recorrer muchas historias.
+            por_paciente: dict[str, list[Turno]] = {}
+            for turno in self.obtener_turnos(incluir_archivados=False):
+                por_paciente.setdefault(turno.obtener_paciente().obtener_dni(), []).append(turno)
+            self.__turnos_por_paciente = por_paciente
+        historia = HistoriaClinica(original.get_paciente())
+        if self.__archivo is not None:
+            historia.agregar_turnos(self.__archivo.cargar_paciente(original.get_paciente(), self.__medicos,
+                                                                   self.__version)[0])
+        historia.agregar_turnos(self.__turnos_por_paciente.get(dni, []))
+        for receta in original.obtener_recetas():
+            if receta.obtener_version() <= self.__version:
+                historia.agregar_receta(receta)
+        return historia
@@ -0,0 +1,88 @@
+import unittest
+import pickle
+from datetime import date, datetime, timedelta
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.agendas import AgendasDiarias
+from src.eventos import CanalEventos, TipoEvento
+
+
+class TestAgendasDiarias(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial: dos pacientes, dos médicos y turnos desordenados"""
+        self.clinica = Clinica()
+        self.clinica.agregar_paciente(Paciente("111", "Ana Gómez", "01/01/1990"))
+        self.clinica.agregar_paciente(Paciente("222", "Luis Díaz", "02/02/1985"))
+        cardiologo = Medico("MP-1", "Dr. García", "Cardiología")
+        cardiologo.agregar_especialidad(Especialidad("Cardiología", ["lunes"]))
+        pediatra = Medico("MP-2", "Dra. López", "Pediatría")
+        pediatra.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+        self.clinica.agregar_medico(cardiologo)
+        self.clinica.agregar_medico(pediatra)
+        self.lunes = date(2025, 6, 2)
+        self.clinica.agendar_turno("111", "MP-1", "Cardiología", datetime(2025, 6, 2, 11, 0))
+        self.clinica.agendar_turno("222", "MP-1", "Cardiología", datetime(2025, 6, 2, 9, 0))
+        self.clinica.agendar_turno("111", "MP-2", "Pediatría", datetime(2025, 6, 2, 10, 0))
+
+    def horas(self, turnos):
+        return [t.obtener_fecha_hora().hour for t in turnos]
+
+    def test_agenda_ordenada_por_hora(self):
+        """Test 1: La agenda de un médico en un día sale ordenada por hora"""
+        self.assertEqual(self.horas(self.clinica.obtener_agenda("MP-1", self.lunes)), [9, 11])
+        self.assertEqual(self.clinica.obtener_agenda("MP-1", date(2025, 6, 9)), [])
+
+    def test_se_actualiza_al_agendar_y_cancelar(self):
+        """Test 2: Agendar y cancelar después de la primera consulta actualizan la agenda"""
+        self.clinica.obtener_agenda("MP-1", self.lunes)
+        self.clinica.agendar_turno("222", "MP-1", "Cardiología", datetime(2025, 6, 2, 10, 0))
+        self.clinica.cancelar_turno("MP-1", datetime(2025, 6, 2, 9, 0))
+        self.assertEqual(self.horas(self.clinica.obtener_agenda("MP-1", self.lunes)), [10, 11])
+
+    def test_agendas_del_dia(self):
+        """Test 3: Todas las agendas del día, sólo de los médicos con turnos"""
+        self.clinica.cancelar_turno("MP-2", datetime(2025, 6, 2, 10, 0))
+        agendas = self.clinica.obtener_agendas_del_dia(self.lunes)
+        self.assertEqual(list(agendas), ["MP-1"])
+        self.assertEqual(self.clinica.obtener_agendas_del_dia(date(2025, 6, 3)), {})
+
+    def test_series_en_la_agenda(self):
+        """Test 4: Las ocurrencias de una serie aparecen y se quitan al cancelarlas"""
+        self.clinica.obtener_agendas_del_dia(self.lunes)
+        inicio = datetime(2025, 6, 9, 8, 0)
+        self.clinica.agendar_serie("222", "MP-2", "Pediatría", inicio, 3)
+        self.clinica.cancelar_turno("MP-2", inicio + timedelta(weeks=1))
+        self.assertEqual(self.horas(self.clinica.obtener_agenda("MP-2", date(2025, 6, 9))), [8])
+        self.assertEqual(self.clinica.obtener_agenda("MP-2", date(2025, 6, 16)), [])
+        self.assertEqual(self.horas(self.clinica.obtener_agenda("MP-2", date(2025, 6, 23))), [8])
+
+    def test_reconstruye_si_se_pierden_eventos(self):
+        """Test 5: Si la suscripción descarta eventos la agenda se reconstruye completa"""
+        canal = CanalEventos()
+        clinica = self.clinica
+        agendas = AgendasDiarias(canal, clinica.abrir_vista, capacidad=1)
+        self.assertEqual(self.horas(agendas.obtener_agenda("MP-1", self.lunes)), [9, 11])
+        for turno in clinica.obtener_turnos():
+            canal.publicar(TipoEvento.TURNO_CANCELADO, turno)
+        # Se descartaron eventos: la agenda vuelve a leerse de la clínica, que no cambió.
+        self.assertEqual(self.horas(agendas.obtener_agenda("MP-1", self.lunes)), [9, 11])
+
+    def test_clinica_serializada_reconstruye_agendas(self):
+        """Test 6: Al restaurar una clínica serializada sus agendas se reconstruyen"""
+        self.clinica.obtener_agenda("MP-1", self.lunes)
+        copia = pickle.loads(pickle.dumps(self.clinica))
+        copia.agendar_turno("222", "MP-1", "Cardiología", datetime(2025, 6, 2, 12, 0))
+        self.assertEqual(self.horas(copia.obtener_agenda("MP-1", self.lunes)), [9, 11, 12])
+        self.assertEqual(self.horas(self.clinica.obtener_agenda("MP-1", self.lunes)), [9, 11])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from datetime import datetime, date
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.analitica import AnaliticaTurnos, np
+from src.turno import Turno
+from src.medico import Medico
+
+
+@unittest.skipIf(np is None, "numpy no está instalado")
+class TestAnaliticaTurnos(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial: turnos de dos médicos en dos semanas"""
+        garcia = Medico("MP-1", "Dr. García", None)
+        lopez = Medico("MP-2", "Dra. López", None)
+        self.turnos = [
+            Turno(None, garcia, datetime(2025, 6, 2, 10, 0), "Cardiología"),
+            Turno(None, garcia, datetime(2025, 6, 2, 10, 30), "Cardiología"),
+            Turno(None, garcia, datetime(2025, 6, 9, 10, 0), "Cardiología"),
+            Turno(None, lopez, datetime(2025, 6, 3, 15, 0), "Pediatría"),
+        ]
+        self.analitica = AnaliticaTurnos(self.turnos)
+
+    def test_totales(self):
+        """Test 1: Totales por médico y por especialidad"""
+        self.assertEqual(self.analitica.total_por_medico(), {"MP-1": 3, "MP-2": 1})
+        self.assertEqual(self.analitica.total_por_especialidad(), {"Cardiología": 3, "Pediatría": 1})
+
+    def test_matriz_medicos(self):
+        """Test 2: La matriz médico x día x hora cuenta cada franja"""
+        matriz = self.analitica.matriz_medicos()
+        self.assertEqual(matriz.shape, (2, 7, 24))
+        self.assertEqual(matriz[0, 0, 10], 3)
+        self.assertEqual(matriz[1, 1, 15], 1)
+        self.assertEqual(matriz.sum(), 4)
+
+    def test_mapa_de_calor(self):
+        """Test 3: El mapa de calor agrupa por día de la semana y hora"""
+        mapa = self.analitica.mapa_de_calor()
+        self.assertEqual(mapa.shape, (7, 24))
+        self.assertEqual(mapa[0, 10], 3)
+
+    def test_tendencia_semanal(self):
+        """Test 4: La tendencia semanal arranca el lunes de la primera semana"""
+        self.assertEqual(self.analitica.tendencia_semanal(), [(date(2025, 6, 2), 3), (date(2025, 6, 9), 1)])
+
+    def test_utilizacion(self):
+        """Test 5: La utilización divide por las semanas observadas y la capacidad"""
+        utilizacion = self.analitica.utilizacion_medicos(turnos_por_hora=2)
+        self.assertAlmostEqual(utilizacion[0, 0, 10], 0.75)
+
+    def test_sin_turnos(self):
+        """Test 6: Sin turnos los resultados quedan vacíos"""
+        vacia = AnaliticaTurnos([])
+        self.assertEqual(vacia.tendencia_semanal(), [])
+        self.assertEqual(vacia.matriz_medicos().shape, (0, 7, 24))
+
+
+if __name__ == "__main__":
+    unittest.main()
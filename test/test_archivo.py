@@ -0,0 +1,188 @@
+import unittest
+import pickle
+import struct
+import zlib
+import threading
+import time
+from unittest.mock import patch
+import tempfile
+from datetime import datetime, timedelta, date
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.receta import Receta
+from src.archivo import ArchivoHistorico
+from src.agendas import AgendasDiarias
+from src.exepciones import TurnoOcupadoException, TurnoSuperpuestoException
+
+
+class TestArchivoHistorico(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial: clínica con archivo en un directorio temporal y turnos de dos años"""
+        self.directorio = tempfile.TemporaryDirectory()
+        self.clinica = Clinica(ArchivoHistorico(self.directorio.name))
+        for dni in ("111", "222"):
+            self.clinica.agregar_paciente(Paciente(dni, f"Paciente {dni}", "01/01/1990"))
+        medico = Medico("MP-1", "Dr. García")
+        medico.agregar_especialidad(Especialidad("Cardiología", ["lunes"]))
+        self.clinica.agregar_medico(medico)
+        self.viejo = datetime(2023, 6, 5, 10, 0)
+        self.nuevo = datetime(2025, 6, 2, 10, 0)
+        self.clinica.agendar_turno("111", "MP-1", "Cardiología", self.viejo)
+        self.clinica.agendar_turno("222", "MP-1", "Cardiología", self.viejo + timedelta(weeks=1))
+        self.clinica.agendar_turno("111", "MP-1", "Cardiología", self.nuevo)
+        self.clinica.incorporar_receta(Receta(self.clinica.obtener_pacientes()[0], medico, ["Aspirina"],
+                                              datetime(2023, 6, 5, 11, 0)))
+        self.clinica.emitir_receta("111", "MP-1", ["Ibuprofeno"])
+        self.horizonte = datetime(2024, 1, 1)
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def test_archivar_saca_de_memoria(self):
+        """Test 1: Lo anterior al horizonte sale de la memoria y queda en un segmento"""
+        self.assertEqual(self.clinica.archivar(self.horizonte), 3)
+        self.assertEqual(self.clinica.reporte_memoria()["turnos"]["cantidad"], 1)
+        historia = self.clinica.obtener_historia_clinica("111")
+        self.assertEqual(len(historia.obtener_recetas(incluir_archivadas=False)), 1)
+        self.assertEqual(len(self.clinica.obtener_turnos(incluir_archivados=False)), 1)
+        self.assertEqual(len(os.listdir(self.directorio.name)), 1)
+
+    def test_historia_completa_tras_archivar(self):
+        """Test 2: La historia clínica trae de disco los turnos y recetas archivados"""
+        self.clinica.archivar(self.horizonte)
+        historia = self.clinica.obtener_historia_clinica("111")
+        self.assertEqual([t.obtener_fecha_hora() for t in historia.obtener_turnos()], [self.viejo, self.nuevo])
+        self.assertEqual([r.obtener_medicamentos() for r in historia.obtener_recetas()],
+                         [["Aspirina"], ["Ibuprofeno"]])
+        self.assertEqual(len(historia.obtener_recetas(incluir_archivadas=False)), 1)
+
+    def test_busquedas_y_agendas_completas(self):
+        """Test 3: Búsquedas, listados y agendas de días archivados siguen completos"""
+        self.clinica.archivar(self.horizonte)
+        self.assertEqual(len(self.clinica.obtener_turnos()), 3)
+        self.assertEqual(len(self.clinica.buscar_turnos(matricula="MP-1")), 3)
+        self.assertEqual(len(self.clinica.buscar_turnos(dni="222", hasta=self.horizonte)), 1)
+        self.assertEqual(self.clinica.buscar_turnos(desde=self.horizonte)[0].obtener_fecha_hora(), self.nuevo)
+        self.assertEqual(len(self.clinica.obtener_agenda("MP-1", date(2023, 6, 5))), 1)
+        self.assertEqual(list(self.clinica.obtener_agendas_del_dia(date(2023, 6, 12))), ["MP-1"])
+
+    def test_franja_archivada_sigue_ocupada(self):
+        """Test 4: No se puede volver a agendar un horario que quedó en el archivo"""
+        self.clinica.archivar(self.horizonte)
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("222", "MP-1", "Cardiología", self.viejo)
+
+    def test_vistas_sin_duplicados(self):
+        """Test 5: Una vista abierta antes de archivar y otra después ven los mismos turnos"""
+        antes = self.clinica.abrir_vista()
+        self.clinica.archivar(self.horizonte)
+        despues = self.clinica.abrir_vista()
+        self.assertEqual(len(antes.obtener_turnos()), 3)
+        self.assertEqual(len(despues.obtener_turnos()), 3)
+        self.assertEqual(len(despues.obtener_historia_clinica("111").obtener_turnos()), 2)
+
+    def test_archivar_dos_veces_y_reabrir(self):
+        """Test 6: Un segundo horizonte agrega un segmento y el directorio se puede reabrir"""
+        self.clinica.archivar(self.horizonte)
+        self.clinica.archivar(self.nuevo + timedelta(days=1))
+        self.assertEqual(self.clinica.obtener_turnos(incluir_archivados=False), [])
+        reabierto = ArchivoHistorico(self.directorio.name)
+        self.assertEqual(reabierto.cantidad_segmentos(), 2)
+        self.assertEqual(reabierto.cantidad_archivada(), 4)
+        restaurada = pickle.loads(pickle.dumps(self.clinica))
+        self.assertEqual(len(restaurada.obtener_historia_clinica("111").obtener_recetas()), 2)
+
+    def test_sin_archivo_configurado(self):
+        """Test 7: Archivar sin archivo configurado es un error"""
+        with self.assertRaises(ValueError):
+            Clinica().archivar(self.horizonte)
+
+    def test_archivar_y_consultar_agenda_en_paralelo(self):
+        """Test 8: Archivar mientras otro hilo arma las agendas no traba a ninguno"""
+        descartando = threading.Event()
+        descartar_original = AgendasDiarias.descartar_anteriores
+
+        def descartar_lento(agendas, dia):
+            # Justo antes de tomar el cerrojo de las agendas, el otro hilo las consulta.
+            descartando.set()
+            time.sleep(0.2)
+            descartar_original(agendas, dia)
+
+        resultado = []
+
+        def consultar():
+            descartando.wait(5)
+            resultado.append(self.clinica.obtener_agenda("MP-1", self.nuevo.date()))
+
+        with patch.object(AgendasDiarias, "descartar_anteriores", descartar_lento):
+            hilos = [threading.Thread(target=self.clinica.archivar, args=(self.horizonte,), daemon=True),
+                     threading.Thread(target=consultar, daemon=True)]
+            for hilo in hilos:
+                hilo.start()
+            for hilo in hilos:
+                hilo.join(5)
+        self.assertFalse(any(hilo.is_alive() for hilo in hilos))
+        self.assertEqual([t.obtener_fecha_hora() for t in resultado[0]], [self.nuevo])
+
+    def test_clinica_nueva_sobre_archivo_existente(self):
+        """Test 9: Una clínica nueva que reabre el directorio ve lo archivado por la anterior"""
+        self.clinica.archivar(self.horizonte)
+        clinica = Clinica(ArchivoHistorico(self.directorio.name))
+        for dni in ("111", "222"):
+            clinica.agregar_paciente(Paciente(dni, f"Paciente {dni}", "01/01/1990"))
+        medico = Medico("MP-1", "Dr. García")
+        medico.agregar_especialidad(Especialidad("Cardiología", ["lunes"]))
+        clinica.agregar_medico(medico)
+        esperados = [self.viejo, self.viejo + timedelta(weeks=1)]
+        self.assertEqual([t.obtener_fecha_hora() for t in clinica.obtener_turnos()], esperados)
+        self.assertEqual([t.obtener_fecha_hora() for t in clinica.abrir_vista().obtener_turnos()], esperados)
+        historia = clinica.obtener_historia_clinica("111")
+        self.assertEqual([t.obtener_fecha_hora() for t in historia.obtener_turnos()], [self.viejo])
+        self.assertEqual([r.obtener_medicamentos() for r in historia.obtener_recetas()], [["Aspirina"]])
+
+    def test_segmento_sin_ids_de_recetas(self):
+        """Test 10: Un segmento escrito antes de los ids de recetas se sigue leyendo"""
+        ruta = os.path.join(self.directorio.name, "segmento-000000.arch")
+        fecha = datetime(2023, 6, 5, 11, 0)
+        bloque = zlib.compress(pickle.dumps(([], [("111", "MP-1", ("Aspirina",), fecha, 3)])))
+        encabezado = pickle.dumps({"version": 3, "horizonte": self.horizonte, "desde": fecha, "hasta": fecha,
+                                   "cubetas": {zlib.crc32(b"111") % 64: (0, len(bloque))}, "cantidad": 1})
+        with open(ruta, "wb") as archivo:
+            archivo.write(b"ARCH" + struct.pack("<I", len(encabezado)) + encabezado + bloque)
+        clinica = Clinica(ArchivoHistorico(self.directorio.name))
+        clinica.agregar_paciente(Paciente("111", "Paciente 111", "01/01/1990"))
+        clinica.agregar_medico(Medico("MP-1", "Dr. García"))
+        receta = clinica.obtener_historia_clinica("111").obtener_recetas()[0]
+        self.assertEqual(receta.obtener_medicamentos(), ["Aspirina"])
+        self.assertIsNone(receta.obtener_id())
+
+
+    def test_archivo_reabierto_sin_entidades_registradas(self):
+        """Test 11: Lo archivado de pacientes y médicos todavía no registrados se omite sin error"""
+        self.clinica.archivar(self.horizonte)
+        clinica = Clinica(ArchivoHistorico(self.directorio.name))
+        self.assertEqual(clinica.obtener_turnos(), [])
+        clinica.agregar_paciente(Paciente("111", "Paciente 111", "01/01/1990"))
+        self.assertEqual(clinica.obtener_turnos(), [])
+        self.assertEqual(clinica.obtener_historia_clinica("111").obtener_turnos(), [])
+
+    def test_paciente_superpuesto_con_turno_archivado(self):
+        """Test 12: Un paciente no puede agendar encima de un turno suyo ya archivado"""
+        self.clinica.archivar(self.horizonte)
+        otro = Medico("MP-2", "Dra. López")
+        otro.agregar_especialidad(Especialidad("Cardiología", ["lunes"]))
+        self.clinica.agregar_medico(otro)
+        with self.assertRaises(TurnoSuperpuestoException):
+            self.clinica.agendar_turno("111", "MP-2", "Cardiología", self.viejo + timedelta(minutes=15))
+        self.clinica.agendar_turno("222", "MP-2", "Cardiología", self.viejo + timedelta(minutes=15))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+from collections import Counter
+from datetime import datetime, timedelta
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.exepciones import MedicoNoDisponibleException, TurnoOcupadoException, TurnoSuperpuestoException
+
+
+class TestAgendarTurnoAutomatico(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial: tres cardiólogos de los lunes, un pediatra y veinte pacientes"""
+        self.clinica = Clinica()
+        for dni in range(20):
+            self.clinica.agregar_paciente(Paciente(str(dni), f"Paciente {dni}", "01/01/1980"))
+        for numero in range(3):
+            medico = Medico(f"MP-{numero}", f"Dr. {numero}")
+            medico.agregar_especialidad(Especialidad("Cardiología", ["lunes"]))
+            self.clinica.agregar_medico(medico)
+        pediatra = Medico("MP-9", "Dra. López")
+        pediatra.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+        self.clinica.agregar_medico(pediatra)
+        self.lunes = datetime(2025, 6, 2, 8, 0)
+
+    def matricula(self, turno):
+        return turno.obtener_medico().obtener_matricula()
+
+    def test_reparte_la_carga(self):
+        """Test 1: Los turnos se reparten en partes iguales entre los médicos de la especialidad"""
+        turnos = [self.clinica.agendar_turno_automatico(str(dni), "Cardiología", self.lunes + timedelta(hours=dni // 3))
+                  for dni in range(12)]
+        self.assertEqual(Counter(self.matricula(t) for t in turnos), {"MP-0": 4, "MP-1": 4, "MP-2": 4})
+
+    def test_elige_al_menos_cargado(self):
+        """Test 2: Con turnos agendados a mano, el automático va al médico más libre"""
+        self.clinica.agendar_turno("0", "MP-0", "Cardiología", self.lunes)
+        self.clinica.agendar_turno("1", "MP-1", "Cardiología", self.lunes + timedelta(hours=1))
+        turno = self.clinica.agendar_turno_automatico("2", "Cardiología", self.lunes + timedelta(hours=2))
+        self.assertEqual(self.matricula(turno), "MP-2")
+        self.clinica.cancelar_turno("MP-0", self.lunes)
+        turno = self.clinica.agendar_turno_automatico("3", "Cardiología", self.lunes + timedelta(hours=3))
+        self.assertEqual(self.matricula(turno), "MP-0")
+
+    def test_salta_medicos_ocupados_en_el_horario(self):
+        """Test 3: Si el menos cargado tiene ocupado el horario se elige el siguiente"""
+        self.clinica.agendar_turno("0", "MP-0", "Cardiología", self.lunes)
+        self.clinica.agendar_turno("1", "MP-1", "Cardiología", self.lunes)
+        for dni in range(2, 6):
+            self.clinica.agendar_turno(str(dni), "MP-2", "Cardiología", self.lunes + timedelta(hours=dni))
+        turno = self.clinica.agendar_turno_automatico("9", "Cardiología", self.lunes)
+        self.assertEqual(self.matricula(turno), "MP-2")
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno_automatico("10", "Cardiología", self.lunes)
+
+    def test_rechazos(self):
+        """Test 4: Sin médicos ese día, o con el paciente ocupado, se informa el motivo"""
+        with self.assertRaises(MedicoNoDisponibleException):
+            self.clinica.agendar_turno_automatico("0", "Cardiología", self.lunes + timedelta(days=1))
+        self.clinica.agendar_turno("0", "MP-9", "Pediatría", self.lunes)
+        with self.assertRaises(TurnoSuperpuestoException):
+            self.clinica.agendar_turno_automatico("0", "Cardiología", self.lunes)
+
+    def test_medico_nuevo_entra_al_reparto(self):
+        """Test 5: Un médico agregado después participa del reparto"""
+        for dni in range(3):
+            self.clinica.agendar_turno_automatico(str(dni), "Cardiología", self.lunes + timedelta(hours=dni))
+        nuevo = Medico("MP-5", "Dr. Nuevo")
+        nuevo.agregar_especialidad(Especialidad("Cardiología", ["lunes"]))
+        self.clinica.agregar_medico(nuevo)
+        turno = self.clinica.agendar_turno_automatico("5", "Cardiología", self.lunes + timedelta(hours=5))
+        self.assertEqual(self.matricula(turno), "MP-5")
+
+
+if __name__ == "__main__":
+    unittest.main()
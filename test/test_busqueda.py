@@ -0,0 +1,91 @@
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.busqueda import IndiceNombres, normalizar, medir_busqueda
+from src.clinica import Clinica
+from src.paciente import Paciente
+
+
+class TestIndiceNombres(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial: un índice con nombres con y sin acentos"""
+        self.indice = IndiceNombres()
+        for clave, nombre in (("1", "José Pérez"), ("2", "Josefina Perez Gómez"),
+                              ("3", "María José López"), ("4", "Juan Pereyra")):
+            self.indice.agregar(clave, nombre)
+
+    def test_normalizar(self):
+        """Test 1: Se ignoran acentos, mayúsculas y espacios repetidos"""
+        self.assertEqual(normalizar("  MaRÍA   José  "), "maria jose")
+
+    def test_coincidencia_exacta_primero(self):
+        """Test 2: Las palabras completas se ordenan antes que los prefijos"""
+        self.assertEqual(self.indice.buscar("JOSE"), ["1", "3", "2"])
+
+    def test_varias_palabras(self):
+        """Test 3: Todas las palabras de la consulta deben coincidir"""
+        self.assertEqual(self.indice.buscar("perez jos"), ["1", "2"])
+        self.assertEqual(self.indice.buscar("pere"), ["1", "2", "4"])
+
+    def test_tolerancia_a_errores(self):
+        """Test 4: Los trigramas encuentran nombres con errores de tipeo"""
+        self.assertEqual(self.indice.buscar("lopes"), ["3"])
+        self.assertEqual(self.indice.buscar("Jsoe Perez")[0], "1")
+
+    def test_limite_y_sin_resultados(self):
+        """Test 5: Se respeta el límite y una consulta sin coincidencias devuelve vacío"""
+        self.assertEqual(len(self.indice.buscar("j", limite=2)), 2)
+        self.assertEqual(self.indice.buscar("xqz"), [])
+        self.assertEqual(self.indice.buscar("   "), [])
+
+    def test_actualizacion_incremental(self):
+        """Test 6: Reemplazar o quitar una clave actualiza el índice"""
+        self.indice.agregar("1", "Pedro Gómez")
+        self.assertNotIn("1", self.indice.buscar("jose"))
+        self.assertIn("1", self.indice.buscar("pedro"))
+        self.indice.quitar("1")
+        self.assertEqual(self.indice.buscar("pedro"), [])
+        self.assertEqual(self.indice.cantidad(), 3)
+
+    def test_transposicion_en_otra_palabra(self):
+        """Test 7: Una transposición en una palabra que no es la primera también se tolera"""
+        self.indice.agregar("5", "Ana Lucía García")
+        self.assertEqual(self.indice.buscar("gacria"), ["5"])
+        self.assertEqual(self.indice.buscar("ana gacria")[0], "5")
+        self.assertEqual(self.indice.buscar("Mrtinez"), [])
+        self.indice.agregar("6", "Pablo Martínez")
+        self.assertEqual(self.indice.buscar("Mrtinez"), ["6"])
+
+    def test_vocabulario_se_actualiza(self):
+        """Test 8: Una palabra sin nombres que la usen deja de encontrarse por errores"""
+        self.indice.quitar("3")
+        self.assertEqual(self.indice.buscar("lopes"), [])
+
+
+class TestRendimientoBusqueda(unittest.TestCase):
+
+    def test_medir_busqueda(self):
+        """Test 1: Con 200 mil nombres cada consulta tarda pocos milisegundos"""
+        tiempos = medir_busqueda(cantidad_nombres=200_000, repeticiones=5)
+        self.assertEqual(set(tiempos), {"maria garcia", "mar", "Mrtinez", "jose gacria", "lopes sosa"})
+        for consulta, milisegundos in tiempos.items():
+            self.assertLess(milisegundos, 25, consulta)
+
+
+class TestBuscarPacientes(unittest.TestCase):
+
+    def test_buscar_pacientes_en_clinica(self):
+        """Test 1: La clínica devuelve pacientes ordenados por relevancia"""
+        clinica = Clinica()
+        clinica.agregar_paciente(Paciente("111", "Ana Gómez", "01/01/1990"))
+        clinica.agregar_paciente(Paciente("222", "Anabel Díaz", "02/02/1985"))
+        encontrados = clinica.buscar_pacientes("ana")
+        self.assertEqual([p.obtener_dni() for p in encontrados], ["111", "222"])
+
+
+if __name__ == "__main__":
+    unittest.main()
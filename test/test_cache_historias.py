@@ -0,0 +1,115 @@
+import unittest
+import pickle
+import tempfile
+from datetime import datetime, timedelta
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.receta import Receta
+from src.archivo import ArchivoHistorico
+
+
+class TestCacheHistorias(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial: clínica con lugar para 3 historias y 10 pacientes"""
+        self.directorio = tempfile.TemporaryDirectory()
+        self.clinica = Clinica(capacidad_historias=3, directorio_historias=self.directorio.name)
+        for dni in range(10):
+            self.clinica.agregar_paciente(Paciente(str(dni), f"Paciente {dni}", "01/01/1980"))
+        medico = Medico("MP-1", "Dr. García")
+        medico.agregar_especialidad(Especialidad("Cardiología", ["lunes"]))
+        self.clinica.agregar_medico(medico)
+        self.lunes = datetime(2025, 6, 2, 8, 0)
+
+    def tearDown(self):
+        self.clinica.cerrar()
+        self.directorio.cleanup()
+
+    def test_memoria_acotada(self):
+        """Test 1: Sólo quedan residentes tantas historias como la capacidad"""
+        self.assertEqual(self.clinica.obtener_estadisticas_historias()["residentes"], 3)
+        self.assertEqual(self.clinica.reporte_memoria()["historias"]["cantidad"], 3)
+        self.assertEqual(self.clinica.obtener_estadisticas_historias()["escrituras"], 7)
+
+    def test_historia_expulsada_vuelve_completa(self):
+        """Test 2: Una historia que pasó por disco conserva turnos y recetas y comparte sus entidades"""
+        turno = self.clinica.agendar_turno("0", "MP-1", "Cardiología", self.lunes)
+        self.clinica.emitir_receta("0", "MP-1", ["Aspirina"])
+        for dni in range(1, 10):
+            self.clinica.obtener_historia_clinica(str(dni))
+        historia = self.clinica.obtener_historia_clinica("0")
+        self.assertIs(historia.obtener_turnos()[0], turno)
+        self.assertIs(historia.get_paciente(), self.clinica.obtener_pacientes()[0])
+        self.assertEqual(historia.obtener_recetas()[0].obtener_medicamentos(), ["Aspirina"])
+        self.assertGreater(self.clinica.obtener_estadisticas_historias()["fallos"], 0)
+
+    def test_cancelar_con_historia_en_disco(self):
+        """Test 3: Cancelar un turno cuya historia está en disco la actualiza"""
+        self.clinica.agendar_turno("0", "MP-1", "Cardiología", self.lunes)
+        self.clinica.agendar_turno("0", "MP-1", "Cardiología", self.lunes + timedelta(minutes=30))
+        for dni in range(1, 10):
+            self.clinica.obtener_historia_clinica(str(dni))
+        self.clinica.cancelar_turno("MP-1", self.lunes)
+        for dni in range(1, 10):
+            self.clinica.obtener_historia_clinica(str(dni))
+        turnos = self.clinica.obtener_historia_clinica("0").obtener_turnos()
+        self.assertEqual([t.obtener_fecha_hora() for t in turnos], [self.lunes + timedelta(minutes=30)])
+
+    def test_tasa_de_aciertos(self):
+        """Test 4: Las consultas repetidas a las mismas historias son aciertos"""
+        for _ in range(10):
+            self.clinica.obtener_historia_clinica("9")
+        estadisticas = self.clinica.obtener_estadisticas_historias()
+        self.assertEqual(estadisticas["fallos"], 0)
+        self.assertEqual(estadisticas["tasa_aciertos"], 1.0)
+        self.clinica.obtener_historia_clinica("0")
+        self.assertLess(self.clinica.obtener_estadisticas_historias()["tasa_aciertos"], 1.0)
+
+    def test_modificar_una_historia_ya_expulsada(self):
+        """Test 5: Un cambio sobre una historia expulsada no se pierde"""
+        historia = self.clinica.obtener_historia_clinica("0")
+        for dni in range(1, 10):
+            self.clinica.obtener_historia_clinica(str(dni))
+        medico = self.clinica.obtener_medicos()[0]
+        historia.agregar_receta(Receta(historia.get_paciente(), medico, ["Ibuprofeno"]))
+        self.assertIs(self.clinica.obtener_historia_clinica("0"), historia)
+        self.assertEqual(len(self.clinica.obtener_historia_clinica("0").obtener_recetas()), 1)
+
+    def test_sin_capacidad_no_usa_disco(self):
+        """Test 6: Sin capacidad todas las historias quedan en memoria"""
+        clinica = Clinica()
+        clinica.agregar_paciente(Paciente("1", "Ana", "01/01/1990"))
+        self.assertEqual(clinica.obtener_estadisticas_historias()["residentes"], 1)
+        with self.assertRaises(ValueError):
+            Clinica(capacidad_historias=10)
+
+    def test_pickle_y_archivo(self):
+        """Test 7: La clínica se serializa y se combina con el archivo histórico"""
+        with tempfile.TemporaryDirectory() as directorio_archivo:
+            clinica = Clinica(ArchivoHistorico(directorio_archivo), 2, os.path.join(self.directorio.name, "b"))
+            for dni in range(5):
+                clinica.agregar_paciente(Paciente(str(dni), f"Paciente {dni}", "01/01/1980"))
+            medico = Medico("MP-1", "Dr. García")
+            medico.agregar_especialidad(Especialidad("Cardiología", ["lunes"]))
+            clinica.agregar_medico(medico)
+            for dni in range(5):
+                clinica.agendar_turno(str(dni), "MP-1", "Cardiología", self.lunes + timedelta(minutes=15 * dni))
+            clinica.agendar_turno("0", "MP-1", "Cardiología", self.lunes + timedelta(weeks=1))
+            self.assertEqual(clinica.archivar(self.lunes + timedelta(days=1)), 5)
+            historia = clinica.obtener_historia_clinica("0")
+            self.assertEqual(len(historia.obtener_turnos()), 2)
+            restaurada = pickle.loads(pickle.dumps(clinica))
+            self.assertEqual(len(restaurada.obtener_historia_clinica("3").obtener_turnos()), 1)
+            restaurada.cerrar()
+            clinica.cerrar()
+
+
+if __name__ == "__main__":
+    unittest.main()
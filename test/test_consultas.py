@@ -0,0 +1,128 @@
+import unittest
+from datetime import datetime
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.exepciones import TurnoOcupadoException, TurnoNoEncontradoException, MedicoNoDisponibleException
+
+
+class TestBuscarTurnos(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial: dos pacientes, dos médicos y varios turnos"""
+        self.clinica = Clinica()
+        self.clinica.agregar_paciente(Paciente("111", "Ana Gómez", "01/01/1990"))
+        self.clinica.agregar_paciente(Paciente("222", "Luis Díaz", "02/02/1985"))
+
+        cardiologo = Medico("MP-1", "Dr. García", "Cardiología")
+        cardiologo.agregar_especialidad(Especialidad("Cardiología", ["lunes", "miércoles"]))
+        pediatra = Medico("MP-2", "Dra. López", "Pediatría")
+        pediatra.agregar_especialidad(Especialidad("Pediatría", ["lunes", "martes"]))
+        self.clinica.agregar_medico(cardiologo)
+        self.clinica.agregar_medico(pediatra)
+
+        self.clinica.agendar_turno("111", "MP-1", "Cardiología", datetime(2025, 6, 2, 10, 0))
+        self.clinica.agendar_turno("222", "MP-1", "Cardiología", datetime(2025, 6, 4, 9, 0))
+        self.clinica.agendar_turno("111", "MP-2", "Pediatría", datetime(2025, 6, 3, 11, 0))
+        self.clinica.agendar_turno("222", "MP-2", "Pediatría", datetime(2025, 6, 9, 8, 0))
+
+    def test_sin_filtros_devuelve_todo_ordenado(self):
+        """Test 1: Sin filtros se devuelven todos los turnos ordenados por fecha"""
+        fechas = [t.obtener_fecha_hora() for t in self.clinica.buscar_turnos()]
+        self.assertEqual(len(fechas), 4)
+        self.assertEqual(fechas, sorted(fechas))
+
+    def test_filtrar_por_paciente(self):
+        """Test 2: Filtrar por DNI del paciente"""
+        turnos = self.clinica.buscar_turnos(dni="111")
+        self.assertEqual([t.obtener_fecha_hora().day for t in turnos], [2, 3])
+
+    def test_filtrar_por_medico_y_especialidad(self):
+        """Test 3: Combinar médico y especialidad"""
+        turnos = self.clinica.buscar_turnos(matricula="MP-2", especialidad="Pediatría")
+        self.assertEqual(len(turnos), 2)
+        self.assertEqual(self.clinica.buscar_turnos(matricula="MP-2", especialidad="Cardiología"), [])
+
+    def test_filtrar_por_rango_de_fechas(self):
+        """Test 4: El rango de fechas incluye 'desde' y excluye 'hasta'"""
+        turnos = self.clinica.buscar_turnos(desde=datetime(2025, 6, 3, 11, 0), hasta=datetime(2025, 6, 9, 8, 0))
+        self.assertEqual([t.obtener_fecha_hora().day for t in turnos], [3, 4])
+
+    def test_combinar_todos_los_filtros(self):
+        """Test 5: Paciente, médico, especialidad y rango a la vez"""
+        turnos = self.clinica.buscar_turnos(dni="222", matricula="MP-1", especialidad="Cardiología",
+                                            desde=datetime(2025, 6, 1), hasta=datetime(2025, 6, 30))
+        self.assertEqual(len(turnos), 1)
+        self.assertEqual(turnos[0].obtener_fecha_hora(), datetime(2025, 6, 4, 9, 0))
+
+    def test_clave_inexistente(self):
+        """Test 6: Un filtro sin coincidencias devuelve lista vacía"""
+        self.assertEqual(self.clinica.buscar_turnos(dni="999"), [])
+
+    def test_duplicado_detectado_por_indice(self):
+        """Test 7: El índice de ocupación rechaza turnos duplicados"""
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("222", "MP-1", "Cardiología", datetime(2025, 6, 2, 10, 0))
+
+
+class TestCancelacionTurnos(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial: un paciente, un médico y un turno"""
+        self.clinica = Clinica()
+        self.clinica.agregar_paciente(Paciente("111", "Ana Gómez", "01/01/1990"))
+        medico = Medico("MP-1", "Dr. García", "Cardiología")
+        medico.agregar_especialidad(Especialidad("Cardiología", ["lunes", "miércoles"]))
+        self.clinica.agregar_medico(medico)
+        self.fecha = datetime(2025, 6, 2, 10, 0)
+        self.clinica.agendar_turno("111", "MP-1", "Cardiología", self.fecha)
+
+    def test_cancelar_turno_libera_horario(self):
+        """Test 1: Cancelar un turno lo quita de listados, índices e historia"""
+        self.clinica.cancelar_turno("MP-1", self.fecha)
+        self.assertEqual(self.clinica.obtener_turnos(), [])
+        self.assertEqual(self.clinica.buscar_turnos(dni="111"), [])
+        self.assertEqual(self.clinica.buscar_turnos(desde=datetime(2025, 6, 1)), [])
+        self.assertEqual(self.clinica.obtener_historia_clinica("111").obtener_turnos(), [])
+        self.clinica.agendar_turno("111", "MP-1", "Cardiología", self.fecha)
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+
+    def test_cancelar_turno_inexistente(self):
+        """Test 2: Cancelar un turno que no existe lanza excepción"""
+        with self.assertRaises(TurnoNoEncontradoException):
+            self.clinica.cancelar_turno("MP-1", datetime(2025, 6, 4, 10, 0))
+
+    def test_reprogramar_turno(self):
+        """Test 3: Reprogramar mueve el turno a la nueva fecha"""
+        nueva = datetime(2025, 6, 4, 9, 0)
+        turno = self.clinica.reprogramar_turno("MP-1", self.fecha, nueva)
+        self.assertEqual(turno.obtener_fecha_hora(), nueva)
+        self.assertEqual([t.obtener_fecha_hora() for t in self.clinica.buscar_turnos(matricula="MP-1")], [nueva])
+        self.assertEqual(len(self.clinica.obtener_historia_clinica("111").obtener_turnos()), 1)
+
+    def test_reprogramar_a_dia_no_disponible(self):
+        """Test 4: Si la nueva fecha no es válida el turno original se conserva"""
+        with self.assertRaises(MedicoNoDisponibleException):
+            self.clinica.reprogramar_turno("MP-1", self.fecha, datetime(2025, 6, 3, 9, 0))
+        self.assertEqual(len(self.clinica.buscar_turnos(matricula="MP-1")), 1)
+
+    def test_compactacion_con_muchas_cancelaciones(self):
+        """Test 5: Tras muchas cancelaciones los listados siguen siendo correctos"""
+        for dia in range(1, 29):
+            fecha = datetime(2025, 7, dia, 10, 0)
+            if fecha.weekday() in (0, 2):
+                self.clinica.agendar_turno("111", "MP-1", "Cardiología", fecha)
+                self.clinica.cancelar_turno("MP-1", fecha)
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+        self.assertEqual(len(self.clinica.buscar_turnos(desde=datetime(2025, 1, 1))), 1)
+        self.assertEqual(len(self.clinica.obtener_historia_clinica("111").obtener_turnos()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.clinica import Clinica
+from src.medico import Medico
+from src.especialidad import Especialidad
+
+
+class TestDirectorioMedicos(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial: tres médicos con distintas especialidades y días"""
+        self.clinica = Clinica()
+        garcia = Medico("MP-1", "Dra. Laura García", Especialidad("Dermatología", ["jueves", "viernes"]))
+        garcia_cardio = Medico("MP-2", "Dr. Pablo Garcia", "Cardiología")
+        garcia_cardio.agregar_especialidad(Especialidad("Cardiología", ["jueves"]))
+        lopez = Medico("MP-3", "Dr. Luis López", Especialidad("Dermatología", ["lunes"]))
+        for medico in (garcia, garcia_cardio, lopez):
+            self.clinica.agregar_medico(medico)
+
+    def matriculas(self, medicos):
+        return [m.obtener_matricula() for m in medicos]
+
+    def test_filtro_combinado(self):
+        """Test 1: Dermatóloga llamada García que atiende los jueves"""
+        encontrados = self.clinica.buscar_medicos(nombre="garcia", especialidad="dermatologia", dia="Jueves")
+        self.assertEqual(self.matriculas(encontrados), ["MP-1"])
+
+    def test_filtros_individuales(self):
+        """Test 2: Cada filtro por separado"""
+        self.assertEqual(self.matriculas(self.clinica.buscar_medicos(nombre="García")), ["MP-1", "MP-2"])
+        self.assertEqual(self.matriculas(self.clinica.buscar_medicos(especialidad="Dermatología")), ["MP-1", "MP-3"])
+        self.assertEqual(self.matriculas(self.clinica.buscar_medicos(dia="jueves")), ["MP-1", "MP-2"])
+        self.assertEqual(len(self.clinica.buscar_medicos()), 3)
+
+    def test_especialidad_agregada_se_indexa(self):
+        """Test 3: Agregar una especialidad actualiza el directorio"""
+        self.assertEqual(self.clinica.buscar_medicos(especialidad="Pediatría"), [])
+        lopez = self.clinica.buscar_medicos(nombre="lopez")[0]
+        lopez.agregar_especialidad(Especialidad("Pediatría", ["martes"]))
+        self.assertEqual(self.matriculas(self.clinica.buscar_medicos(especialidad="pediatria", dia="martes")), ["MP-3"])
+
+    def test_especialidad_del_constructor(self):
+        """Test 4: La especialidad del constructor se registra y se completa con sus días"""
+        medico = Medico("MP-9", "Dra. Ruiz", "Neurología")
+        self.assertEqual(medico.obtener_especialidades()[0].obtener_especialidad(), "Neurología")
+        medico.agregar_especialidad(Especialidad("Neurología", ["martes"]))
+        self.assertEqual(len(medico.obtener_especialidades()), 1)
+        self.assertEqual(medico.obtener_especialidad_para_dia("martes"), "Neurología")
+        self.assertEqual(Medico("MP-8", "Dr. Sin Especialidad").obtener_especialidades(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
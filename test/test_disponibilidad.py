@@ -0,0 +1,67 @@
+import unittest
+from datetime import date, datetime
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.disponibilidad import calcular_disponibilidad, preparar_tareas
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+
+
+class TestDisponibilidad(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial: dos médicos, uno de ellos con un turno ocupado"""
+        self.clinica = Clinica()
+        self.clinica.agregar_paciente(Paciente("111", "Ana Gómez", "01/01/1990"))
+        garcia = Medico("MP-1", "Dr. García", "Cardiología")
+        garcia.agregar_especialidad(Especialidad("Cardiología", ["lunes"]))
+        lopez = Medico("MP-2", "Dra. López", "Pediatría")
+        lopez.agregar_especialidad(Especialidad("Pediatría", ["martes", "miércoles"]))
+        self.clinica.agregar_medico(garcia)
+        self.clinica.agregar_medico(lopez)
+        self.clinica.agendar_turno("111", "MP-1", "Cardiología", datetime(2025, 6, 2, 9, 0))
+        self.desde = date(2025, 6, 2)
+        self.hasta = date(2025, 6, 9)
+
+    def test_franjas_libres_respetan_dias_y_turnos(self):
+        """Test 1: Solo se ofrecen días de atención y se excluyen los turnos ocupados"""
+        disponibilidad = calcular_disponibilidad(self.clinica, self.desde, self.hasta, 8, 10, 30, procesos=1)
+        franjas = disponibilidad.franjas("MP-1")
+        self.assertEqual(franjas, [datetime(2025, 6, 2, 8, 0), datetime(2025, 6, 2, 8, 30),
+                                   datetime(2025, 6, 2, 9, 30)])
+        self.assertEqual(disponibilidad.cantidad_libres("MP-2"), 8)
+
+    def test_tareas_compactas(self):
+        """Test 2: Las tareas solo contienen tipos simples"""
+        for tarea in preparar_tareas(self.clinica, self.desde, self.hasta):
+            for valor in tarea:
+                self.assertIsInstance(valor, (str, int, bytes))
+
+    def test_modo_paralelo_igual_al_serial(self):
+        """Test 3: El cálculo con varios procesos coincide con el serial"""
+        serial = calcular_disponibilidad(self.clinica, self.desde, self.hasta, procesos=1)
+        paralelo = calcular_disponibilidad(self.clinica, self.desde, self.hasta, procesos=2)
+        for matricula in ("MP-1", "MP-2"):
+            self.assertEqual(serial.franjas(matricula), paralelo.franjas(matricula))
+
+    def test_turnos_fuera_de_grilla_y_largos(self):
+        """Test 4: Un turno que no empieza en la grilla o dura más que la franja ocupa todo su intervalo"""
+        self.clinica.agendar_turno("111", "MP-1", "Cardiología", datetime(2025, 6, 2, 8, 10))
+        franjas = calcular_disponibilidad(self.clinica, self.desde, self.hasta, 8, 10, 30, procesos=1).franjas("MP-1")
+        self.assertEqual(franjas, [datetime(2025, 6, 2, 9, 30)])
+        medico = Medico("MP-3", "Dr. Ruiz")
+        medico.agregar_especialidad(Especialidad("Traumatología", ["lunes"], duracion_minutos=60))
+        self.clinica.agregar_medico(medico)
+        self.clinica.agendar_turno("111", "MP-3", "Traumatología", datetime(2025, 6, 2, 10, 0))
+        franjas = calcular_disponibilidad(self.clinica, self.desde, self.hasta, 10, 12, 30, procesos=1).franjas("MP-3")
+        self.assertEqual(franjas, [datetime(2025, 6, 2, 11, 0), datetime(2025, 6, 2, 11, 30)])
+        self.clinica.agendar_turno("111", "MP-3", "Traumatología", franjas[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+import unittest
+import threading
+from datetime import datetime, timedelta
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.eventos import CanalEventos, PoliticaDesborde, TipoEvento
+from src.exepciones import SecuenciaNoDisponibleError
+
+
+class TestEventosClinica(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial: un paciente y un médico, con una suscripción previa"""
+        self.clinica = Clinica()
+        self.suscripcion = self.clinica.suscribir_eventos()
+        self.clinica.agregar_paciente(Paciente("111", "Ana Gómez", "01/01/1990"))
+        medico = Medico("MP-1", "Dr. García", "Cardiología")
+        medico.agregar_especialidad(Especialidad("Cardiología", ["lunes", "miércoles"]))
+        self.clinica.agregar_medico(medico)
+        self.lunes = datetime(2025, 6, 2, 10, 0)
+
+    def test_mutaciones_publican_eventos_tipados(self):
+        """Test 1: Agendar, cancelar y emitir recetas publican eventos en orden"""
+        turno = self.clinica.agendar_turno("111", "MP-1", "Cardiología", self.lunes)
+        self.clinica.cancelar_turno("MP-1", self.lunes)
+        self.clinica.emitir_receta("111", "MP-1", ["Aspirina"])
+        eventos = self.suscripcion.obtener_pendientes()
+        self.assertEqual([e.obtener_tipo() for e in eventos], [
+            TipoEvento.PACIENTE_AGREGADO, TipoEvento.MEDICO_AGREGADO, TipoEvento.TURNO_AGENDADO,
+            TipoEvento.TURNO_CANCELADO, TipoEvento.RECETA_EMITIDA])
+        self.assertIs(eventos[2].obtener_entidad(), turno)
+        self.assertEqual([e.obtener_secuencia() for e in eventos], [1, 2, 3, 4, 5])
+        self.assertEqual(self.suscripcion.obtener_ultima_secuencia(), 5)
+
+    def test_cancelar_ocurrencia_de_serie(self):
+        """Test 2: Cancelar una ocurrencia de una serie publica el turno cancelado"""
+        self.clinica.agendar_serie("111", "MP-1", "Cardiología", self.lunes, 3)
+        self.clinica.cancelar_turno("MP-1", self.lunes + timedelta(weeks=1))
+        eventos = self.suscripcion.obtener_pendientes()[-2:]
+        self.assertEqual(eventos[0].obtener_tipo(), TipoEvento.SERIE_AGENDADA)
+        self.assertEqual(eventos[1].obtener_tipo(), TipoEvento.TURNO_CANCELADO)
+        self.assertEqual(eventos[1].obtener_entidad().obtener_fecha_hora(), self.lunes + timedelta(weeks=1))
+
+    def test_filtrar_por_tipo(self):
+        """Test 3: Una suscripción puede limitarse a ciertos tipos de evento"""
+        recetas = self.clinica.suscribir_eventos(tipos=[TipoEvento.RECETA_EMITIDA])
+        self.clinica.agendar_turno("111", "MP-1", "Cardiología", self.lunes)
+        self.clinica.emitir_receta("111", "MP-1", ["Aspirina"])
+        self.assertEqual([e.obtener_tipo() for e in recetas.obtener_pendientes()], [TipoEvento.RECETA_EMITIDA])
+
+    def test_reanudar_desde_secuencia(self):
+        """Test 4: Una suscripción nueva puede reanudar desde la última secuencia vista"""
+        self.clinica.agendar_turno("111", "MP-1", "Cardiología", self.lunes)
+        self.suscripcion.obtener_pendientes()
+        ultima = self.suscripcion.obtener_ultima_secuencia()
+        self.suscripcion.cerrar()
+        self.clinica.emitir_receta("111", "MP-1", ["Aspirina"])
+        reanudada = self.clinica.suscribir_eventos(desde=ultima)
+        eventos = reanudada.obtener_pendientes()
+        self.assertEqual([e.obtener_secuencia() for e in eventos], [ultima + 1])
+        self.assertEqual(eventos[0].obtener_tipo(), TipoEvento.RECETA_EMITIDA)
+
+
+class TestCanalEventos(unittest.TestCase):
+
+    def test_descartar_antiguos(self):
+        """Test 5: Con la cola llena se descartan los eventos más viejos"""
+        canal = CanalEventos()
+        suscripcion = canal.suscribir(capacidad=2, politica=PoliticaDesborde.DESCARTAR_ANTIGUOS)
+        for i in range(5):
+            canal.publicar(TipoEvento.TURNO_AGENDADO, i)
+        self.assertEqual([e.obtener_entidad() for e in suscripcion.obtener_pendientes()], [3, 4])
+        self.assertEqual(suscripcion.obtener_descartados(), 3)
+
+    def test_descartar_nuevos(self):
+        """Test 6: Con la cola llena se descartan los eventos entrantes"""
+        canal = CanalEventos()
+        suscripcion = canal.suscribir(capacidad=2, politica=PoliticaDesborde.DESCARTAR_NUEVOS)
+        for i in range(5):
+            canal.publicar(TipoEvento.TURNO_AGENDADO, i)
+        self.assertEqual([e.obtener_entidad() for e in suscripcion.obtener_pendientes()], [0, 1])
+        self.assertEqual(suscripcion.obtener_descartados(), 3)
+
+    def test_bloquear_aplica_contrapresion(self):
+        """Test 7: Con BLOQUEAR quien publica espera a que el suscriptor consuma"""
+        canal = CanalEventos()
+        suscripcion = canal.suscribir(capacidad=1, politica=PoliticaDesborde.BLOQUEAR)
+        canal.publicar(TipoEvento.TURNO_AGENDADO, 0)
+        publicador = threading.Thread(target=canal.publicar, args=(TipoEvento.TURNO_AGENDADO, 1))
+        publicador.start()
+        publicador.join(0.1)
+        self.assertTrue(publicador.is_alive())
+        self.assertEqual(suscripcion.obtener().obtener_entidad(), 0)
+        publicador.join(1)
+        self.assertFalse(publicador.is_alive())
+        self.assertEqual(suscripcion.obtener(espera=1).obtener_entidad(), 1)
+        self.assertEqual(suscripcion.obtener_descartados(), 0)
+
+    def test_reanudar_fuera_del_historial(self):
+        """Test 8: Reanudar desde una secuencia ya descartada del historial es un error"""
+        canal = CanalEventos(retencion=3)
+        canal.publicar_varios(TipoEvento.TURNO_AGENDADO, list(range(10)))
+        self.assertEqual([e.obtener_secuencia() for e in canal.obtener_eventos()], [8, 9, 10])
+        self.assertEqual(len(canal.suscribir(desde=7).obtener_pendientes()), 3)
+        with self.assertRaises(SecuenciaNoDisponibleError):
+            canal.suscribir(desde=5)
+        with self.assertRaises(SecuenciaNoDisponibleError):
+            canal.suscribir(desde=11)
+
+    def test_suscriptor_lento_no_traba_la_clinica(self):
+        """Test 9: Con un suscriptor lento, la espera ocurre fuera del cerrojo de la clínica"""
+        clinica = Clinica()
+        suscripcion = clinica.suscribir_eventos(capacidad=1, politica=PoliticaDesborde.BLOQUEAR)
+        clinica.agregar_paciente(Paciente("111", "Ana Gómez", "01/01/1990"))
+        escritor = threading.Thread(target=clinica.agregar_paciente, args=(Paciente("222", "Luis Díaz", "02/02/1985"),))
+        escritor.start()
+        escritor.join(0.1)
+        self.assertTrue(escritor.is_alive())
+        # El escritor espera al suscriptor, pero ya soltó el cerrojo: se puede leer y abrir vistas,
+        # también desde el hilo del suscriptor.
+        vistas = []
+        lector = threading.Thread(target=lambda: vistas.append(clinica.abrir_vista()))
+        lector.start()
+        lector.join(1)
+        self.assertFalse(lector.is_alive())
+        self.assertIsNotNone(vistas[0].obtener_historia_clinica("222"))
+        self.assertEqual(suscripcion.obtener().obtener_entidad().obtener_dni(), "111")
+        escritor.join(1)
+        self.assertFalse(escritor.is_alive())
+        self.assertEqual(suscripcion.obtener(espera=1).obtener_entidad().obtener_dni(), "222")
+
+    def test_suscriptor_lleno_no_frena_a_otros_escritores(self):
+        """Test 10: Mientras un escritor espera a un suscriptor lleno, los demás escritores terminan"""
+        clinica = Clinica()
+        suscripcion = clinica.suscribir_eventos(capacidad=1, politica=PoliticaDesborde.BLOQUEAR)
+        clinica.agregar_paciente(Paciente("111", "Ana Gómez", "01/01/1990"))
+        escritor = threading.Thread(target=clinica.agregar_paciente, args=(Paciente("222", "Luis Díaz", "02/02/1985"),),
+                                   daemon=True)
+        escritor.start()
+        escritor.join(0.1)
+        self.assertTrue(escritor.is_alive())
+        otro = threading.Thread(target=clinica.agregar_paciente, args=(Paciente("333", "Eva Ruiz", "03/03/1980"),),
+                                daemon=True)
+        otro.start()
+        otro.join(1)
+        self.assertFalse(otro.is_alive())
+        # El suscriptor recibe igual todos los eventos, en orden.
+        recibidos = [suscripcion.obtener(espera=1).obtener_entidad().obtener_dni() for _ in range(3)]
+        self.assertEqual(recibidos, ["111", "222", "333"])
+        escritor.join(1)
+        self.assertFalse(escritor.is_alive())
+
+
+if __name__ == "__main__":
+    unittest.main()
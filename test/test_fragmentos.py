@@ -0,0 +1,101 @@
+import unittest
+from datetime import datetime
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.fragmentos import ClinicaFragmentada
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.exepciones import TurnoOcupadoException, PacienteNoEncontradoException, TurnoSuperpuestoException
+
+
+class TestClinicaFragmentada(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial: dos fragmentos con médicos repartidos entre ambos"""
+        self.clinica = ClinicaFragmentada(2)
+        self.clinica.agregar_paciente(Paciente("111", "Ana Gómez", "01/01/1990"))
+        self.matriculas = [f"MP-{i}" for i in range(6)]
+        for matricula in self.matriculas:
+            medico = Medico(matricula, f"Médico {matricula}", "Clínica médica")
+            medico.agregar_especialidad(Especialidad("Clínica médica", ["lunes"]))
+            self.clinica.agregar_medico(medico)
+
+    def tearDown(self):
+        self.clinica.cerrar()
+
+    def test_medicos_repartidos_en_fragmentos(self):
+        """Test 1: Cada médico vive en un único fragmento"""
+        self.assertEqual(len(self.clinica.obtener_medicos()), 6)
+        self.assertEqual(len({self.clinica.fragmento_de(m) for m in self.matriculas}), 2)
+
+    def test_agendar_y_listar(self):
+        """Test 2: Los turnos de todos los fragmentos se combinan ordenados"""
+        for hora, matricula in enumerate(self.matriculas):
+            self.clinica.agendar_turno("111", matricula, "Clínica médica", datetime(2025, 6, 2, 8 + hora))
+        turnos = self.clinica.obtener_turnos()
+        self.assertEqual([t.obtener_fecha_hora().hour for t in turnos], list(range(8, 14)))
+        self.assertEqual(len(self.clinica.buscar_turnos(dni="111")), 6)
+        self.assertEqual(len(self.clinica.buscar_turnos(matricula="MP-0")), 1)
+
+    def test_excepciones_se_propagan(self):
+        """Test 3: Los errores del fragmento llegan al enrutador"""
+        fecha = datetime(2025, 6, 2, 9, 0)
+        self.clinica.agendar_turno("111", "MP-0", "Clínica médica", fecha)
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("111", "MP-0", "Clínica médica", fecha)
+
+    def test_agendar_en_lote(self):
+        """Test 4: En lote se devuelve un error o None por solicitud, en orden"""
+        fecha = datetime(2025, 6, 2, 9, 0)
+        resultados = self.clinica.agendar_turnos([
+            ("111", "MP-0", "Clínica médica", fecha),
+            ("999", "MP-1", "Clínica médica", fecha),
+            ("111", "MP-0", "Clínica médica", fecha),
+        ])
+        self.assertIsNone(resultados[0])
+        self.assertIsInstance(resultados[1], PacienteNoEncontradoException)
+        self.assertIsInstance(resultados[2], TurnoOcupadoException)
+
+    def test_historia_clinica_combinada(self):
+        """Test 5: La historia clínica reúne turnos y recetas de todos los fragmentos"""
+        for hora, matricula in enumerate(self.matriculas, start=9):
+            self.clinica.agendar_turno("111", matricula, "Clínica médica", datetime(2025, 6, 2, hora, 0))
+        self.clinica.emitir_receta("111", "MP-1", ["Ibuprofeno"])
+        historia = self.clinica.obtener_historia_clinica("111")
+        self.assertEqual(len(historia.obtener_turnos()), 6)
+        self.assertEqual(len(historia.obtener_recetas()), 1)
+        self.assertIsNone(self.clinica.obtener_historia_clinica("999"))
+
+    def test_paciente_superpuesto_entre_fragmentos(self):
+        """Test 6: Un paciente no puede tener turnos superpuestos con médicos de distintos fragmentos"""
+        propio = self.clinica.fragmento_de("MP-0")
+        otro_fragmento = [m for m in self.matriculas if self.clinica.fragmento_de(m) != propio]
+        fecha = datetime(2025, 6, 2, 9, 0)
+        self.clinica.agendar_turno("111", "MP-0", "Clínica médica", fecha)
+        with self.assertRaises(TurnoSuperpuestoException):
+            self.clinica.agendar_turno("111", otro_fragmento[0], "Clínica médica", fecha)
+        self.clinica.cancelar_turno("MP-0", fecha)
+        self.clinica.agendar_turno("111", otro_fragmento[0], "Clínica médica", fecha)
+
+    def test_paciente_superpuesto_en_lote(self):
+        """Test 7: En lote, la primera solicitud gana aunque las dos caigan en fragmentos distintos"""
+        propio = self.clinica.fragmento_de("MP-0")
+        otro_fragmento = [m for m in self.matriculas if self.clinica.fragmento_de(m) != propio]
+        fecha = datetime(2025, 6, 2, 9, 0)
+        resultados = self.clinica.agendar_turnos([
+            ("111", "MP-0", "Clínica médica", fecha),
+            ("111", otro_fragmento[0], "Clínica médica", fecha),
+            ("111", otro_fragmento[1], "Clínica médica", datetime(2025, 6, 2, 10, 0)),
+        ])
+        self.assertIsNone(resultados[0])
+        self.assertIsInstance(resultados[1], TurnoSuperpuestoException)
+        self.assertIsNone(resultados[2])
+        self.assertEqual(len(self.clinica.buscar_turnos(dni="111")), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
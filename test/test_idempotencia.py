@@ -0,0 +1,106 @@
+import unittest
+from datetime import datetime
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.idempotencia import CacheIdempotencia
+from src.exepciones import ClaveIdempotenciaReutilizadaError, TurnoOcupadoException, TurnoNoEncontradoException
+
+
+class RelojFalso:
+    def __init__(self):
+        self.ahora = 0.0
+
+    def __call__(self):
+        return self.ahora
+
+
+class TestCacheIdempotencia(unittest.TestCase):
+
+    def test_vencimiento_por_ttl(self):
+        """Test 1: Las entradas vencen al pasar el TTL"""
+        reloj = RelojFalso()
+        cache = CacheIdempotencia(ttl_segundos=10, reloj=reloj)
+        cache.guardar("a", ("op",), "resultado")
+        reloj.ahora = 9.9
+        self.assertEqual(cache.obtener("a", ("op",)), "resultado")
+        reloj.ahora = 10
+        self.assertIsNone(cache.obtener("a", ("op",)))
+        self.assertEqual(cache.cantidad(), 0)
+
+    def test_capacidad_acotada(self):
+        """Test 2: Al superar la capacidad se descartan las claves más viejas"""
+        cache = CacheIdempotencia(capacidad=2)
+        for clave in "abc":
+            cache.guardar(clave, ("op",), clave.upper())
+        self.assertIsNone(cache.obtener("a", ("op",)))
+        self.assertEqual(cache.obtener("c", ("op",)), "C")
+        self.assertEqual(cache.cantidad(), 2)
+
+    def test_sin_clave_no_guarda(self):
+        """Test 3: Sin clave no se guarda ni se consulta nada"""
+        cache = CacheIdempotencia()
+        cache.guardar(None, ("op",), "x")
+        self.assertIsNone(cache.obtener(None, ("op",)))
+        self.assertEqual(cache.cantidad(), 0)
+
+
+class TestOperacionesIdempotentes(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial: un paciente y un médico que atiende los lunes"""
+        self.clinica = Clinica()
+        self.clinica.agregar_paciente(Paciente("111", "Ana Gómez", "01/01/1990"))
+        medico = Medico("MP-1", "Dr. García")
+        medico.agregar_especialidad(Especialidad("Cardiología", ["lunes"]))
+        self.clinica.agregar_medico(medico)
+        self.lunes = datetime(2025, 6, 2, 10, 0)
+
+    def test_reintento_de_agendar_devuelve_el_mismo_turno(self):
+        """Test 4: Reintentar agendar con la misma clave devuelve el turno original"""
+        turno = self.clinica.agendar_turno("111", "MP-1", "Cardiología", self.lunes, clave_idempotencia="r-1")
+        reintento = self.clinica.agendar_turno("111", "MP-1", "Cardiología", self.lunes, clave_idempotencia="r-1")
+        self.assertIs(reintento, turno)
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("111", "MP-1", "Cardiología", self.lunes, clave_idempotencia="r-2")
+
+    def test_reintento_de_receta_no_duplica(self):
+        """Test 5: Reintentar una receta con la misma clave no crea otra"""
+        receta = self.clinica.emitir_receta("111", "MP-1", ["Aspirina"], clave_idempotencia="r-3")
+        self.assertIs(self.clinica.emitir_receta("111", "MP-1", ["Aspirina"], clave_idempotencia="r-3"), receta)
+        self.assertEqual(len(self.clinica.obtener_historia_clinica("111").obtener_recetas()), 1)
+        self.clinica.emitir_receta("111", "MP-1", ["Aspirina"])
+        self.assertEqual(len(self.clinica.obtener_historia_clinica("111").obtener_recetas()), 2)
+
+    def test_reintento_de_cancelacion(self):
+        """Test 6: Reintentar una cancelación con la misma clave no falla"""
+        self.clinica.agendar_turno("111", "MP-1", "Cardiología", self.lunes)
+        cancelado = self.clinica.cancelar_turno("MP-1", self.lunes, clave_idempotencia="r-4")
+        self.assertIs(self.clinica.cancelar_turno("MP-1", self.lunes, clave_idempotencia="r-4"), cancelado)
+        with self.assertRaises(TurnoNoEncontradoException):
+            self.clinica.cancelar_turno("MP-1", self.lunes)
+
+    def test_clave_reutilizada_para_otra_operacion(self):
+        """Test 7: Usar la misma clave con otros datos es un error"""
+        self.clinica.agendar_turno("111", "MP-1", "Cardiología", self.lunes, clave_idempotencia="r-5")
+        with self.assertRaises(ClaveIdempotenciaReutilizadaError):
+            self.clinica.emitir_receta("111", "MP-1", ["Aspirina"], clave_idempotencia="r-5")
+
+    def test_un_fallo_no_queda_guardado(self):
+        """Test 8: Si el primer intento falla, el reintento vuelve a ejecutarse"""
+        with self.assertRaises(Exception):
+            self.clinica.agendar_turno("999", "MP-1", "Cardiología", self.lunes, clave_idempotencia="r-6")
+        self.clinica.agregar_paciente(Paciente("999", "Luis Díaz", "02/02/1985"))
+        turno = self.clinica.agendar_turno("999", "MP-1", "Cardiología", self.lunes, clave_idempotencia="r-6")
+        self.assertEqual(turno.obtener_paciente().obtener_dni(), "999")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+from datetime import date
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.indice_edades import IndiceEdades, restar_anios
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.exepciones import FechaIncorrectaError
+
+
+class TestFechaNacimiento(unittest.TestCase):
+
+    def test_fecha_convertida_una_vez(self):
+        """Test 1: La fecha de nacimiento se guarda como ordinal"""
+        paciente = Paciente("111", "Ana Gómez", "29/02/2000")
+        self.assertEqual(paciente.obtener_fecha_nacimiento(), date(2000, 2, 29))
+        self.assertEqual(paciente.obtener_nacimiento_ordinal(), date(2000, 2, 29).toordinal())
+        self.assertEqual(str(paciente), "Ana Gómez - DNI: 111 - Nacimiento: 29/02/2000")
+
+    def test_fechas_invalidas(self):
+        """Test 2: Formatos inválidos, fechas inexistentes o futuras lanzan FechaIncorrectaError"""
+        for fecha in ("2000-01-01", "31/02/2000", "", "01/01/9999"):
+            with self.subTest(fecha=fecha):
+                with self.assertRaises(FechaIncorrectaError):
+                    Paciente("111", "Ana Gómez", fecha)
+
+
+class TestIndiceEdades(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial: pacientes de distintas edades en una clínica"""
+        self.clinica = Clinica()
+        for dni, nacimiento in (("1", "15/06/2020"), ("2", "16/06/1960"), ("3", "15/06/1960"),
+                                ("4", "01/01/1990"), ("5", "30/06/1960")):
+            self.clinica.agregar_paciente(Paciente(dni, f"Paciente {dni}", nacimiento))
+        self.referencia = date(2025, 6, 15)
+
+    def dnis(self, pacientes):
+        return sorted(p.obtener_dni() for p in pacientes)
+
+    def test_rango_de_edades(self):
+        """Test 1: Los límites de edad son inclusivos según la fecha de referencia"""
+        self.assertEqual(self.dnis(self.clinica.buscar_pacientes_por_edad(0, 17, self.referencia)), ["1"])
+        self.assertEqual(self.dnis(self.clinica.buscar_pacientes_por_edad(65, 120, self.referencia)), ["3"])
+        self.assertEqual(self.dnis(self.clinica.buscar_pacientes_por_edad(64, 65, self.referencia)), ["2", "3", "5"])
+
+    def test_cumplen_en_el_mes(self):
+        """Test 2: Pacientes que cumplen una edad en un mes dado"""
+        self.assertEqual(self.dnis(self.clinica.pacientes_que_cumplen(65, 2025, 6)), ["2", "3", "5"])
+        self.assertEqual(self.dnis(self.clinica.pacientes_que_cumplen(35, 2025, 1)), ["4"])
+        self.assertEqual(self.clinica.pacientes_que_cumplen(35, 2025, 12), [])
+
+    def test_reemplazo_de_paciente(self):
+        """Test 3: Registrar de nuevo un DNI actualiza su entrada en el índice"""
+        indice = IndiceEdades()
+        indice.agregar(Paciente("1", "Ana", "01/01/2000"))
+        indice.agregar(Paciente("1", "Ana", "01/01/1950"))
+        self.assertEqual(len(indice.nacidos_entre(date(1900, 1, 1), date(2100, 1, 1))), 1)
+        self.assertEqual(indice.nacidos_entre(date(2000, 1, 1), date(2001, 1, 1)), [])
+
+    def test_restar_anios_bisiesto(self):
+        """Test 4: Restar años a un 29 de febrero cae en el 28"""
+        self.assertEqual(restar_anios(date(2024, 2, 29), 1), date(2023, 2, 28))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+from datetime import datetime, timedelta
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.indice_horarios import IndiceHorarios
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.turno import Turno
+from src.motivos import MotivoRechazo
+from src.exepciones import TurnoSuperpuestoException, TurnoOcupadoException
+
+
+class TestIndiceHorarios(unittest.TestCase):
+
+    def test_superposicion_con_duraciones_distintas(self):
+        """Test 1: Un turno largo anterior se detecta aunque haya cortos en el medio"""
+        indice = IndiceHorarios()
+        nueve = datetime(2025, 6, 2, 9, 0)
+        indice.agregar("1", "MP-1", nueve, timedelta(hours=2))
+        indice.agregar("1", "MP-2", nueve + timedelta(minutes=15), timedelta(minutes=15))
+        self.assertTrue(indice.hay_superposicion("1", nueve + timedelta(minutes=90), nueve + timedelta(hours=3)))
+        self.assertFalse(indice.hay_superposicion("1", nueve + timedelta(hours=2), nueve + timedelta(hours=3)))
+        self.assertFalse(indice.hay_superposicion("2", nueve, nueve + timedelta(hours=3)))
+
+    def test_quitar_e_ignorar(self):
+        """Test 2: Un horario quitado o ignorado ya no cuenta como superposición"""
+        indice = IndiceHorarios()
+        nueve = datetime(2025, 6, 2, 9, 0)
+        indice.agregar("1", "MP-1", nueve, timedelta(minutes=30))
+        self.assertFalse(indice.hay_superposicion("1", nueve, nueve + timedelta(minutes=30), ("MP-1", nueve)))
+        indice.quitar("1", "MP-1", nueve)
+        self.assertFalse(indice.hay_superposicion("1", nueve, nueve + timedelta(minutes=30)))
+        self.assertEqual(indice.cantidad(), 0)
+
+
+class TestTurnosSuperpuestosDelPaciente(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial: un paciente y dos médicos de los lunes con duraciones distintas"""
+        self.clinica = Clinica()
+        self.clinica.agregar_paciente(Paciente("111", "Ana Gómez", "01/01/1990"))
+        self.clinica.agregar_paciente(Paciente("222", "Luis Díaz", "02/02/1985"))
+        cardiologo = Medico("MP-1", "Dr. García")
+        cardiologo.agregar_especialidad(Especialidad("Cardiología", ["lunes"], duracion_minutos=60))
+        pediatra = Medico("MP-2", "Dra. López")
+        pediatra.agregar_especialidad(Especialidad("Pediatría", ["lunes"], duracion_minutos=20))
+        self.clinica.agregar_medico(cardiologo)
+        self.clinica.agregar_medico(pediatra)
+        self.nueve = datetime(2025, 6, 2, 9, 0)
+        self.clinica.agendar_turno("111", "MP-1", "Cardiología", self.nueve)
+
+    def test_rechaza_superposicion_con_otro_medico(self):
+        """Test 3: Dentro de la hora de cardiología el paciente no puede ir a pediatría"""
+        media_hora = self.nueve + timedelta(minutes=30)
+        self.assertIs(self.clinica.puede_agendar("111", "MP-2", "Pediatría", media_hora),
+                      MotivoRechazo.PACIENTE_OCUPADO)
+        with self.assertRaises(TurnoSuperpuestoException):
+            self.clinica.agendar_turno("111", "MP-2", "Pediatría", media_hora)
+        self.clinica.agendar_turno("222", "MP-2", "Pediatría", media_hora)
+        self.clinica.agendar_turno("111", "MP-2", "Pediatría", self.nueve + timedelta(hours=1))
+
+    def test_turno_anterior_que_termina_tarde(self):
+        """Test 4: Un turno que empezaría antes y terminaría dentro del existente también choca"""
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("111", "MP-2", "Pediatría", self.nueve - timedelta(minutes=10))
+        self.clinica.agendar_turno("111", "MP-2", "Pediatría", self.nueve - timedelta(minutes=20))
+
+    def test_cancelar_libera_al_paciente(self):
+        """Test 5: Al cancelar el turno el paciente vuelve a estar libre"""
+        self.clinica.cancelar_turno("MP-1", self.nueve)
+        self.clinica.agendar_turno("111", "MP-2", "Pediatría", self.nueve + timedelta(minutes=30))
+
+    def test_reprogramar_dentro_del_propio_horario(self):
+        """Test 6: Reprogramar un turno no choca consigo mismo, pero sí con otro del paciente"""
+        nuevo = self.clinica.reprogramar_turno("MP-1", self.nueve, self.nueve + timedelta(minutes=30))
+        self.assertEqual(nuevo.obtener_fecha_hora(), self.nueve + timedelta(minutes=30))
+        self.clinica.agendar_turno("111", "MP-2", "Pediatría", self.nueve + timedelta(hours=2))
+        with self.assertRaises(TurnoSuperpuestoException):
+            self.clinica.reprogramar_turno("MP-1", self.nueve + timedelta(minutes=30),
+                                           self.nueve + timedelta(hours=1, minutes=30))
+
+    def test_series_y_carga_masiva(self):
+        """Test 7: Las series y los turnos incorporados en lote también ocupan al paciente"""
+        self.clinica.agendar_serie("222", "MP-2", "Pediatría", self.nueve, cantidad=4)
+        with self.assertRaises(TurnoSuperpuestoException):
+            self.clinica.agendar_turno("222", "MP-1", "Cardiología", self.nueve + timedelta(weeks=2))
+        with self.assertRaises(TurnoSuperpuestoException):
+            self.clinica.agendar_serie("111", "MP-2", "Pediatría", self.nueve + timedelta(minutes=40), cantidad=2)
+        pacientes = {p.obtener_dni(): p for p in self.clinica.obtener_pacientes()}
+        medicos = {m.obtener_matricula(): m for m in self.clinica.obtener_medicos()}
+        lunes_siguiente = self.nueve + timedelta(weeks=5)
+        self.clinica.incorporar_turnos([Turno(pacientes["111"], medicos["MP-2"], lunes_siguiente, "Pediatría")])
+        self.assertIs(self.clinica.puede_agendar("111", "MP-1", "Cardiología", lunes_siguiente),
+                      MotivoRechazo.PACIENTE_OCUPADO)
+
+
+if __name__ == "__main__":
+    unittest.main()
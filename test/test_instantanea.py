@@ -0,0 +1,102 @@
+import unittest
+import tempfile
+from datetime import datetime
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.instantanea import guardar_instantanea, cargar_instantanea, InstantaneaInvalidaError
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+
+
+class TestInstantanea(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial: una clínica con todos los tipos de entidades"""
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, "clinica.clin")
+        self.clinica = Clinica()
+        self.clinica.agregar_paciente(Paciente("111", "Ana Gómez", "01/01/1950"))
+        self.clinica.agregar_paciente(Paciente("222", "Luis Díaz", "02/02/1985"))
+        medico = Medico("MP-1", "Dr. García", Especialidad("Cardiología", ["lunes", "martes"]))
+        medico.agregar_especialidad(Especialidad("Clínica", ["viernes"]))
+        self.clinica.agregar_medico(medico)
+        self.clinica.agendar_turno("222", "MP-1", "Cardiología", datetime(2025, 6, 2, 10, 0))
+        self.clinica.agendar_turno("111", "MP-1", "Clínica", datetime(2025, 6, 6, 9, 30))
+        serie = self.clinica.agendar_serie("111", "MP-1", "Cardiología", datetime(2025, 1, 7, 10, 0), 10)
+        self.clinica.cancelar_turno("MP-1", datetime(2025, 1, 14, 10, 0))
+        self.clinica.emitir_receta("222", "MP-1", ["Aspirina", "Paracetamol"])
+        self.serie = serie
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def test_ida_y_vuelta(self):
+        """Test 1: Guardar y cargar conserva pacientes, médicos, turnos, series y recetas"""
+        guardar_instantanea(self.clinica, self.ruta)
+        copia = cargar_instantanea(self.ruta)
+
+        self.assertEqual([str(p) for p in copia.obtener_pacientes()], [str(p) for p in self.clinica.obtener_pacientes()])
+        self.assertEqual([str(m) for m in copia.obtener_medicos()], [str(m) for m in self.clinica.obtener_medicos()])
+        self.assertEqual(sorted(str(t) for t in copia.obtener_turnos()),
+                         sorted(str(t) for t in self.clinica.obtener_turnos()))
+        self.assertEqual(len(copia.obtener_turnos()), 11)
+        self.assertEqual(copia.obtener_series()[0].obtener_excepciones(), self.serie.obtener_excepciones())
+
+        original = self.clinica.obtener_historia_clinica("222").obtener_recetas()[0]
+        restaurada = copia.obtener_historia_clinica("222").obtener_recetas()[0]
+        self.assertEqual(restaurada.obtener_fecha(), original.obtener_fecha())
+        self.assertEqual(restaurada.obtener_medicamentos(), ["Aspirina", "Paracetamol"])
+
+    def test_indices_reconstruidos(self):
+        """Test 2: La clínica restaurada sigue validando y consultando con sus índices"""
+        guardar_instantanea(self.clinica, self.ruta)
+        copia = cargar_instantanea(self.ruta)
+        self.assertEqual(len(copia.buscar_turnos(dni="222")), 1)
+        self.assertEqual([p.obtener_dni() for p in copia.buscar_pacientes("gomez")], ["111"])
+        with self.assertRaises(Exception):
+            copia.agendar_turno("222", "MP-1", "Cardiología", datetime(2025, 6, 2, 10, 0))
+
+    def test_clinica_vacia(self):
+        """Test 3: Una clínica vacía también se puede guardar y cargar"""
+        guardar_instantanea(Clinica(), self.ruta)
+        self.assertEqual(cargar_instantanea(self.ruta).obtener_pacientes(), [])
+
+    def test_archivo_invalido(self):
+        """Test 4: Un archivo que no es instantánea o está truncado se rechaza"""
+        with open(self.ruta, "wb") as archivo:
+            archivo.write(b"no es una instantanea")
+        with self.assertRaises(InstantaneaInvalidaError):
+            cargar_instantanea(self.ruta)
+        guardar_instantanea(self.clinica, self.ruta)
+        with open(self.ruta, "r+b") as archivo:
+            archivo.truncate(100)
+        with self.assertRaises(InstantaneaInvalidaError):
+            cargar_instantanea(self.ruta)
+
+    def test_duraciones_de_especialidad(self):
+        """Test 5: La duración de cada especialidad se conserva al cargar"""
+        medico = Medico("MP-2", "Dra. López", Especialidad("Pediatría", ["lunes"], duracion_minutos=20))
+        self.clinica.agregar_medico(medico)
+        guardar_instantanea(self.clinica, self.ruta)
+        copia = cargar_instantanea(self.ruta)
+        duraciones = {m.obtener_matricula(): m.obtener_duracion_minutos(e.obtener_especialidad())
+                      for m in copia.obtener_medicos() for e in m.obtener_especialidades()}
+        self.assertEqual(duraciones["MP-2"], 20)
+
+    def test_ids_de_recetas(self):
+        """Test 6: Las recetas restauradas conservan sus ids"""
+        self.clinica.emitir_receta("111", "MP-1", ["Ibuprofeno"])
+        guardar_instantanea(self.clinica, self.ruta)
+        copia = cargar_instantanea(self.ruta)
+        for id_receta in (1, 2):
+            self.assertEqual(copia.obtener_receta(id_receta).obtener_medicamentos(),
+                             self.clinica.obtener_receta(id_receta).obtener_medicamentos())
+
+
+if __name__ == "__main__":
+    unittest.main()
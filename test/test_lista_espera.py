@@ -0,0 +1,83 @@
+import unittest
+from datetime import datetime
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.lista_espera import ListaEspera
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.exepciones import PacienteNoEncontradoException
+
+
+class TestListaEspera(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial: una lista de espera vacía"""
+        self.lista = ListaEspera()
+
+    def test_orden_por_prioridad_y_fecha(self):
+        """Test 1: Primero la prioridad más baja, luego la solicitud más antigua"""
+        self.lista.agregar("1", "Pediatría", prioridad=2, fecha_solicitud=datetime(2025, 1, 1))
+        self.lista.agregar("2", "Pediatría", prioridad=1, fecha_solicitud=datetime(2025, 1, 3))
+        self.lista.agregar("3", "Pediatría", prioridad=1, fecha_solicitud=datetime(2025, 1, 2))
+        self.assertEqual(self.lista.obtener_pendientes("Pediatría"), ["3", "2", "1"])
+        self.assertEqual(self.lista.cantidad("Pediatría"), 3)
+
+    def test_quitar_es_perezoso(self):
+        """Test 2: Las solicitudes quitadas no se asignan"""
+        self.lista.agregar("1", "Pediatría", fecha_solicitud=datetime(2025, 1, 1))
+        self.lista.agregar("2", "Pediatría", fecha_solicitud=datetime(2025, 1, 2))
+        self.assertTrue(self.lista.quitar("1", "Pediatría"))
+        self.assertFalse(self.lista.quitar("1", "Pediatría"))
+        self.assertEqual(self.lista.asignar("Pediatría", lambda dni: True), "2")
+        self.assertEqual(self.lista.cantidad("Pediatría"), 0)
+
+    def test_rechazados_vuelven_a_la_cola(self):
+        """Test 3: Quien no puede tomar la franja conserva su lugar"""
+        self.lista.agregar("1", "Pediatría", fecha_solicitud=datetime(2025, 1, 1))
+        self.lista.agregar("2", "Pediatría", fecha_solicitud=datetime(2025, 1, 2))
+        self.assertEqual(self.lista.asignar("Pediatría", lambda dni: dni == "2"), "2")
+        self.assertEqual(self.lista.obtener_pendientes("Pediatría"), ["1"])
+
+
+class TestListaEsperaClinica(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial: un pediatra con un turno ocupado y dos pacientes esperando"""
+        self.clinica = Clinica()
+        for dni in ("111", "222", "333"):
+            self.clinica.agregar_paciente(Paciente(dni, f"Paciente {dni}", "01/01/2015"))
+        medico = Medico("MP-1", "Dra. López", "Pediatría")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+        self.clinica.agregar_medico(medico)
+        self.fecha = datetime(2025, 6, 2, 10, 0)
+        self.clinica.agendar_turno("111", "MP-1", "Pediatría", self.fecha)
+        self.clinica.agregar_a_lista_espera("222", "Pediatría", prioridad=1)
+        self.clinica.agregar_a_lista_espera("333", "Pediatría", prioridad=0)
+
+    def test_cancelacion_asigna_al_siguiente(self):
+        """Test 1: Al cancelar, la franja se asigna al paciente más prioritario"""
+        self.clinica.cancelar_turno("MP-1", self.fecha)
+        turnos = self.clinica.buscar_turnos(matricula="MP-1")
+        self.assertEqual([t.obtener_paciente().obtener_dni() for t in turnos], ["333"])
+        self.assertEqual(self.clinica.obtener_lista_espera("Pediatría"), ["222"])
+
+    def test_ofrecer_turnos_nuevos(self):
+        """Test 2: Ofrecer franjas nuevas solo usa las válidas para la especialidad"""
+        asignados = self.clinica.ofrecer_turnos("MP-1", [datetime(2025, 6, 9, 9, 0), datetime(2025, 6, 10, 9, 0),
+                                                         self.fecha])
+        self.assertEqual(len(asignados), 1)
+        self.assertEqual(asignados[0].obtener_paciente().obtener_dni(), "333")
+
+    def test_paciente_inexistente(self):
+        """Test 3: No se puede poner en espera a un paciente no registrado"""
+        with self.assertRaises(PacienteNoEncontradoException):
+            self.clinica.agregar_a_lista_espera("999", "Pediatría")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+import sys
+import os
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.turno import Turno
+from src.memoria import MedidorMemoria, formatear_reporte
+
+
+class TestMedidorMemoria(unittest.TestCase):
+
+    def test_objeto_compartido_se_cuenta_una_vez(self):
+        """Test 1: Un objeto repetido en un contenedor se mide una sola vez"""
+        valor = "x" * 1000
+        solo = sum(MedidorMemoria().medir([valor]))
+        repetido = sum(MedidorMemoria().medir([valor] * 3))
+        self.assertAlmostEqual(repetido - solo, 2 * 8, delta=16)
+
+    def test_muestreo_se_acerca_al_valor_exacto(self):
+        """Test 2: La estimación por muestreo queda cerca de la medición completa"""
+        datos = {i: [str(i) * (i % 7 + 1), float(i)] for i in range(20_000)}
+        exacto = sum(MedidorMemoria(muestra=10**9).medir(datos))
+        estimado = sum(MedidorMemoria(muestra=200).medir(datos))
+        self.assertAlmostEqual(estimado / exacto, 1.0, delta=0.1)
+
+    def test_muestra_invalida(self):
+        """Test 3: La muestra debe ser positiva"""
+        with self.assertRaises(ValueError):
+            MedidorMemoria(muestra=0)
+
+
+class TestReporteMemoriaClinica(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial: clínica con pacientes, un médico, turnos y recetas"""
+        self.clinica = Clinica()
+        for dni in range(50):
+            self.clinica.agregar_paciente(Paciente(str(dni), f"Paciente {dni}", "01/01/1980"))
+        medico = Medico("MP-1", "Dr. García")
+        medico.agregar_especialidad(Especialidad("Cardiología", ["lunes"]))
+        self.clinica.agregar_medico(medico)
+        lunes = datetime(2025, 6, 2, 8, 0)
+        for i in range(400):
+            fecha_hora = lunes + timedelta(weeks=i // 20, minutes=15 * (i % 20))
+            self.clinica.agendar_turno(str(i % 50), "MP-1", "Cardiología", fecha_hora)
+        for dni in range(10):
+            self.clinica.emitir_receta(str(dni), "MP-1", ["Aspirina"])
+
+    def test_cantidades_por_subsistema(self):
+        """Test 4: El reporte cuenta las entidades de cada subsistema"""
+        reporte = self.clinica.reporte_memoria()
+        self.assertEqual(reporte["pacientes"]["cantidad"], 50)
+        self.assertEqual(reporte["medicos"]["cantidad"], 1)
+        self.assertEqual(reporte["turnos"]["cantidad"], 400)
+        self.assertEqual(reporte["registro_recetas"]["cantidad"], 10)
+        self.assertEqual(reporte["indice_turnos"]["cantidad"], 400)
+        self.assertEqual(reporte["total"]["bytes"],
+                         sum(f["bytes"] for nombre, f in reporte.items() if nombre != "total"))
+
+    def test_turnos_no_se_cuentan_en_las_historias(self):
+        """Test 5: Las historias sólo pagan sus listas, no los turnos que comparten con la clínica"""
+        reporte = self.clinica.reporte_memoria(muestra=10**9)
+        bytes_turno = reporte["turnos"]["bytes_por_entidad"]
+        self.assertGreater(bytes_turno, sys.getsizeof(Turno(None, None, None, None)))
+        # 8 turnos por historia: si se contaran completos cada historia superaría 8 turnos enteros.
+        self.assertLess(reporte["historias"]["bytes_por_entidad"], 8 * bytes_turno)
+
+    def test_formatear_reporte(self):
+        """Test 6: El reporte se imprime como tabla con una fila por subsistema"""
+        texto = formatear_reporte(self.clinica.reporte_memoria())
+        self.assertIn("turnos", texto)
+        self.assertEqual(len(texto.splitlines()), 1 + len(self.clinica.reporte_memoria()))
+
+
+if __name__ == "__main__":
+    unittest.main()
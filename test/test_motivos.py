@@ -0,0 +1,69 @@
+import unittest
+from datetime import datetime
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.motivos import MotivoRechazo
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.exepciones import (
+    PacienteNoEncontradoException,
+    MedicoNoDisponibleException,
+    TurnoOcupadoException,
+)
+
+
+class TestPuedeAgendar(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial: un paciente, un cardiólogo de los lunes y un turno"""
+        self.clinica = Clinica()
+        self.clinica.agregar_paciente(Paciente("111", "Ana Gómez", "01/01/1990"))
+        medico = Medico("MP-1", "Dr. García", "Cardiología")
+        medico.agregar_especialidad(Especialidad("Cardiología", ["lunes"]))
+        self.clinica.agregar_medico(medico)
+        self.lunes = datetime(2025, 6, 2, 10, 0)
+        self.clinica.agendar_turno("111", "MP-1", "Cardiología", self.lunes)
+
+    def test_disponible(self):
+        """Test 1: Una franja válida devuelve DISPONIBLE, que es falso"""
+        motivo = self.clinica.puede_agendar("111", "MP-1", "Cardiología", datetime(2025, 6, 2, 11, 0))
+        self.assertIs(motivo, MotivoRechazo.DISPONIBLE)
+        self.assertFalse(motivo)
+
+    def test_motivos_de_rechazo(self):
+        """Test 2: Cada causa de rechazo tiene su código, en el orden de validación"""
+        casos = [
+            (("999", "MP-1", "Cardiología", self.lunes), MotivoRechazo.PACIENTE_INEXISTENTE),
+            (("111", "MP-9", "Cardiología", self.lunes), MotivoRechazo.MEDICO_INEXISTENTE),
+            (("111", "MP-1", "Cardiología", self.lunes), MotivoRechazo.TURNO_OCUPADO),
+            (("111", "MP-1", "Cardiología", datetime(2025, 6, 3, 10, 0)), MotivoRechazo.ESPECIALIDAD_NO_DISPONIBLE),
+            (("111", "MP-1", "Pediatría", datetime(2025, 6, 2, 11, 0)), MotivoRechazo.ESPECIALIDAD_NO_DISPONIBLE),
+        ]
+        for argumentos, esperado in casos:
+            with self.subTest(esperado=esperado):
+                self.assertIs(self.clinica.puede_agendar(*argumentos), esperado)
+
+    def test_agendar_turno_conserva_excepciones(self):
+        """Test 3: agendar_turno sigue lanzando las mismas excepciones"""
+        with self.assertRaises(PacienteNoEncontradoException):
+            self.clinica.agendar_turno("999", "MP-1", "Cardiología", self.lunes)
+        with self.assertRaises(MedicoNoDisponibleException):
+            self.clinica.agendar_turno("111", "MP-9", "Cardiología", self.lunes)
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("111", "MP-1", "Cardiología", self.lunes)
+        with self.assertRaises(MedicoNoDisponibleException):
+            self.clinica.agendar_turno("111", "MP-1", "Cardiología", datetime(2025, 6, 3, 10, 0))
+
+    def test_puede_agendar_no_modifica(self):
+        """Test 4: Consultar no agenda nada"""
+        self.clinica.puede_agendar("111", "MP-1", "Cardiología", datetime(2025, 6, 9, 10, 0))
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
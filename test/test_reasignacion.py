@@ -0,0 +1,112 @@
+import unittest
+from collections import Counter
+from datetime import datetime, timedelta
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.exepciones import MedicoNoDisponibleException
+
+
+class TestReasignacionDeTurnos(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial: un cardiólogo de lunes y martes, dos suplentes de los lunes y treinta pacientes"""
+        self.clinica = Clinica()
+        for dni in range(30):
+            self.clinica.agregar_paciente(Paciente(str(dni), f"Paciente {dni}", "01/01/1980"))
+        titular = Medico("MP-1", "Dr. García")
+        titular.agregar_especialidad(Especialidad("Cardiología", ["lunes", "martes"]))
+        titular.agregar_especialidad(Especialidad("Clínica", ["jueves"]))
+        self.clinica.agregar_medico(titular)
+        for matricula in ("MP-2", "MP-3"):
+            suplente = Medico(matricula, f"Dr. {matricula}")
+            suplente.agregar_especialidad(Especialidad("Cardiología", ["lunes"]))
+            self.clinica.agregar_medico(suplente)
+        self.lunes = datetime(2025, 6, 2, 8, 0)
+        self.desde = self.lunes - timedelta(days=1)
+
+    def matricula(self, turno):
+        return turno.obtener_medico().obtener_matricula()
+
+    def test_quitar_especialidad_y_dia_en_medico(self):
+        """Test 1: El médico puede dejar un día o una especialidad completa"""
+        medico = Medico("MP-9", "Dra. López")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["lunes", "miércoles"], duracion_minutos=20))
+        self.assertTrue(medico.quitar_dia("Pediatría", "Lunes"))
+        self.assertEqual(medico.obtener_especialidades()[0].obtener_dias(), ["miércoles"])
+        self.assertEqual(medico.obtener_duracion_minutos("Pediatría"), 20)
+        self.assertFalse(medico.quitar_dia("Pediatría", "lunes"))
+        self.assertTrue(medico.quitar_especialidad("Pediatría"))
+        self.assertFalse(medico.quitar_especialidad("Pediatría"))
+        self.assertEqual(medico.obtener_especialidades(), [])
+
+    def test_proponer_no_modifica(self):
+        """Test 2: La propuesta reparte los turnos afectados sin tocar la agenda"""
+        for dni in range(6):
+            self.clinica.agendar_turno(str(dni), "MP-1", "Cardiología", self.lunes + timedelta(hours=dni))
+        self.clinica.agendar_turno("10", "MP-1", "Cardiología", self.lunes + timedelta(days=1))
+        propuesta = self.clinica.proponer_reasignacion("MP-1", "Cardiología", "lunes", self.desde)
+        self.assertEqual(len(propuesta), 6)
+        self.assertEqual(Counter(elegido for _, elegido in propuesta), {"MP-2": 3, "MP-3": 3})
+        self.assertEqual(len(self.clinica.buscar_turnos(matricula="MP-1")), 7)
+        self.assertEqual(self.clinica.proponer_reasignacion("MP-1", "Cardiología", "lunes", self.desde), propuesta)
+
+    def test_quitar_dia_mueve_los_turnos(self):
+        """Test 3: Al dejar los lunes, sus turnos pasan a los suplentes y los martes quedan"""
+        for dni in range(6):
+            self.clinica.agendar_turno(str(dni), "MP-1", "Cardiología", self.lunes + timedelta(hours=dni))
+        self.clinica.agendar_turno("10", "MP-1", "Cardiología", self.lunes + timedelta(days=1))
+        resultado = self.clinica.quitar_dia_medico("MP-1", "Cardiología", "lunes", self.desde)
+        self.assertEqual(len(resultado["reasignados"]), 6)
+        self.assertEqual(resultado["cancelados"], [])
+        for original, nuevo in resultado["reasignados"]:
+            self.assertEqual(original.obtener_fecha_hora(), nuevo.obtener_fecha_hora())
+            self.assertEqual(original.obtener_paciente(), nuevo.obtener_paciente())
+            self.assertIn(self.matricula(nuevo), ("MP-2", "MP-3"))
+        restantes = self.clinica.buscar_turnos(matricula="MP-1")
+        self.assertEqual([t.obtener_fecha_hora() for t in restantes], [self.lunes + timedelta(days=1)])
+        with self.assertRaises(MedicoNoDisponibleException):
+            self.clinica.agendar_turno("20", "MP-1", "Cardiología", self.lunes + timedelta(weeks=1))
+
+    def test_sin_reemplazo_se_cancela(self):
+        """Test 4: Si los suplentes están ocupados en ese horario el turno se cancela"""
+        self.clinica.agendar_turno("0", "MP-1", "Cardiología", self.lunes)
+        self.clinica.agendar_turno("1", "MP-2", "Cardiología", self.lunes)
+        self.clinica.agendar_turno("2", "MP-3", "Cardiología", self.lunes)
+        self.clinica.agendar_turno("3", "MP-1", "Cardiología", self.lunes + timedelta(days=1))
+        resultado = self.clinica.quitar_especialidad_medico("MP-1", "Cardiología", self.desde)
+        self.assertEqual(resultado["reasignados"], [])
+        self.assertEqual(len(resultado["cancelados"]), 2)
+        self.assertTrue(all(t.esta_cancelado() for t in resultado["cancelados"]))
+        self.assertEqual(self.clinica.buscar_turnos(matricula="MP-1"), [])
+
+    def test_series_y_turnos_pasados(self):
+        """Test 5: Las ocurrencias futuras de una serie se mueven y los turnos anteriores a 'desde' no"""
+        self.clinica.agendar_serie("0", "MP-1", "Cardiología", self.lunes, cantidad=4)
+        resultado = self.clinica.dar_de_baja_medico("MP-1", self.lunes + timedelta(weeks=2) - timedelta(days=1))
+        movidos = sorted(nuevo.obtener_fecha_hora() for _, nuevo in resultado["reasignados"])
+        self.assertEqual(movidos, [self.lunes + timedelta(weeks=2), self.lunes + timedelta(weeks=3)])
+        fechas = sorted(t.obtener_fecha_hora() for t in self.clinica.buscar_turnos(matricula="MP-1"))
+        self.assertEqual(fechas, [self.lunes, self.lunes + timedelta(weeks=1)])
+        self.assertEqual(self.clinica.obtener_medicos()[0].obtener_especialidades(), [])
+
+    def test_muchos_turnos(self):
+        """Test 6: Cientos de turnos afectados se reparten entre los suplentes en una sola operación"""
+        for semana in range(40):
+            for dni in range(24):
+                self.clinica.agendar_turno(str(dni), "MP-1", "Cardiología",
+                                           self.lunes + timedelta(weeks=semana, minutes=20 * dni))
+        resultado = self.clinica.quitar_dia_medico("MP-1", "Cardiología", "lunes", self.desde)
+        self.assertEqual(len(resultado["reasignados"]), 960)
+        carga = Counter(self.matricula(nuevo) for _, nuevo in resultado["reasignados"])
+        self.assertEqual(carga, {"MP-2": 480, "MP-3": 480})
+
+
+if __name__ == "__main__":
+    unittest.main()
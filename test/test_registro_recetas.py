@@ -0,0 +1,129 @@
+import unittest
+import pickle
+import tempfile
+from datetime import datetime, timedelta
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.registro_recetas import RegistroRecetas
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.receta import Receta
+from src.archivo import ArchivoHistorico
+
+
+class TestRegistroRecetas(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial: clínica con dos médicos y cinco pacientes"""
+        self.clinica = Clinica()
+        for dni in range(5):
+            self.clinica.agregar_paciente(Paciente(str(dni), f"Paciente {dni}", "01/01/1980"))
+        for matricula in ("MP-1", "MP-2"):
+            medico = Medico(matricula, f"Dr. {matricula}")
+            medico.agregar_especialidad(Especialidad("Clínica", ["lunes"]))
+            self.clinica.agregar_medico(medico)
+
+    def test_ids_y_busqueda(self):
+        """Test 1: Cada receta emitida recibe un id y se encuentra por él"""
+        primera = self.clinica.emitir_receta("0", "MP-1", ["Aspirina"])
+        segunda = self.clinica.emitir_receta("1", "MP-2", ["Ibuprofeno", "Omeprazol"])
+        self.assertEqual((primera.obtener_id(), segunda.obtener_id()), (1, 2))
+        encontrada = self.clinica.obtener_receta(2)
+        self.assertEqual(encontrada.obtener_id(), 2)
+        self.assertIs(encontrada.obtener_paciente(), segunda.obtener_paciente())
+        self.assertEqual(encontrada.obtener_medicamentos(), ["Ibuprofeno", "Omeprazol"])
+        self.assertEqual(encontrada.obtener_fecha(), segunda.obtener_fecha())
+        self.assertIsNone(self.clinica.obtener_receta(0))
+        self.assertIsNone(self.clinica.obtener_receta(3))
+
+    def test_paginado_por_medico(self):
+        """Test 2: Las recetas de un médico se recorren por páginas con el último id como cursor"""
+        for numero in range(7):
+            self.clinica.emitir_receta(str(numero % 5), "MP-1" if numero % 2 == 0 else "MP-2", [f"Droga {numero}"])
+        pagina = self.clinica.obtener_recetas_por_medico("MP-1", limite=3)
+        self.assertEqual([r.obtener_id() for r in pagina], [1, 3, 5])
+        pagina = self.clinica.obtener_recetas_por_medico("MP-1", pagina[-1].obtener_id(), limite=3)
+        self.assertEqual([r.obtener_id() for r in pagina], [7])
+        self.assertEqual(self.clinica.obtener_recetas_por_medico("MP-9"), [])
+
+    def test_paginado_por_fecha(self):
+        """Test 3: Por fecha se respetan el rango y el orden aunque lleguen fuera de orden"""
+        pacientes = {p.obtener_dni(): p for p in self.clinica.obtener_pacientes()}
+        medico = self.clinica.obtener_medicos()[0]
+        base = datetime(2025, 6, 1)
+        for dias in (5, 1, 3, 2, 4):
+            self.clinica.incorporar_receta(Receta(pacientes["0"], medico, ["Aspirina"], base + timedelta(days=dias)))
+        recetas = self.clinica.obtener_recetas_por_fecha(base + timedelta(days=2), base + timedelta(days=5), limite=2)
+        self.assertEqual([r.obtener_fecha().day for r in recetas], [3, 4])
+        siguientes = self.clinica.obtener_recetas_por_fecha(base + timedelta(days=2), base + timedelta(days=5),
+                                                            recetas[-1].obtener_id(), limite=2)
+        self.assertEqual([r.obtener_fecha().day for r in siguientes], [5])
+        self.assertEqual(len(self.clinica.obtener_recetas_por_fecha()), 5)
+
+    def test_almacenamiento_compacto(self):
+        """Test 4: Cien mil recetas ocupan pocos bytes cada una y se serializan"""
+        registro = RegistroRecetas()
+        paciente = self.clinica.obtener_pacientes()[0]
+        medico = self.clinica.obtener_medicos()[0]
+        fecha = datetime(2025, 6, 1)
+        for numero in range(100_000):
+            registro.agregar(Receta(paciente, medico, ["Aspirina", "Omeprazol"], fecha + timedelta(seconds=numero)))
+        self.assertLess(len(pickle.dumps(registro)) / registro.cantidad(), 48)
+        copia = pickle.loads(pickle.dumps(registro))
+        receta = copia.obtener(12_345, {"0": paciente}, {"MP-1": medico})
+        self.assertEqual(receta.obtener_fecha(), fecha + timedelta(seconds=12_344))
+
+    def test_ids_sobreviven_al_archivo(self):
+        """Test 5: Una receta archivada conserva su id y sigue disponible en el registro"""
+        with tempfile.TemporaryDirectory() as directorio:
+            clinica = Clinica(ArchivoHistorico(directorio))
+            clinica.agregar_paciente(Paciente("1", "Ana", "01/01/1990"))
+            clinica.agregar_medico(Medico("MP-1", "Dr. García", Especialidad("Clínica", ["lunes"])))
+            receta = clinica.emitir_receta("1", "MP-1", ["Aspirina"])
+            clinica.archivar(datetime.now() + timedelta(days=1))
+            archivada = clinica.obtener_historia_clinica("1").obtener_recetas()[0]
+            self.assertEqual(archivada.obtener_id(), receta.obtener_id())
+            self.assertEqual(clinica.obtener_receta(receta.obtener_id()).obtener_medicamentos(), ["Aspirina"])
+
+    def test_historia_guarda_solo_ids(self):
+        """Test 6: La historia arma sus recetas desde el registro, con id y versión"""
+        receta = self.clinica.emitir_receta("0", "MP-1", ["Aspirina"])
+        vista = self.clinica.abrir_vista()
+        self.clinica.emitir_receta("0", "MP-1", ["Omeprazol"])
+        leidas = self.clinica.obtener_historia_clinica("0").obtener_recetas()
+        self.assertIsNot(leidas[0], receta)
+        self.assertEqual([r.obtener_id() for r in leidas], [receta.obtener_id(), receta.obtener_id() + 1])
+        self.assertEqual(leidas[0].obtener_version(), receta.obtener_version())
+        self.assertEqual([r.obtener_medicamentos() for r in vista.obtener_historia_clinica("0").obtener_recetas()],
+                         [["Aspirina"]])
+
+
+    def test_ids_unicos_al_reabrir_el_archivo(self):
+        """Test 7: Una clínica nueva sobre el mismo archivo sigue la numeración de las recetas archivadas"""
+        with tempfile.TemporaryDirectory() as directorio:
+            def abrir():
+                clinica = Clinica(ArchivoHistorico(directorio))
+                clinica.agregar_paciente(Paciente("1", "Ana", "01/01/1990"))
+                clinica.agregar_medico(Medico("MP-1", "Dr. García", Especialidad("Clínica", ["lunes"])))
+                return clinica
+
+            anterior = abrir()
+            archivada = anterior.emitir_receta("1", "MP-1", ["Aspirina"])
+            anterior.archivar(datetime.now() + timedelta(days=1))
+            clinica = abrir()
+            nueva = clinica.emitir_receta("1", "MP-1", ["Ibuprofeno"])
+            self.assertEqual(nueva.obtener_id(), archivada.obtener_id() + 1)
+            recetas = clinica.obtener_historia_clinica("1").obtener_recetas()
+            self.assertEqual([r.obtener_id() for r in recetas], [archivada.obtener_id(), nueva.obtener_id()])
+            self.assertEqual(clinica.obtener_receta(archivada.obtener_id()).obtener_medicamentos(), ["Aspirina"])
+            self.assertEqual(clinica.obtener_receta(nueva.obtener_id()).obtener_medicamentos(), ["Ibuprofeno"])
+            por_medico = clinica.obtener_recetas_por_medico("MP-1")
+            self.assertEqual([r.obtener_id() for r in por_medico], [nueva.obtener_id()])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+import gc
+import tempfile
+import weakref
+from datetime import datetime
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.render import CacheRender
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+
+
+class TestCacheRender(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial: un médico con una especialidad y una caché chica"""
+        self.cache = CacheRender(capacidad=2)
+        self.medico = Medico("MP-1", "Dr. García", "Cardiología")
+        self.medico.agregar_especialidad(Especialidad("Cardiología", ["lunes"]))
+
+    def test_segunda_lectura_es_acierto(self):
+        """Test 1: Renderizar dos veces la misma entidad usa la caché"""
+        primero = self.cache.renderizar(self.medico)
+        segundo = self.cache.renderizar(self.medico)
+        self.assertEqual(primero, str(self.medico))
+        self.assertIs(primero, segundo)
+        self.assertEqual(self.cache.obtener_estadisticas()["aciertos"], 1)
+
+    def test_agregar_especialidad_invalida(self):
+        """Test 2: Agregar una especialidad invalida solo la entrada del médico"""
+        paciente = Paciente("111", "Ana Gómez", "01/01/1990")
+        self.cache.renderizar(self.medico)
+        self.cache.renderizar(paciente)
+        self.medico.agregar_especialidad(Especialidad("Clínica", ["martes"]))
+        self.assertEqual(self.cache.cantidad(), 1)
+        self.assertIn("Clínica", self.cache.renderizar(self.medico))
+
+    def test_capacidad_acotada(self):
+        """Test 3: Al superar la capacidad se descarta la entrada menos usada"""
+        pacientes = [Paciente(str(i), f"Paciente {i}", "01/01/1990") for i in range(3)]
+        for paciente in pacientes:
+            self.cache.renderizar(paciente)
+        self.assertEqual(self.cache.cantidad(), 2)
+        self.cache.renderizar(pacientes[0])
+        self.assertEqual(self.cache.obtener_estadisticas()["fallos"], 4)
+
+    def test_historia_clinica_se_invalida(self):
+        """Test 4: Nuevos turnos y recetas invalidan la historia clínica"""
+        clinica = Clinica()
+        clinica.agregar_paciente(Paciente("111", "Ana Gómez", "01/01/1990"))
+        clinica.agregar_medico(self.medico)
+        historia = clinica.obtener_historia_clinica("111")
+        self.assertIn("(sin turnos)", self.cache.renderizar(historia))
+        clinica.agendar_turno("111", "MP-1", "Cardiología", datetime(2025, 6, 2, 10, 0))
+        self.assertNotIn("(sin turnos)", self.cache.renderizar(historia))
+        clinica.emitir_receta("111", "MP-1", ["Aspirina"])
+        self.assertIn("Aspirina", self.cache.renderizar(historia))
+
+    def test_no_retiene_entidades(self):
+        """Test 5: La caché no mantiene vivas las entidades y descarta la entrada cuando mueren"""
+        paciente = Paciente("111", "Ana Gómez", "01/01/1990")
+        referencia = weakref.ref(paciente)
+        self.cache.renderizar(paciente)
+        del paciente
+        gc.collect()
+        self.assertIsNone(referencia())
+        self.assertEqual(self.cache.cantidad(), 0)
+
+    def test_historia_recargada_no_sirve_texto_viejo(self):
+        """Test 6: Una historia expulsada y recargada se renderiza de nuevo"""
+        with tempfile.TemporaryDirectory() as directorio:
+            clinica = Clinica(capacidad_historias=1, directorio_historias=directorio)
+            clinica.agregar_paciente(Paciente("111", "Ana Gómez", "01/01/1990"))
+            clinica.agregar_paciente(Paciente("222", "Luis Díaz", "02/02/1985"))
+            clinica.agregar_medico(self.medico)
+            self.assertIn("(sin turnos)", self.cache.renderizar(clinica.obtener_historia_clinica("111")))
+            clinica.obtener_historia_clinica("222")
+            gc.collect()
+            clinica.agendar_turno("111", "MP-1", "Cardiología", datetime(2025, 6, 2, 10, 0))
+            self.assertNotIn("(sin turnos)", self.cache.renderizar(clinica.obtener_historia_clinica("111")))
+            clinica.cerrar()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+from datetime import datetime
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.exepciones import TurnoOcupadoException, MedicoNoDisponibleException
+
+
+class TestSerieTurnos(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial: un paciente crónico y un cardiólogo que atiende los martes"""
+        self.clinica = Clinica()
+        self.clinica.agregar_paciente(Paciente("111", "Ana Gómez", "01/01/1950"))
+        self.clinica.agregar_paciente(Paciente("222", "Luis Díaz", "02/02/1985"))
+        medico = Medico("MP-1", "Dr. García", "Cardiología")
+        medico.agregar_especialidad(Especialidad("Cardiología", ["martes"]))
+        self.clinica.agregar_medico(medico)
+        self.inicio = datetime(2025, 1, 7, 10, 0)
+
+    def test_agendar_serie_anual(self):
+        """Test 1: Una serie semanal de 52 turnos se guarda como una sola regla"""
+        serie = self.clinica.agendar_serie("111", "MP-1", "Cardiología", self.inicio, 52)
+        self.assertEqual(len(self.clinica.obtener_series()), 1)
+        self.assertEqual(serie.obtener_fin(), datetime(2025, 12, 30, 10, 0))
+        self.assertEqual(len(self.clinica.obtener_turnos()), 52)
+        self.assertEqual(len(self.clinica.obtener_historia_clinica("111").obtener_turnos()), 52)
+
+    def test_expansion_perezosa_por_rango(self):
+        """Test 2: Las consultas por rango expanden solo las ocurrencias necesarias"""
+        self.clinica.agendar_serie("111", "MP-1", "Cardiología", self.inicio, 52)
+        turnos = self.clinica.buscar_turnos(matricula="MP-1", desde=datetime(2025, 2, 1), hasta=datetime(2025, 3, 1))
+        self.assertEqual([t.obtener_fecha_hora().day for t in turnos], [4, 11, 18, 25])
+
+    def test_serie_en_dia_no_disponible(self):
+        """Test 3: La serie se rechaza si el médico no atiende ese día"""
+        with self.assertRaises(MedicoNoDisponibleException):
+            self.clinica.agendar_serie("111", "MP-1", "Cardiología", datetime(2025, 1, 8, 10, 0), 10)
+
+    def test_conflicto_con_turno_existente(self):
+        """Test 4: Un turno suelto dentro de la serie impide agendarla"""
+        self.clinica.agendar_turno("222", "MP-1", "Cardiología", datetime(2025, 3, 4, 10, 0))
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_serie("111", "MP-1", "Cardiología", self.inicio, 52)
+        self.assertEqual(self.clinica.obtener_series(), [])
+
+    def test_conflicto_entre_series(self):
+        """Test 5: Dos series que coinciden en alguna ocurrencia entran en conflicto"""
+        self.clinica.agendar_serie("111", "MP-1", "Cardiología", self.inicio, 4, intervalo_semanas=2)
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_serie("222", "MP-1", "Cardiología", datetime(2025, 1, 14, 10, 0), 4)
+        self.clinica.agendar_serie("222", "MP-1", "Cardiología", datetime(2025, 1, 14, 10, 0), 4, intervalo_semanas=2)
+
+    def test_turno_suelto_sobre_serie(self):
+        """Test 6: No se puede agendar un turno suelto sobre una ocurrencia de la serie"""
+        self.clinica.agendar_serie("111", "MP-1", "Cardiología", self.inicio, 10)
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("222", "MP-1", "Cardiología", datetime(2025, 1, 21, 10, 0))
+
+    def test_cancelar_ocurrencia_registra_excepcion(self):
+        """Test 7: Cancelar una ocurrencia la agrega como excepción y libera el horario"""
+        serie = self.clinica.agendar_serie("111", "MP-1", "Cardiología", self.inicio, 10)
+        fecha = datetime(2025, 1, 21, 10, 0)
+        self.clinica.cancelar_turno("MP-1", fecha)
+        self.assertEqual(serie.obtener_excepciones(), [fecha])
+        self.assertEqual(len(self.clinica.obtener_turnos()), 9)
+        self.clinica.agendar_turno("222", "MP-1", "Cardiología", fecha)
+
+    def test_reprogramar_ocurrencia(self):
+        """Test 8: Reprogramar una ocurrencia la convierte en turno suelto"""
+        self.clinica.agendar_serie("111", "MP-1", "Cardiología", self.inicio, 3)
+        nuevo = self.clinica.reprogramar_turno("MP-1", datetime(2025, 1, 14, 10, 0), datetime(2025, 1, 14, 12, 0))
+        fechas = [t.obtener_fecha_hora() for t in self.clinica.buscar_turnos(dni="111")]
+        self.assertIn(nuevo.obtener_fecha_hora(), fechas)
+        self.assertNotIn(datetime(2025, 1, 14, 10, 0), fechas)
+        self.assertEqual(len(fechas), 3)
+
+    def test_cancelaciones_no_borran_series_de_la_historia(self):
+        """Test 9: Cancelar turnos sueltos no afecta las series de la historia clínica"""
+        self.clinica.agendar_serie("111", "MP-1", "Cardiología", self.inicio, 3)
+        fecha = datetime(2025, 6, 3, 10, 0)
+        self.clinica.agendar_turno("111", "MP-1", "Cardiología", fecha)
+        self.clinica.cancelar_turno("MP-1", fecha)
+        self.assertEqual(len(self.clinica.obtener_historia_clinica("111").obtener_turnos()), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,234 @@
+import unittest
+import json
+import socket
+import threading
+import time
+from http.client import HTTPConnection
+from urllib.parse import urlencode
+import sys
+import os
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.servidor import ServidorClinica
+from src.carga import preparar_clinica, generar_carga, ESPECIALIDAD
+
+
+class TestServidorClinica(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Configuración inicial: servidor en un puerto libre con una clínica de prueba"""
+        cls.servidor = ServidorClinica(preparar_clinica(cantidad_pacientes=20, cantidad_medicos=3), puerto=0, hilos=8)
+        threading.Thread(target=cls.servidor.serve_forever, daemon=True).start()
+        cls.puerto = cls.servidor.obtener_puerto()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.servidor.shutdown()
+        cls.servidor.server_close()
+
+    def setUp(self):
+        self.conexion = HTTPConnection("127.0.0.1", self.puerto, timeout=5)
+
+    def tearDown(self):
+        self.conexion.close()
+
+    def pedir(self, metodo, ruta, cuerpo=None):
+        datos = json.dumps(cuerpo) if cuerpo is not None else None
+        self.conexion.request(metodo, ruta, body=datos, headers={"Content-Type": "application/json"})
+        respuesta = self.conexion.getresponse()
+        return respuesta.status, json.loads(respuesta.read())
+
+    def test_agendar_y_consultar_turno(self):
+        """Test 1: Un turno agendado por POST aparece en la búsqueda y en la agenda"""
+        turno = {"dni": "1", "matricula": "MP-0", "especialidad": ESPECIALIDAD, "fecha_hora": "2025-03-03T09:00:00"}
+        codigo, creado = self.pedir("POST", "/turnos", turno)
+        self.assertEqual(codigo, 201)
+        self.assertEqual(creado, turno)
+        codigo, turnos = self.pedir("GET", "/turnos?matricula=MP-0&desde=2025-03-03T00:00:00&hasta=2025-03-04T00:00:00")
+        self.assertEqual((codigo, turnos), (200, [turno]))
+        codigo, agenda = self.pedir("GET", "/agendas/2025-03-03?matricula=MP-0")
+        self.assertEqual((codigo, agenda), (200, [turno]))
+
+    def test_errores_del_dominio_como_codigos_http(self):
+        """Test 2: Turno ocupado es 409, paciente inexistente 404 y JSON inválido 400"""
+        turno = {"dni": "2", "matricula": "MP-1", "especialidad": ESPECIALIDAD, "fecha_hora": "2025-03-04T10:00:00"}
+        self.assertEqual(self.pedir("POST", "/turnos", turno)[0], 201)
+        self.assertEqual(self.pedir("POST", "/turnos", turno)[0], 409)
+        self.assertEqual(self.pedir("POST", "/turnos", dict(turno, dni="999"))[0], 404)
+        self.assertEqual(self.pedir("GET", "/historias/999")[0], 404)
+        self.assertEqual(self.pedir("POST", "/turnos", {"dni": "2"})[0], 400)
+        self.assertEqual(self.pedir("GET", "/inexistente")[0], 404)
+
+    def test_receta_e_historia(self):
+        """Test 3: Una receta emitida por la API figura en la historia clínica"""
+        codigo, receta = self.pedir("POST", "/recetas", {"dni": "3", "matricula": "MP-2", "medicamentos": ["Ibuprofeno"]})
+        self.assertEqual(codigo, 201)
+        self.assertEqual(receta["medicamentos"], ["Ibuprofeno"])
+        codigo, historia = self.pedir("GET", "/historias/3")
+        self.assertEqual(codigo, 200)
+        self.assertEqual(historia["paciente"]["dni"], "3")
+        self.assertEqual([r["medicamentos"] for r in historia["recetas"]], [["Ibuprofeno"]])
+
+    def test_disponibilidad_y_cancelacion(self):
+        """Test 4: Consultar disponibilidad y cancelar con DELETE"""
+        fecha_hora = "2025-03-05T11:00:00"
+        consulta = urlencode({"dni": "4", "matricula": "MP-0", "especialidad": ESPECIALIDAD, "fecha_hora": fecha_hora})
+        self.assertEqual(self.pedir("GET", f"/disponibilidad?{consulta}")[1], {"disponible": True, "motivo": "DISPONIBLE"})
+        self.pedir("POST", "/turnos", {"dni": "4", "matricula": "MP-0", "especialidad": ESPECIALIDAD,
+                                       "fecha_hora": fecha_hora})
+        self.assertEqual(self.pedir("GET", f"/disponibilidad?{consulta}")[1]["motivo"], "TURNO_OCUPADO")
+        cancelar = urlencode({"matricula": "MP-0", "fecha_hora": fecha_hora})
+        self.assertEqual(self.pedir("DELETE", f"/turnos?{cancelar}")[0], 200)
+        self.assertEqual(self.pedir("DELETE", f"/turnos?{cancelar}")[0], 404)
+
+    def test_keep_alive_y_pipelining(self):
+        """Test 5: Varias solicitudes encadenadas por la misma conexión se responden en orden"""
+        with socket.create_connection(("127.0.0.1", self.puerto), timeout=5) as conexion:
+            pedido = b"".join(f"GET /pacientes?nombre=Paciente+{n}&limite=1 HTTP/1.1\r\nHost: x\r\n\r\n".encode()
+                              for n in (5, 6, 7))
+            conexion.sendall(pedido)
+            lectura = conexion.makefile("rb")
+            dnis = []
+            for _ in range(3):
+                self.assertIn(b"200", lectura.readline())
+                largo = 0
+                while (linea := lectura.readline()) != b"\r\n":
+                    if linea.lower().startswith(b"content-length"):
+                        largo = int(linea.split(b":")[1])
+                dnis.append(json.loads(lectura.read(largo))[0]["dni"])
+            self.assertEqual(dnis, ["5", "6", "7"])
+
+    def test_generador_de_carga(self):
+        """Test 6: El generador de carga informa volumen, códigos y percentiles"""
+        resultado = generar_carga("127.0.0.1", self.puerto, conexiones=2, solicitudes_por_conexion=20,
+                                  profundidad=4, cantidad_pacientes=20, cantidad_medicos=3)
+        self.assertEqual(resultado["solicitudes"], 40)
+        self.assertEqual(sum(resultado["codigos"].values()), 40)
+        self.assertTrue(set(resultado["codigos"]) <= {200, 201, 409})
+        self.assertLessEqual(resultado["p50_ms"], resultado["p99_ms"])
+        self.assertLessEqual(resultado["p99_ms"], resultado["max_ms"])
+
+    def test_idempotency_key(self):
+        """Test 7: Un POST reintentado con la misma Idempotency-Key devuelve el resultado original"""
+        turno = {"dni": "5", "matricula": "MP-2", "especialidad": ESPECIALIDAD, "fecha_hora": "2025-03-06T09:00:00"}
+        cabeceras = {"Content-Type": "application/json", "Idempotency-Key": "reintento-1"}
+        for _ in range(2):
+            self.conexion.request("POST", "/turnos", body=json.dumps(turno), headers=cabeceras)
+            respuesta = self.conexion.getresponse()
+            self.assertEqual((respuesta.status, json.loads(respuesta.read())), (201, turno))
+
+    def test_asignacion_automatica(self):
+        """Test 8: Un POST sin matrícula asigna un médico de la especialidad"""
+        codigo, turno = self.pedir("POST", "/turnos", {"dni": "6", "especialidad": ESPECIALIDAD,
+                                                       "fecha_hora": "2025-03-10T15:00:00"})
+        self.assertEqual(codigo, 201)
+        self.assertIn(turno["matricula"], {"MP-0", "MP-1", "MP-2"})
+
+    def test_recetas_por_id_y_paginadas(self):
+        """Test 9: Una receta se consulta por su id y las del médico por páginas"""
+        codigo, receta = self.pedir("POST", "/recetas", {"dni": "7", "matricula": "MP-1", "medicamentos": ["Aspirina"]})
+        self.assertEqual(codigo, 201)
+        self.assertEqual(self.pedir("GET", f"/recetas/{receta['id']}"), (200, receta))
+        self.assertEqual(self.pedir("GET", "/recetas/999999")[0], 404)
+        codigo, pagina = self.pedir("GET", f"/recetas?matricula=MP-1&despues_de={receta['id'] - 1}&limite=1")
+        self.assertEqual((codigo, pagina), (200, [receta]))
+
+
+class TestLimiteConexiones(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial: servidor con dos hilos y medio segundo de espera inactiva"""
+        self.servidor = ServidorClinica(preparar_clinica(cantidad_pacientes=5, cantidad_medicos=1), puerto=0, hilos=2,
+                                        espera_inactiva=0.5)
+        threading.Thread(target=self.servidor.serve_forever, daemon=True).start()
+        self.puerto = self.servidor.obtener_puerto()
+
+    def tearDown(self):
+        self.servidor.shutdown()
+        self.servidor.server_close()
+
+    def pedir(self, conexion):
+        conexion.request("GET", "/medicos")
+        respuesta = conexion.getresponse()
+        respuesta.read()
+        return respuesta.status
+
+    def test_pool_lleno_responde_503(self):
+        """Test 1: Con todos los hilos ocupados por conexiones abiertas, una nueva recibe 503"""
+        abiertas = [HTTPConnection("127.0.0.1", self.puerto, timeout=5) for _ in range(2)]
+        self.assertEqual([self.pedir(c) for c in abiertas], [200, 200])
+        extra = HTTPConnection("127.0.0.1", self.puerto, timeout=5)
+        self.assertEqual(self.pedir(extra), 503)
+        for conexion in abiertas + [extra]:
+            conexion.close()
+
+    def test_conexiones_inactivas_se_cierran(self):
+        """Test 2: Una conexión keep-alive sin uso se cierra y libera su hilo"""
+        abiertas = [HTTPConnection("127.0.0.1", self.puerto, timeout=5) for _ in range(2)]
+        for conexion in abiertas:
+            self.pedir(conexion)
+        time.sleep(1)
+        nueva = HTTPConnection("127.0.0.1", self.puerto, timeout=5)
+        self.assertEqual(self.pedir(nueva), 200)
+        for conexion in abiertas + [nueva]:
+            conexion.close()
+
+
+
+class TestLecturasConcurrentes(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial: servidor sobre una clínica con miles de turnos de dos médicos"""
+        clinica = preparar_clinica(cantidad_pacientes=50, cantidad_medicos=2)
+        inicio = datetime(2025, 3, 3, 8, 0)
+        for numero in range(2000):
+            for desfase, matricula in enumerate(("MP-0", "MP-1")):
+                clinica.agendar_turno(str((numero + 25 * desfase) % 50), matricula, ESPECIALIDAD,
+                                      inicio + timedelta(hours=numero))
+        self.servidor = ServidorClinica(clinica, puerto=0, hilos=4)
+        threading.Thread(target=self.servidor.serve_forever, daemon=True).start()
+        self.puerto = self.servidor.obtener_puerto()
+
+    def tearDown(self):
+        self.servidor.shutdown()
+        self.servidor.server_close()
+
+    def test_busquedas_mientras_se_agenda(self):
+        """Test 1: Buscar turnos de un médico mientras otra conexión le agenda turnos nunca da 500"""
+        terminado = threading.Event()
+
+        def agendar():
+            conexion = HTTPConnection("127.0.0.1", self.puerto, timeout=5)
+            inicio = datetime(2026, 3, 3, 8, 0)
+            for numero in range(400):
+                fecha_hora = (inicio + timedelta(hours=numero)).isoformat()
+                conexion.request("POST", "/turnos", body=json.dumps({
+                    "dni": str(numero % 50), "matricula": "MP-1", "especialidad": ESPECIALIDAD,
+                    "fecha_hora": fecha_hora}), headers={"Content-Type": "application/json"})
+                conexion.getresponse().read()
+            conexion.close()
+            terminado.set()
+
+        # Cambios de hilo frecuentes: así una búsqueda suele quedar a mitad de camino de una escritura.
+        intervalo = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, intervalo)
+        escritor = threading.Thread(target=agendar, daemon=True)
+        escritor.start()
+        conexion = HTTPConnection("127.0.0.1", self.puerto, timeout=5)
+        codigos = set()
+        while not terminado.is_set():
+            conexion.request("GET", "/turnos?matricula=MP-1")
+            respuesta = conexion.getresponse()
+            respuesta.read()
+            codigos.add(respuesta.status)
+        conexion.close()
+        escritor.join(5)
+        self.assertEqual(codigos, {200})
+
+
+if __name__ == "__main__":
+    unittest.main()
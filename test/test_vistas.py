@@ -0,0 +1,100 @@
+import unittest
+import gc
+import pickle
+import threading
+from datetime import datetime, timedelta
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+
+
+class TestVistasClinica(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial: un paciente, un médico y un turno"""
+        self.clinica = Clinica()
+        self.clinica.agregar_paciente(Paciente("111", "Ana Gómez", "01/01/1990"))
+        medico = Medico("MP-1", "Dr. García", "Cardiología")
+        medico.agregar_especialidad(Especialidad("Cardiología", ["lunes", "miércoles"]))
+        self.clinica.agregar_medico(medico)
+        self.clinica.agendar_turno("111", "MP-1", "Cardiología", datetime(2025, 6, 2, 10, 0))
+
+    def test_vista_no_ve_turnos_posteriores(self):
+        """Test 1: Los turnos agendados después de abrir la vista no aparecen en ella"""
+        vista = self.clinica.abrir_vista()
+        self.clinica.agendar_turno("111", "MP-1", "Cardiología", datetime(2025, 6, 4, 10, 0))
+        self.assertEqual(len(vista.obtener_turnos()), 1)
+        self.assertEqual(len(self.clinica.abrir_vista().obtener_turnos()), 2)
+
+    def test_vista_conserva_turnos_cancelados_despues(self):
+        """Test 2: Cancelar (y compactar) no altera una vista abierta antes"""
+        vista = self.clinica.abrir_vista()
+        self.clinica.cancelar_turno("MP-1", datetime(2025, 6, 2, 10, 0))
+        self.assertEqual(self.clinica.obtener_turnos(), [])
+        self.assertEqual([t.obtener_fecha_hora() for t in vista.obtener_turnos()], [datetime(2025, 6, 2, 10, 0)])
+
+    def test_vista_aisla_pacientes_y_recetas(self):
+        """Test 3: Pacientes y recetas nuevos quedan fuera de la vista y de su historia"""
+        vista = self.clinica.abrir_vista()
+        self.clinica.agregar_paciente(Paciente("222", "Luis Díaz", "02/02/1985"))
+        self.clinica.emitir_receta("111", "MP-1", ["Aspirina"])
+        self.assertEqual([p.obtener_dni() for p in vista.obtener_pacientes()], ["111"])
+        self.assertIsNone(vista.obtener_historia_clinica("222"))
+        historia = vista.obtener_historia_clinica("111")
+        self.assertEqual(historia.obtener_recetas(), [])
+        self.assertEqual(len(historia.obtener_turnos()), 1)
+        self.assertEqual(len(self.clinica.abrir_vista().obtener_historia_clinica("111").obtener_recetas()), 1)
+
+    def test_vista_de_series_con_excepciones(self):
+        """Test 4: Excluir una ocurrencia de una serie no cambia vistas anteriores"""
+        inicio = datetime(2025, 6, 9, 9, 0)
+        self.clinica.agendar_serie("111", "MP-1", "Cardiología", inicio, 3)
+        vista = self.clinica.abrir_vista()
+        self.clinica.cancelar_turno("MP-1", inicio + timedelta(weeks=1))
+        self.assertEqual(len(vista.obtener_turnos()), 4)
+        self.assertEqual(len(self.clinica.abrir_vista().obtener_turnos()), 3)
+
+    def test_estructuras_compartidas_sin_vistas_vivas(self):
+        """Test 5: Sin vistas vivas la clínica no copia sus diccionarios"""
+        vista = self.clinica.abrir_vista()
+        self.clinica.agregar_paciente(Paciente("222", "Luis Díaz", "02/02/1985"))
+        self.assertEqual(len(vista.obtener_pacientes()), 1)
+        del vista
+        gc.collect()
+        nueva = self.clinica.abrir_vista()
+        self.assertEqual(len(nueva.obtener_pacientes()), 2)
+        self.assertEqual(nueva.obtener_version(), self.clinica.obtener_version())
+
+    def test_lectura_concurrente_con_escrituras(self):
+        """Test 6: Una vista se mantiene estable mientras otro hilo agenda turnos"""
+        vista = self.clinica.abrir_vista()
+        lunes = datetime(2025, 6, 9, 8, 0)
+
+        def agendar():
+            for i in range(200):
+                self.clinica.agendar_turno("111", "MP-1", "Cardiología", lunes + timedelta(weeks=i))
+
+        hilo = threading.Thread(target=agendar)
+        hilo.start()
+        lecturas = [len(vista.obtener_turnos()) for _ in range(50)]
+        hilo.join()
+        self.assertEqual(set(lecturas), {1})
+        self.assertEqual(len(self.clinica.obtener_turnos()), 201)
+
+    def test_clinica_serializable_con_vistas_abiertas(self):
+        """Test 7: La clínica se puede serializar aunque tenga vistas abiertas"""
+        vista = self.clinica.abrir_vista()
+        copia = pickle.loads(pickle.dumps(self.clinica))
+        copia.agendar_turno("111", "MP-1", "Cardiología", datetime(2025, 6, 4, 10, 0))
+        self.assertEqual(len(copia.abrir_vista().obtener_turnos()), 2)
+        self.assertEqual(len(vista.obtener_turnos()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()